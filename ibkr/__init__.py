@@ -16,6 +16,7 @@ _LAZY_EXPORTS = {
     "fetch_ibkr_fx_monthly_close": ("ibkr.compat", "fetch_ibkr_fx_monthly_close"),
     "fetch_ibkr_bond_monthly_close": ("ibkr.compat", "fetch_ibkr_bond_monthly_close"),
     "fetch_ibkr_option_monthly_mark": ("ibkr.compat", "fetch_ibkr_option_monthly_mark"),
+    "fetch_ibkr_batch": ("ibkr.compat", "fetch_ibkr_batch"),
     "fetch_ibkr_flex_trades": ("ibkr.compat", "fetch_ibkr_flex_trades"),
     "get_ibkr_futures_fmp_map": ("ibkr.compat", "get_ibkr_futures_fmp_map"),
     "get_ibkr_futures_exchanges": ("ibkr.compat", "get_ibkr_futures_exchanges"),
@@ -46,6 +47,7 @@ __all__ = [
     "fetch_ibkr_fx_monthly_close",
     "fetch_ibkr_bond_monthly_close",
     "fetch_ibkr_option_monthly_mark",
+    "fetch_ibkr_batch",
     "fetch_ibkr_flex_trades",
     "get_ibkr_futures_fmp_map",
     "get_ibkr_futures_exchanges",
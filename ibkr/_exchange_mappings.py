@@ -0,0 +1,118 @@
+"""Shared loader for ``exchange_mappings.yaml``.
+
+Parsed once per YAML mtime and shared by ``compat``, ``contracts`` and ``flex``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from ._logging import logger
+
+_YAML_PATH = Path(__file__).resolve().with_name("exchange_mappings.yaml")
+
+# YAML mtime -> parsed mappings (at most one entry; ``None`` = file missing).
+_mapping_cache: dict[float | None, dict[str, Any]] = {}
+# (mappings dict it was derived from, normalized futures routing)
+_futures_exchanges_cache: tuple[dict[str, Any] | None, Mapping[str, tuple[str, str]]] = (
+    None,
+    MappingProxyType({}),
+)
+# (mappings dict it was derived from, normalized IBKR exchange -> MIC map)
+_exchange_to_mic_cache: tuple[dict[str, Any] | None, Mapping[str, str]] = (None, MappingProxyType({}))
+
+
+def _remember(mtime: float | None, data: dict[str, Any]) -> dict[str, Any]:
+    _mapping_cache.clear()
+    _mapping_cache[mtime] = data
+    return data
+
+
+def load_exchange_mappings() -> dict[str, Any]:
+    """Return the parsed exchange mappings (empty dict when unavailable).
+
+    Cached by the YAML file's mtime, so edits are picked up without a
+    restart at the cost of one ``stat`` per call.
+    """
+    try:
+        yaml_mtime = _YAML_PATH.stat().st_mtime
+    except FileNotFoundError:
+        cached = _mapping_cache.get(None)
+        if cached is not None:
+            return cached
+        logger.warning("IBKR exchange_mappings.yaml not found at %s", _YAML_PATH)
+        return _remember(None, {})
+    except OSError as exc:
+        logger.warning("Failed to load IBKR exchange mappings from %s: %s", _YAML_PATH, exc)
+        return {}
+
+    cached = _mapping_cache.get(yaml_mtime)
+    if cached is not None:
+        return cached
+
+    try:
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when available
+        with _YAML_PATH.open("r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=loader) or {}
+    except Exception as exc:
+        logger.warning("Failed to load IBKR exchange mappings from %s: %s", _YAML_PATH, exc)
+        return _remember(yaml_mtime, {})
+    return _remember(yaml_mtime, data)
+
+
+def futures_exchanges() -> Mapping[str, tuple[str, str]]:
+    """Return read-only ``ROOT -> (exchange, currency)`` routing, normalized once per load."""
+    global _futures_exchanges_cache
+
+    mappings = load_exchange_mappings()
+    source, routing = _futures_exchanges_cache
+    if source is mappings:
+        return routing
+
+    raw_map = mappings.get("ibkr_futures_exchanges", {})
+    out: dict[str, tuple[str, str]] = {}
+    if isinstance(raw_map, dict):
+        for symbol, meta in raw_map.items():
+            if not isinstance(meta, dict):
+                continue
+            key = str(symbol or "").strip().upper()
+            exchange = str(meta.get("exchange") or "").strip().upper()
+            currency = str(meta.get("currency") or "USD").strip().upper()
+            if key and exchange:
+                out[key] = (exchange, currency)
+    routing = MappingProxyType(out)
+    _futures_exchanges_cache = (mappings, routing)
+    return routing
+
+
+def exchange_to_mic() -> Mapping[str, str]:
+    """Return read-only ``IBKR exchange -> MIC`` codes, normalized once per load."""
+    global _exchange_to_mic_cache
+
+    mappings = load_exchange_mappings()
+    source, mics = _exchange_to_mic_cache
+    if source is mappings:
+        return mics
+
+    raw_map = mappings.get("ibkr_exchange_to_mic", {}) or {}
+    out: dict[str, str] = {}
+    if isinstance(raw_map, dict):
+        for exchange, mic in raw_map.items():
+            if str(exchange).strip() and str(mic).strip():
+                out[str(exchange).strip().upper()] = str(mic).strip().upper()
+    mics = MappingProxyType(out)
+    _exchange_to_mic_cache = (mappings, mics)
+    return mics
+
+
+def _reset_exchange_mappings_for_tests() -> None:
+    """Drop cached mappings for test isolation."""
+    global _futures_exchanges_cache, _exchange_to_mic_cache
+
+    _mapping_cache.clear()
+    _futures_exchanges_cache = (None, MappingProxyType({}))
+    _exchange_to_mic_cache = (None, MappingProxyType({}))
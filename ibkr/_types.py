@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any, Literal
 
 InstrumentType = Literal[
@@ -16,22 +17,28 @@ InstrumentType = Literal[
     "unknown",
 ]
 
-_VALID_INSTRUMENT_TYPES = {
-    "equity",
-    "option",
-    "futures",
-    "fx",
-    "fx_artifact",
-    "bond",
-    "income",
-    "mutual_fund",
-    "unknown",
+# Canonical name -> interned canonical name; already-normalized input hits in one lookup.
+_CANONICAL_INSTRUMENT_TYPES: dict[str, str] = {
+    name: sys.intern(name)
+    for name in (
+        "equity",
+        "option",
+        "futures",
+        "fx",
+        "fx_artifact",
+        "bond",
+        "income",
+        "mutual_fund",
+        "unknown",
+    )
 }
 
 
 def coerce_instrument_type(value: Any, default: InstrumentType = "equity") -> InstrumentType:
     """Normalize external instrument strings to the supported instrument type enum."""
+    if type(value) is str:
+        canonical = _CANONICAL_INSTRUMENT_TYPES.get(value)
+        if canonical is not None:
+            return canonical  # type: ignore[return-value]
     normalized = str(value or "").strip().lower()
-    if normalized in _VALID_INSTRUMENT_TYPES:
-        return normalized  # type: ignore[return-value]
-    return default
+    return _CANONICAL_INSTRUMENT_TYPES.get(normalized, default)  # type: ignore[return-value]
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import math
+import threading
 import time
-from typing import Any
-
-import pandas as pd
+import weakref
+from collections import OrderedDict
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable
 
 from ibkr._shared.budget_exceptions import BudgetExceededError
 
@@ -14,6 +15,9 @@ from ._budget import guard_ib_call
 from .config import IBKR_PNL_POLL_INTERVAL, IBKR_PNL_TIMEOUT
 from .exceptions import IBKRTimeoutError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 _POSITION_COLUMNS = [
     "account",
@@ -46,6 +50,28 @@ _PORTFOLIO_COLUMNS = [
     "realized_pnl",
 ]
 
+_PNL_SINGLE_MAX_SUBSCRIPTIONS = 64
+
+# IB handle -> {(account_id, con_id): live PnLSingle}, most-recently-used last.
+# Weak keys drop a handle's entries once its (ephemeral) connection goes away.
+_pnl_single_subscriptions: weakref.WeakKeyDictionary[Any, OrderedDict[tuple[str, int], Any]] = (
+    weakref.WeakKeyDictionary()
+)
+_pnl_single_lock = threading.Lock()
+
+# IB handle -> account ids with an open reqAccountUpdates stream on that handle.
+_account_update_subscriptions: weakref.WeakKeyDictionary[Any, set[str]] = weakref.WeakKeyDictionary()
+_account_update_lock = threading.Lock()
+
+_POSITION_FIELDS = ("account", "contract", "position", "avgCost")
+_POSITION_CONTRACT_FIELDS = ("symbol", "secType", "currency", "exchange", "conId")
+_get_position_fields = attrgetter(*_POSITION_FIELDS)
+_get_position_contract_fields = attrgetter(*_POSITION_CONTRACT_FIELDS)
+_EMPTY_POSITION_CONTRACT = (None,) * len(_POSITION_CONTRACT_FIELDS)
+
+_ACCOUNT_VALUE_FIELDS = ("account", "currency", "tag", "value")
+_get_account_value_fields = attrgetter(*_ACCOUNT_VALUE_FIELDS)
+
 _SUMMARY_TAGS = {
     "NetLiquidation": "net_liquidation",
     "TotalCashValue": "total_cash_value",
@@ -64,6 +90,8 @@ def _portfolio_frame_from_items(
     account_id: str | None = None,
 ) -> pd.DataFrame:
     """Normalize IBKR portfolio items into the canonical DataFrame schema."""
+    import pandas as pd
+
     rows: list[dict[str, Any]] = []
     for item in items:
         acct = getattr(item, "account", None)
@@ -124,6 +152,18 @@ def _cash_balances_from_account_values(
     return balances
 
 
+def _read_fields(
+    obj: Any,
+    getter: Callable[[Any], tuple[Any, ...]],
+    names: tuple[str, ...],
+) -> tuple[Any, ...]:
+    """Read attributes in one pre-bound call, tolerating partial objects."""
+    try:
+        return getter(obj)
+    except AttributeError:
+        return tuple(getattr(obj, name, None) for name in names)
+
+
 def _safe_float(value: Any) -> float | None:
     try:
         if value is None:
@@ -133,14 +173,20 @@ def _safe_float(value: Any) -> float | None:
         return None
 
 
-def _is_not_nan(value: Any) -> bool:
-    as_float = _safe_float(value)
-    if as_float is None:
-        return False
-    return not math.isnan(as_float)
-
-
 def _ib_sleep(ib, seconds: float) -> None:
+    """Wait up to *seconds* while pumping the ib_async dispatcher.
+
+    Prefers ``ib.waitOnUpdate`` so incoming updates are processed during the
+    wait (and it returns as soon as one arrives); callers re-check their
+    condition in a loop. Falls back to ``ib.sleep`` and then ``time.sleep``.
+    """
+    wait_fn = getattr(ib, "waitOnUpdate", None)
+    if callable(wait_fn):
+        try:
+            wait_fn(timeout=seconds)
+            return
+        except Exception:
+            pass
     try:
         sleep_fn = getattr(ib, "sleep", None)
         if callable(sleep_fn):
@@ -152,12 +198,20 @@ def _ib_sleep(ib, seconds: float) -> None:
 
 
 def _wait_for_pnl_ready(ib, pnl_obj, *, timeout_seconds: float, poll_interval: float) -> None:
+    """Wait until ``dailyPnL`` is populated, waking on each incoming update.
+
+    ``poll_interval`` only caps a single wait so the readiness check re-runs
+    even if no update arrives; the loop returns as soon as data is present.
+    """
     deadline = time.monotonic() + timeout_seconds
-    while time.monotonic() < deadline:
-        if _is_not_nan(getattr(pnl_obj, "dailyPnL", None)):
+    while True:
+        value = getattr(pnl_obj, "dailyPnL", None)
+        if value is not None and value == value:  # not None and not NaN
             return
-        _ib_sleep(ib, poll_interval)
-    raise IBKRTimeoutError("Timed out waiting for IBKR PnL update")
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise IBKRTimeoutError("Timed out waiting for IBKR PnL update")
+        _ib_sleep(ib, min(remaining, poll_interval) if poll_interval > 0 else remaining)
 
 
 def fetch_positions(
@@ -167,36 +221,74 @@ def fetch_positions(
     budget_user_id: int | None = None,
 ) -> pd.DataFrame:
     """Fetch IBKR positions and normalize to DataFrame."""
+    positions = _request_positions(ib, budget_user_id=budget_user_id)
+    return _positions_frame(positions, account_id=account_id)
+
+
+def _request_positions(ib, *, budget_user_id: int | None = None) -> list[Any]:
+    """Request and snapshot raw ``Position`` tuples (the only part touching *ib*)."""
     guard_ib_call(
         operation="reqPositions",
         fn=ib.reqPositions,
         budget_user_id=budget_user_id,
     )
-    positions = list(ib.positions() or [])
-
-    rows: list[dict[str, Any]] = []
+    return list(ib.positions() or [])
+
+
+def _positions_frame(positions: list[Any], *, account_id: str | None = None) -> pd.DataFrame:
+    """Normalize raw ``Position`` tuples to the positions DataFrame."""
+    import pandas as pd
+
+    # One list per column: the frame is built column-wise with no per-row records.
+    accounts: list[Any] = []
+    symbols: list[Any] = []
+    sec_types: list[Any] = []
+    currencies: list[Any] = []
+    exchanges: list[Any] = []
+    con_ids: list[Any] = []
+    quantities: list[Any] = []
+    avg_costs: list[Any] = []
     for pos in positions:
-        acct = getattr(pos, "account", None)
+        acct, contract, quantity, avg_cost = _read_fields(pos, _get_position_fields, _POSITION_FIELDS)
         if account_id and acct != account_id:
             continue
-        contract = getattr(pos, "contract", None)
-        rows.append(
-            {
-                "account": acct,
-                "symbol": getattr(contract, "symbol", None) if contract else None,
-                "sec_type": getattr(contract, "secType", None) if contract else None,
-                "currency": getattr(contract, "currency", None) if contract else None,
-                "exchange": getattr(contract, "exchange", None) if contract else None,
-                "con_id": getattr(contract, "conId", None) if contract else None,
-                "position": _safe_float(getattr(pos, "position", None)),
-                "avg_cost": _safe_float(getattr(pos, "avgCost", None)),
-            }
+        symbol, sec_type, currency, exchange, con_id = (
+            _read_fields(contract, _get_position_contract_fields, _POSITION_CONTRACT_FIELDS)
+            if contract
+            else _EMPTY_POSITION_CONTRACT
         )
-
-    if not rows:
+        accounts.append(acct)
+        symbols.append(symbol)
+        sec_types.append(sec_type)
+        currencies.append(currency)
+        exchanges.append(exchange)
+        con_ids.append(con_id)
+        quantities.append(quantity)
+        avg_costs.append(avg_cost)
+
+    if not accounts:
         return pd.DataFrame(columns=_POSITION_COLUMNS)
-    frame = pd.DataFrame(rows, columns=_POSITION_COLUMNS)
-    return frame.sort_values(["account", "symbol"], na_position="last").reset_index(drop=True)
+    frame = pd.DataFrame(
+        {
+            "account": accounts,
+            "symbol": symbols,
+            "sec_type": sec_types,
+            "currency": currencies,
+            "exchange": exchanges,
+            "con_id": con_ids,
+            "position": pd.to_numeric(quantities, errors="coerce"),
+            "avg_cost": pd.to_numeric(avg_costs, errors="coerce"),
+        },
+        columns=_POSITION_COLUMNS,
+    )
+    # Few distinct accounts: sort on categorical codes, not strings. The key is
+    # temporary, so the returned ``account`` column keeps its object dtype.
+    return frame.sort_values(
+        ["account", "symbol"],
+        na_position="last",
+        kind="stable",
+        key=lambda col: col.astype("category") if col.name == "account" else col,
+    ).reset_index(drop=True)
 
 
 def fetch_portfolio_items(
@@ -244,6 +336,24 @@ def fetch_portfolio_with_cash(
     budget_user_id: int | None = None,
 ) -> tuple[pd.DataFrame, dict[str, float]]:
     """Fetch portfolio items and cash balances with at most one cold refresh."""
+    items, account_values = _request_portfolio_with_cash(
+        ib,
+        account_id=account_id,
+        budget_user_id=budget_user_id,
+    )
+    return (
+        _portfolio_frame_from_items(items, account_id=account_id),
+        _cash_balances_from_account_values(account_values, account_id=account_id),
+    )
+
+
+def _request_portfolio_with_cash(
+    ib,
+    *,
+    account_id: str | None = None,
+    budget_user_id: int | None = None,
+) -> tuple[list[Any], list[Any]]:
+    """Snapshot raw portfolio items and account values (the only part touching *ib*)."""
     items = list(ib.portfolio() or [])
     account_values = list(ib.accountValues(account=account_id) or [])
 
@@ -258,11 +368,7 @@ def fetch_portfolio_with_cash(
             items = list(ib.portfolio() or [])
         if not account_values:
             account_values = list(ib.accountValues(account=account_id) or [])
-
-    return (
-        _portfolio_frame_from_items(items, account_id=account_id),
-        _cash_balances_from_account_values(account_values, account_id=account_id),
-    )
+    return items, account_values
 
 
 def fetch_account_summary(
@@ -271,7 +377,13 @@ def fetch_account_summary(
     *,
     budget_user_id: int | None = None,
 ) -> dict[str, float]:
-    """Fetch account summary values with USD-only tag normalization."""
+    """Fetch account summary values with USD-only tag normalization.
+
+    An empty ``accountValues()`` (re)subscribes via ``reqAccountUpdates``,
+    which blocks until ``accountDownloadEnd``; while the stream stays open
+    later calls read the values ib_async keeps current. Open streams are
+    recorded per IB handle for :func:`close_account_subscriptions`.
+    """
     account_values = list(ib.accountValues(account=account_id) or [])
     if not account_values:
         guard_ib_call(
@@ -280,18 +392,24 @@ def fetch_account_summary(
             kwargs={"account": account_id},
             budget_user_id=budget_user_id,
         )
+        subscribed = _account_update_subscriptions_for(ib)
+        if subscribed is not None:
+            with _account_update_lock:
+                subscribed.add(account_id or "")
         account_values = list(ib.accountValues(account=account_id) or [])
 
     summary: dict[str, float] = {}
+    summary_tags = _SUMMARY_TAGS
     for av in account_values:
-        if account_id and getattr(av, "account", None) not in (None, "", account_id):
+        acct, currency, tag, raw_value = _read_fields(av, _get_account_value_fields, _ACCOUNT_VALUE_FIELDS)
+        if currency != "USD":
             continue
-        if getattr(av, "currency", None) != "USD":
-            continue
-        key = _SUMMARY_TAGS.get(getattr(av, "tag", None))
+        key = summary_tags.get(tag)
         if key is None:
             continue
-        val = _safe_float(getattr(av, "value", None))
+        if account_id and acct not in (None, "", account_id):
+            continue
+        val = _safe_float(raw_value)
         if val is None:
             continue
         summary[key] = val
@@ -299,6 +417,37 @@ def fetch_account_summary(
     return summary
 
 
+def _account_update_subscriptions_for(ib) -> set[str] | None:
+    """Return the subscribed-account set for *ib* (``None`` if untrackable)."""
+    with _account_update_lock:
+        try:
+            subscribed = _account_update_subscriptions.get(ib)
+            if subscribed is None:
+                subscribed = set()
+                _account_update_subscriptions[ib] = subscribed
+        except TypeError:
+            return None
+        return subscribed
+
+
+def close_account_subscriptions(ib) -> None:
+    """Stop every ``reqAccountUpdates`` stream opened on *ib* by this module."""
+    with _account_update_lock:
+        try:
+            subscribed = _account_update_subscriptions.pop(ib, None)
+        except TypeError:
+            subscribed = None
+    client = getattr(ib, "client", None)
+    cancel_fn = getattr(client, "reqAccountUpdates", None)
+    if not subscribed or not callable(cancel_fn):
+        return
+    for account_id in subscribed:
+        try:
+            cancel_fn(False, account_id)
+        except Exception:
+            pass
+
+
 def fetch_pnl(
     ib,
     account_id: str,
@@ -307,7 +456,7 @@ def fetch_pnl(
     timeout_seconds: float = IBKR_PNL_TIMEOUT,
     poll_interval: float = IBKR_PNL_POLL_INTERVAL,
 ) -> dict[str, float | str | None]:
-    """Fetch account-level PnL via streaming subscription with timeout polling."""
+    """Fetch account-level PnL via streaming subscription, waiting on updates."""
     pnl_obj = guard_ib_call(
         operation="reqPnL",
         fn=ib.reqPnL,
@@ -343,6 +492,52 @@ def fetch_pnl(
             pass
 
 
+def _pnl_single_subscriptions_for(ib) -> OrderedDict[tuple[str, int], Any] | None:
+    """Return the live ``reqPnLSingle`` registry for *ib* (``None`` if untrackable)."""
+    with _pnl_single_lock:
+        try:
+            subs = _pnl_single_subscriptions.get(ib)
+            if subs is None:
+                subs = OrderedDict()
+                _pnl_single_subscriptions[ib] = subs
+        except TypeError:
+            # Handle does not support weak references; fall back to one-shot requests.
+            return None
+        return subs
+
+
+def _cancel_pnl_single(
+    ib,
+    account_id: str,
+    con_id: int,
+    *,
+    budget_user_id: int | None = None,
+) -> None:
+    try:
+        guard_ib_call(
+            operation="cancelPnLSingle",
+            fn=ib.cancelPnLSingle,
+            args=(account_id,),
+            kwargs={"modelCode": "", "conId": int(con_id)},
+            budget_user_id=budget_user_id,
+        )
+    except BudgetExceededError:
+        raise
+    except Exception:
+        pass
+
+
+def close_pnl_subscriptions(ib, *, budget_user_id: int | None = None) -> None:
+    """Cancel every cached ``reqPnLSingle`` subscription held on *ib*."""
+    with _pnl_single_lock:
+        try:
+            subs = _pnl_single_subscriptions.pop(ib, None)
+        except TypeError:
+            subs = None
+    for account_id, con_id in list(subs or ()):
+        _cancel_pnl_single(ib, account_id, con_id, budget_user_id=budget_user_id)
+
+
 def fetch_pnl_single(
     ib,
     account_id: str,
@@ -352,14 +547,39 @@ def fetch_pnl_single(
     timeout_seconds: float = IBKR_PNL_TIMEOUT,
     poll_interval: float = IBKR_PNL_POLL_INTERVAL,
 ) -> dict[str, float | int | str | None]:
-    """Fetch contract-level PnL via streaming subscription with timeout polling."""
-    pnl_obj = guard_ib_call(
-        operation="reqPnLSingle",
-        fn=ib.reqPnLSingle,
-        args=(account_id,),
-        kwargs={"modelCode": "", "conId": int(con_id)},
-        budget_user_id=budget_user_id,
-    )
+    """Fetch contract-level PnL from a reused streaming subscription.
+
+    Subscriptions stay open per IB handle (LRU-capped) so repeat reads on a
+    persistent connection return the latest streamed values without a new
+    request round-trip. Only a cold subscription waits for the first update.
+    """
+    key = (account_id, int(con_id))
+    subs = _pnl_single_subscriptions_for(ib)
+    pnl_obj = None
+    if subs is not None:
+        with _pnl_single_lock:
+            pnl_obj = subs.get(key)
+            if pnl_obj is not None:
+                subs.move_to_end(key)
+
+    if pnl_obj is None:
+        pnl_obj = guard_ib_call(
+            operation="reqPnLSingle",
+            fn=ib.reqPnLSingle,
+            args=(account_id,),
+            kwargs={"modelCode": "", "conId": key[1]},
+            budget_user_id=budget_user_id,
+        )
+        evicted: list[tuple[str, int]] = []
+        if subs is not None:
+            with _pnl_single_lock:
+                subs[key] = pnl_obj
+                while len(subs) > _PNL_SINGLE_MAX_SUBSCRIPTIONS:
+                    evicted.append(subs.popitem(last=False)[0])
+        for old_account_id, old_con_id in evicted:
+            _cancel_pnl_single(ib, old_account_id, old_con_id, budget_user_id=budget_user_id)
+
+    keep_subscription = subs is not None
     try:
         _wait_for_pnl_ready(
             ib,
@@ -369,23 +589,19 @@ def fetch_pnl_single(
         )
         return {
             "account_id": account_id,
-            "con_id": int(con_id),
+            "con_id": key[1],
             "daily_pnl": _safe_float(getattr(pnl_obj, "dailyPnL", None)),
             "unrealized_pnl": _safe_float(getattr(pnl_obj, "unrealizedPnL", None)),
             "realized_pnl": _safe_float(getattr(pnl_obj, "realizedPnL", None)),
             "position": _safe_float(getattr(pnl_obj, "position", None)),
             "value": _safe_float(getattr(pnl_obj, "value", None)),
         }
+    except BaseException:
+        keep_subscription = False
+        if subs is not None:
+            with _pnl_single_lock:
+                subs.pop(key, None)
+        raise
     finally:
-        try:
-            guard_ib_call(
-                operation="cancelPnLSingle",
-                fn=ib.cancelPnLSingle,
-                args=(account_id,),
-                kwargs={"modelCode": "", "conId": int(con_id)},
-                budget_user_id=budget_user_id,
-            )
-        except BudgetExceededError:
-            raise
-        except Exception:
-            pass
+        if not keep_subscription:
+            _cancel_pnl_single(ib, account_id, key[1], budget_user_id=budget_user_id)
@@ -4,13 +4,40 @@ import asyncio
 import inspect
 
 
-def ensure_event_loop() -> None:
+def ensure_event_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's event loop, creating one only if missing or closed.
+
+    The loop is kept for the thread's lifetime, so repeated IB connects on a
+    thread share it instead of each paying loop setup and teardown.
+    """
     try:
         loop = asyncio.get_event_loop_policy().get_event_loop()
         if loop.is_closed():
             raise RuntimeError("closed")
     except RuntimeError:
-        asyncio.set_event_loop(asyncio.new_event_loop())
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop
+
+
+def disconnect_on_loop(ib, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Disconnect ``ib`` and let its idle ``loop`` actually close the socket.
+
+    ``transport.close()`` only queues the fd close on the loop servicing the
+    socket, so a disconnect made while that loop is idle leaves the socket open
+    (and the Gateway client ID held) until the loop next runs. Call from the
+    thread owning ``loop``, or any thread once its owner has exited.
+    """
+    try:
+        ib.disconnect()
+    except Exception:
+        pass
+    if loop is None or loop.is_closed() or loop.is_running():
+        return
+    try:
+        loop.run_until_complete(asyncio.sleep(0))
+    except Exception:
+        pass
 
 
 def _has_running_loop() -> bool:
@@ -9,22 +9,53 @@ Contract notes:
 - Current-month windows use TTL eviction; historical windows persist until
   explicit cleanup.
 - Corrupt cache files are removed on read to keep callers fail-open.
+- Files are zstd parquet by default; ``IBKR_CACHE_FORMAT=feather`` switches
+  to LZ4 Arrow IPC files, migrating parquet entries lazily on first read.
+- Decoded series are memoized in-process (bounded LRU) so hot keys skip the
+  parquet round-trip; memo entries follow the same TTL as the backing file.
 """
 
 from __future__ import annotations
 
 import hashlib
+import io
 import os
+import threading
 import time
+from collections import OrderedDict
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Sequence
 
+import numpy as np
 import pandas as pd
 from pandas.errors import EmptyDataError, ParserError
 
+try:
+    from xxhash import xxh3_64_intdigest as _buffer_digest
+    from xxhash import xxh3_128_hexdigest as _key_digest
+except ImportError:
+    def _key_digest(key: str) -> str:
+        """MD5 fallback when the optional ``xxhash`` package isn't installed."""
+        return hashlib.md5(key.encode()).hexdigest()
+
+    def _buffer_digest(data: bytes) -> int:
+        """BLAKE2 fallback when the optional ``xxhash`` package isn't installed."""
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
 
 CURRENT_MONTH_TTL_HOURS = 4
+_CACHE_FORMAT_SUFFIXES = {"parquet": ".parquet", "feather": ".feather"}
+_MEM_CACHE_MAX_ENTRIES = 256
+
+# Cache file path -> (file mtime, decoded series). Most-recently-used last.
+_mem_cache: OrderedDict[str, tuple[float, pd.Series]] = OrderedDict()
+_mem_cache_lock = threading.Lock()
+
+# Cache file path -> (series fingerprint, file mtime) of the last write in this process.
+# Keys are evicted together with ``_mem_cache`` so this stays bounded too.
+_FP_CACHE: dict[str, tuple[tuple[int, int, int], float]] = {}
 
 
 def _contract_identity_fingerprint(contract_identity: dict[str, Any] | None) -> str:
@@ -46,9 +77,13 @@ def _contract_identity_fingerprint(contract_identity: dict[str, Any] | None) ->
     return hashlib.md5("|".join(sorted(id_parts)).encode()).hexdigest()[:8]
 
 
-def _project_root() -> Path:
-    """Return default cache directory with portable fallback behavior."""
-    configured = os.getenv("IBKR_CACHE_DIR")
+# Directories already created by ``_cache_dir`` in this process.
+_ensured_dirs: set[Path] = set()
+
+
+@lru_cache(maxsize=8)
+def _default_cache_root(configured: str | None) -> Path:
+    """Resolve the default cache directory for a given ``IBKR_CACHE_DIR`` value."""
     if configured:
         return Path(configured).expanduser().resolve()
 
@@ -60,17 +95,39 @@ def _project_root() -> Path:
     return Path.home() / ".cache" / "ibkr-mcp"
 
 
+@lru_cache(maxsize=32)
+def _base_dir_cache_root(base_dir: str) -> Path:
+    """Resolve the cache directory under an explicit project root."""
+    return Path(base_dir).expanduser().resolve() / "cache" / "ibkr"
+
+
+def _project_root() -> Path:
+    """Return default cache directory with portable fallback behavior."""
+    return _default_cache_root(os.getenv("IBKR_CACHE_DIR"))
+
+
 def _cache_dir(base_dir: str | Path | None = None) -> Path:
-    """Resolve and ensure the IBKR disk-cache directory."""
+    """Resolve and ensure the IBKR disk-cache directory.
+
+    Resolution is memoized and ``mkdir`` runs once per directory per process.
+    """
     if base_dir is not None:
-        root = Path(base_dir).expanduser().resolve()
-        path = root / "cache" / "ibkr"
+        path = _base_dir_cache_root(str(base_dir))
     else:
         path = _project_root()
-    path.mkdir(parents=True, exist_ok=True)
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
     return path
 
 
+def _reset_cache_dir_for_tests() -> None:
+    """Drop memoized cache-dir resolution for test isolation."""
+    _default_cache_root.cache_clear()
+    _base_dir_cache_root.cache_clear()
+    _ensured_dirs.clear()
+
+
 def _to_timestamp(value: Any) -> pd.Timestamp:
     """Normalize datetime-like values to naive UTC ``pd.Timestamp``."""
 
@@ -93,9 +150,17 @@ def _includes_current_month(
     if end_ts < start_ts:
         start_ts, end_ts = end_ts, start_ts
     now_ts = _to_timestamp(now or datetime.now(UTC))
-    month_start = now_ts.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    month_end = month_start + pd.offsets.MonthEnd(1)
-    return bool(start_ts <= month_end and end_ts >= month_start)
+    current = (now_ts.year, now_ts.month)
+    return (start_ts.year, start_ts.month) <= current <= (end_ts.year, end_ts.month)
+
+
+def _is_stale(mtime: float, ttl_hours: int | None) -> bool:
+    """Return ``True`` when an entry written at ``mtime`` exceeds configured TTL."""
+
+    if ttl_hours is None:
+        return False
+    age_hours = (time.time() - mtime) / 3600.0
+    return age_hours > ttl_hours
 
 
 def _is_expired(path: Path, ttl_hours: int | None) -> bool:
@@ -103,15 +168,128 @@ def _is_expired(path: Path, ttl_hours: int | None) -> bool:
 
     if ttl_hours is None:
         return False
-    age_hours = (time.time() - path.stat().st_mtime) / 3600.0
-    return age_hours > ttl_hours
+    return _is_stale(path.stat().st_mtime, ttl_hours)
+
+
+def _mem_get(key: str, ttl_hours: int | None) -> pd.Series | None:
+    """Return a copy of the memoized series for ``key`` when still fresh."""
+
+    with _mem_cache_lock:
+        entry = _mem_cache.get(key)
+        if entry is None:
+            return None
+        mtime, series = entry
+        if _is_stale(mtime, ttl_hours):
+            del _mem_cache[key]
+            return None
+        _mem_cache.move_to_end(key)
+    return series.copy()
+
+
+def _mem_put(key: str, mtime: float, series: pd.Series) -> None:
+    """Memoize a decoded series, evicting least-recently-used entries."""
+
+    with _mem_cache_lock:
+        _mem_cache[key] = (mtime, series.copy())
+        _mem_cache.move_to_end(key)
+        while len(_mem_cache) > _MEM_CACHE_MAX_ENTRIES:
+            evicted, _entry = _mem_cache.popitem(last=False)
+            _FP_CACHE.pop(evicted, None)
+
+
+def _mem_discard(key: str) -> None:
+    with _mem_cache_lock:
+        _mem_cache.pop(key, None)
+        _FP_CACHE.pop(key, None)
+
+
+def _series_fingerprint(series: pd.Series) -> tuple[int, int, int]:
+    """Return ``(length, last timestamp ns, digest of index+values)`` for a canonical series."""
+
+    index_ns = series.index.asi8
+    digest = _buffer_digest(index_ns.tobytes() + series.to_numpy().tobytes())
+    return (len(series), int(index_ns[-1]), digest)
+
+
+def _cache_format() -> str:
+    """Return the on-disk cache format selected by ``IBKR_CACHE_FORMAT``."""
+    raw = os.getenv("IBKR_CACHE_FORMAT", "parquet").strip().lower()
+    return raw if raw in _CACHE_FORMAT_SUFFIXES else "parquet"
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
+    """Load a cache file, dispatching on its suffix."""
+    if path.suffix == ".feather":
+        from pyarrow import feather
+
+        # Feather has no pandas-metadata column expansion; read all (value + index).
+        return feather.read_table(path, use_threads=False).to_pandas(self_destruct=True)
+    from pyarrow import parquet
+
+    # Single-column files: skip the reader thread pool; pandas metadata keeps the index.
+    table = parquet.read_table(
+        path,
+        columns=["value"],
+        use_threads=False,
+        use_pandas_metadata=True,
+    )
+    return table.to_pandas(self_destruct=True)
+
+
+def _write_frame(frame: pd.DataFrame, path: Path) -> None:
+    """Atomically write a cache file in the format implied by its suffix.
+
+    The file is encoded in memory, written to a sibling temp file in one
+    call, then ``os.replace``-d over *path* so readers never see a torn file.
+    """
+    buf = io.BytesIO()
+    if path.suffix == ".feather":
+        import pyarrow as pa
+        from pyarrow import feather
+
+        table = pa.Table.from_pandas(frame, preserve_index=True)
+        feather.write_feather(table, buf, compression="lz4")
+    else:
+        frame.to_parquet(buf, engine="pyarrow", compression="zstd", index=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as fh:
+            fh.write(buf.getbuffer())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _migrate_legacy_parquet(path: Path) -> float | None:
+    """Rewrite a pre-existing parquet entry as feather; return its original mtime."""
+    if path.suffix != ".feather":
+        return None
+    legacy = path.with_suffix(".parquet")
+    try:
+        st = legacy.stat()
+        frame = pd.read_parquet(legacy)
+    except FileNotFoundError:
+        return None
+    except (EmptyDataError, ParserError, OSError, ValueError):
+        legacy.unlink(missing_ok=True)
+        return None
+    try:
+        _write_frame(frame, path)
+        # Keep the original write time so TTL eviction is unaffected.
+        os.utime(path, (st.st_atime, st.st_mtime))
+    except (OSError, ValueError):
+        path.unlink(missing_ok=True)
+        return None
+    legacy.unlink(missing_ok=True)
+    return st.st_mtime
 
 
 def _safe_read(path: Path) -> pd.Series | None:
-    """Read a cached parquet series; delete file and return ``None`` on corruption."""
+    """Read a cached series file; delete it and return ``None`` on corruption."""
 
     try:
-        frame = pd.read_parquet(path)
+        frame = _read_frame(path)
     except (EmptyDataError, ParserError, OSError, ValueError):
         path.unlink(missing_ok=True)
         return None
@@ -123,12 +301,38 @@ def _safe_read(path: Path) -> pd.Series | None:
         return None
 
     series = frame["value"]
+    # put_cache always writes a float64 series over a NaT-free DatetimeIndex.
+    if isinstance(series.index, pd.DatetimeIndex) and series.dtype == np.float64:
+        return series
     if not isinstance(series.index, pd.DatetimeIndex):
         series.index = pd.to_datetime(series.index, errors="coerce")
     series = series[~series.index.isna()]
     return series.astype(float)
 
 
+@lru_cache(maxsize=4096)
+def _cache_key_inner(
+    symbol: str,
+    instrument_type: str,
+    what_to_show: str,
+    bar_size: str,
+    session: str,
+    start_iso: str,
+    end_iso: str,
+    identity_fingerprint: str,
+) -> str:
+    """Normalize and hash already-primitive key parts (memoized per unique key)."""
+    key = (
+        f"{str(symbol or '').strip().upper()}"
+        f"|{str(instrument_type or '').strip().lower()}"
+        f"|{str(what_to_show or '').strip().upper()}"
+        f"|{str(bar_size or '').strip()}"
+        f"|{session}"
+        f"|{start_iso}|{end_iso}|{identity_fingerprint}"
+    )
+    return _key_digest(key)
+
+
 def cache_key(
     *,
     symbol: str,
@@ -141,22 +345,16 @@ def cache_key(
     contract_identity: dict[str, Any] | None = None,
 ) -> str:
     """Build deterministic cache key fingerprint for an IBKR request."""
-    start_iso = _to_timestamp(start_date).date().isoformat()
-    end_iso = _to_timestamp(end_date).date().isoformat()
-    identity_fingerprint = _contract_identity_fingerprint(contract_identity)
-    key = "|".join(
-        [
-            str(symbol or "").strip().upper(),
-            str(instrument_type or "").strip().lower(),
-            str(what_to_show or "").strip().upper(),
-            str(bar_size or "").strip(),
-            "rth" if bool(use_rth) else "all",
-            start_iso,
-            end_iso,
-            identity_fingerprint,
-        ]
+    return _cache_key_inner(
+        symbol,
+        instrument_type,
+        what_to_show,
+        bar_size,
+        "rth" if use_rth else "all",
+        _to_timestamp(start_date).date().isoformat(),
+        _to_timestamp(end_date).date().isoformat(),
+        _contract_identity_fingerprint(contract_identity),
     )
-    return hashlib.md5(key.encode()).hexdigest()
 
 
 def _cache_path(
@@ -183,7 +381,8 @@ def _cache_path(
         end_date=end_date,
         contract_identity=contract_identity,
     )
-    return _cache_dir(base_dir) / f"ibkr_{key}.parquet"
+    suffix = _CACHE_FORMAT_SUFFIXES[_cache_format()]
+    return _cache_dir(base_dir) / f"ibkr_{key}{suffix}"
 
 
 def get_cached(
@@ -216,17 +415,61 @@ def get_cached(
         contract_identity=contract_identity,
         base_dir=base_dir,
     )
-    if not path.is_file():
-        return None
-
     ttl = CURRENT_MONTH_TTL_HOURS if _includes_current_month(start_date, end_date, now=now) else None
-    if _is_expired(path, ttl):
+    return _read_cached(path, ttl, symbol)
+
+
+def get_cached_many(
+    requests: Sequence[Mapping[str, Any]],
+    *,
+    base_dir: str | Path | None = None,
+    now: datetime | None = None,
+    first_hit: bool = True,
+) -> list[pd.Series | None]:
+    """Probe several cache keys in order; one result (or ``None``) per request.
+
+    Each request holds the keyword arguments of :func:`get_cached`. The TTL
+    routing is computed once per distinct date window rather than per key.
+    With *first_hit* (the default) probing stops at the first non-empty
+    series and the remaining positions are ``None``.
+    """
+    results: list[pd.Series | None] = [None] * len(requests)
+    window: tuple[Any, Any] | None = None
+    ttl: int | None = None
+    for idx, request in enumerate(requests):
+        request_window = (request.get("start_date"), request.get("end_date"))
+        if window is None or request_window != window:
+            window = request_window
+            ttl = CURRENT_MONTH_TTL_HOURS if _includes_current_month(*window, now=now) else None
+        path = _cache_path(**request, base_dir=base_dir)
+        series = _read_cached(path, ttl, request.get("symbol"))
+        results[idx] = series
+        if first_hit and series is not None and not series.empty:
+            break
+    return results
+
+
+def _read_cached(path: Path, ttl: int | None, symbol: Any) -> pd.Series | None:
+    mem_key = str(path)
+    series = _mem_get(mem_key, ttl)
+    if series is not None:
+        series.name = str(symbol or "").strip().upper()
+        return series
+
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        mtime = _migrate_legacy_parquet(path)
+        if mtime is None:
+            return None
+    if _is_stale(mtime, ttl):
         path.unlink(missing_ok=True)
         return None
 
     series = _safe_read(path)
     if series is None:
         return None
+    _mem_put(mem_key, mtime, series)
     series.name = str(symbol or "").strip().upper()
     return series
 
@@ -244,16 +487,25 @@ def put_cache(
     contract_identity: dict[str, Any] | None = None,
     base_dir: str | Path | None = None,
 ) -> Path | None:
-    """Persist non-empty series in parquet format and return cache file path."""
-    if series.empty or series.dropna().empty:
+    """Persist non-empty series in the configured format and return cache file path."""
+    if series.empty:
         return None
 
-    cleaned = series.dropna().astype(float).copy()
-    if not isinstance(cleaned.index, pd.DatetimeIndex):
-        cleaned.index = pd.to_datetime(cleaned.index, errors="coerce")
-    cleaned = cleaned[~cleaned.index.isna()]
-    if cleaned.empty:
-        return None
+    if (
+        isinstance(series.index, pd.DatetimeIndex)
+        and series.dtype == np.float64
+        and not series.hasnans
+        and not series.index.hasnans
+    ):
+        # Already in canonical shape; to_frame below does not alias the input.
+        cleaned = series
+    else:
+        cleaned = series.dropna().astype(float)
+        if not isinstance(cleaned.index, pd.DatetimeIndex):
+            cleaned.index = pd.to_datetime(cleaned.index, errors="coerce")
+        cleaned = cleaned[~cleaned.index.isna()]
+        if cleaned.empty:
+            return None
 
     path = _cache_path(
         symbol=symbol,
@@ -266,37 +518,79 @@ def put_cache(
         contract_identity=contract_identity,
         base_dir=base_dir,
     )
+    key = str(path)
+    fingerprint = _series_fingerprint(cleaned)
+    with _mem_cache_lock:
+        previous = _FP_CACHE.get(key)
+    if previous is not None and previous[0] == fingerprint:
+        try:
+            unchanged = os.stat(path).st_mtime == previous[1]
+        except OSError:
+            unchanged = False
+        if unchanged:
+            # Same data as our last write: bump mtime for TTL purposes, skip the rewrite.
+            try:
+                os.utime(path)
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                pass  # Removed concurrently; fall through to a normal write.
+            else:
+                with _mem_cache_lock:
+                    _FP_CACHE[key] = (fingerprint, mtime)
+                _mem_put(key, mtime, cleaned)
+                return path
+
     frame = cleaned.to_frame(name="value")
-    frame.to_parquet(path, engine="pyarrow", compression="zstd", index=True)
+    try:
+        _write_frame(frame, path)
+    except FileNotFoundError:
+        # Directory was removed after it was first ensured; recreate once.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_frame(frame, path)
+    mtime = os.stat(path).st_mtime
+    with _mem_cache_lock:
+        _FP_CACHE[key] = (fingerprint, mtime)
+    _mem_put(key, mtime, cleaned)
     return path
 
 
+def _iter_cache_entries(cache_path: Path) -> list[os.DirEntry]:
+    """List cache files via one ``scandir`` pass (stat data reused from readdir)."""
+    try:
+        with os.scandir(cache_path) as it:
+            return [
+                entry
+                for entry in it
+                if entry.name.startswith("ibkr_") and entry.name.endswith((".parquet", ".feather"))
+            ]
+    except FileNotFoundError:
+        # Directory removed after _cache_dir() ensured it; re-create on next use.
+        _ensured_dirs.discard(cache_path)
+        return []
+
+
 def disk_cache_stats(base_dir: str | Path | None = None) -> Dict[str, Any]:
     """Return cache file-count/size/age summary for diagnostics surfaces."""
     cache_path = _cache_dir(base_dir)
-    files = list(cache_path.glob("ibkr_*.parquet"))
-
-    if not files:
-        return {
-            "file_count": 0,
-            "total_bytes": 0,
-            "total_mb": 0.0,
-            "oldest": None,
-            "newest": None,
-            "cache_enabled": True,
-        }
 
+    file_count = 0
     total_bytes = 0
-    mtimes: list[float] = []
-    for f in files:
+    oldest: float | None = None
+    newest: float | None = None
+    for entry in _iter_cache_entries(cache_path):
         try:
-            st = f.stat()
-            total_bytes += st.st_size
-            mtimes.append(st.st_mtime)
+            st = entry.stat()
         except OSError:
             continue
-
-    if not mtimes:
+        file_count += 1
+        total_bytes += st.st_size
+        mtime = st.st_mtime
+        if oldest is None or mtime < oldest:
+            oldest = mtime
+        if newest is None or mtime > newest:
+            newest = mtime
+
+    if oldest is None or newest is None:
         return {
             "file_count": 0,
             "total_bytes": 0,
@@ -307,11 +601,11 @@ def disk_cache_stats(base_dir: str | Path | None = None) -> Dict[str, Any]:
         }
 
     return {
-        "file_count": len(mtimes),
+        "file_count": file_count,
         "total_bytes": total_bytes,
         "total_mb": round(total_bytes / (1024 * 1024), 2),
-        "oldest": datetime.fromtimestamp(min(mtimes), tz=UTC).isoformat(),
-        "newest": datetime.fromtimestamp(max(mtimes), tz=UTC).isoformat(),
+        "oldest": datetime.fromtimestamp(oldest, tz=UTC).isoformat(),
+        "newest": datetime.fromtimestamp(newest, tz=UTC).isoformat(),
         "cache_enabled": True,
     }
 
@@ -320,7 +614,7 @@ def clear_disk_cache(
     base_dir: str | Path | None = None,
     older_than_hours: int | None = None,
 ) -> Dict[str, Any]:
-    """Remove IBKR parquet cache files, optionally filtered by age.
+    """Remove IBKR cache files (parquet and feather), optionally filtered by age.
 
     Args:
         base_dir: Override project root for cache directory.
@@ -335,23 +629,27 @@ def clear_disk_cache(
         raise ValueError(f"older_than_hours must be >= 0, got {older_than_hours}")
 
     cache_path = _cache_dir(base_dir)
-    files = list(cache_path.glob("ibkr_*.parquet"))
     removed = 0
     freed = 0
     errors: list[str] = []
+    now = time.time()
 
-    for f in files:
+    for entry in _iter_cache_entries(cache_path):
         try:
-            st = f.stat()
+            st = entry.stat()
             if older_than_hours is not None:
-                age_h = (time.time() - st.st_mtime) / 3600.0
+                age_h = (now - st.st_mtime) / 3600.0
                 if age_h <= older_than_hours:
                     continue
             freed += st.st_size
-            f.unlink(missing_ok=True)
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+            _mem_discard(entry.path)
             removed += 1
         except OSError as e:
-            errors.append(f"{f.name}: {e}")
+            errors.append(f"{entry.name}: {e}")
 
     result: Dict[str, Any] = {
         "files_removed": removed,
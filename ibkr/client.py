@@ -10,19 +10,22 @@ Agent orientation:
 from __future__ import annotations
 
 import importlib
+from contextlib import contextmanager
 from dataclasses import asdict
-from typing import Any
-
-import pandas as pd
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from .config import IBKR_AUTHORIZED_ACCOUNTS, IBKR_FUTURES_CURVE_TIMEOUT
 from .contract_spec import IBKRContractSpec
 from .account import (
+    _cash_balances_from_account_values,
+    _portfolio_frame_from_items,
+    _positions_frame,
+    _request_portfolio_with_cash,
+    _request_positions,
     fetch_account_summary,
     fetch_pnl,
     fetch_pnl_single,
-    fetch_portfolio_with_cash,
-    fetch_positions,
 )
 from .capabilities import get_capability, list_capabilities
 from .connection import IBKRConnectionManager
@@ -31,6 +34,31 @@ from .locks import ibkr_shared_lock
 from .market_data import IBKRMarketDataClient
 from .metadata import fetch_contract_details, fetch_option_chain
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@lru_cache(maxsize=1)
+def _authorized_accounts_snapshot() -> frozenset[str]:
+    """Return authorized account IDs as a set, resolved once per process.
+
+    Starts from ``IBKR_AUTHORIZED_ACCOUNTS`` and prefers a list-valued
+    ``settings.IBKR_AUTHORIZED_ACCOUNTS`` when the monorepo settings module
+    is importable. Call ``_authorized_accounts_snapshot.cache_clear()`` to
+    pick up changes (e.g. in tests).
+    """
+    authorized_accounts = frozenset(IBKR_AUTHORIZED_ACCOUNTS)
+    try:
+        settings_module = importlib.import_module("settings")
+        configured_accounts = getattr(settings_module, "IBKR_AUTHORIZED_ACCOUNTS", None)
+        if isinstance(configured_accounts, list):
+            authorized_accounts = frozenset(
+                str(account) for account in configured_accounts if str(account).strip()
+            )
+    except Exception:
+        pass
+    return authorized_accounts
+
 
 class IBKRClient:
     """Unified IBKR API client.
@@ -74,23 +102,32 @@ class IBKRClient:
                 **self._budget_kwargs(self._effective_budget_user_id(budget_user_id))
             )
 
+    @contextmanager
+    def _account_connection(self, budget_user_id: int | None):
+        """Yield an IB handle for account/metadata calls.
+
+        Uses this thread's own pooled connection when available (no lock);
+        otherwise the shared connection under ``ibkr_shared_lock``.
+        """
+        budget_kwargs = self._budget_kwargs(budget_user_id)
+        ib = self._conn_manager.ensure_connected_tls(**budget_kwargs)
+        if ib is not None:
+            yield ib
+            return
+        with ibkr_shared_lock:
+            with self._conn_manager.connection(**budget_kwargs) as ib:
+                yield ib
+
     def _resolve_account_id(self, ib, account_id: str | None = None) -> str:
         """Resolve account_id with authorization filtering and ambiguity checks."""
-        authorized_accounts = list(IBKR_AUTHORIZED_ACCOUNTS)
-        try:
-            settings_module = importlib.import_module("settings")
-            configured_accounts = getattr(settings_module, "IBKR_AUTHORIZED_ACCOUNTS", None)
-            if isinstance(configured_accounts, list):
-                authorized_accounts = [str(account) for account in configured_accounts if str(account).strip()]
-        except Exception:
-            pass
+        authorized_accounts = _authorized_accounts_snapshot()
 
         if account_id:
             normalized_account_id = str(account_id).strip()
             if authorized_accounts and normalized_account_id in authorized_accounts:
                 return normalized_account_id
 
-        accounts = list(ib.managedAccounts() or [])
+        accounts = self._conn_manager.managed_accounts_for(ib)
 
         if authorized_accounts:
             accounts = [a for a in accounts if a in authorized_accounts]
@@ -200,14 +237,14 @@ class IBKRClient:
         budget_user_id: int | None = None,
     ) -> pd.DataFrame:
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                resolved_account = self._resolve_account_id(ib, account_id)
-                return fetch_positions(
-                    ib,
-                    account_id=resolved_account,
-                    **self._budget_kwargs(effective_budget_user_id),
-                )
+        with self._account_connection(effective_budget_user_id) as ib:
+            resolved_account = self._resolve_account_id(ib, account_id)
+            positions = _request_positions(
+                ib,
+                **self._budget_kwargs(effective_budget_user_id),
+            )
+        # Frame building only touches the snapshot; do it after releasing the lock.
+        return _positions_frame(positions, account_id=resolved_account)
 
     def get_portfolio_with_cash(
         self,
@@ -217,21 +254,23 @@ class IBKRClient:
     ) -> tuple[pd.DataFrame, dict[str, float]]:
         """Fetch portfolio items and cash balances in one connection session."""
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                resolved_account = self._resolve_account_id(ib, account_id)
-                return fetch_portfolio_with_cash(
-                    ib,
-                    account_id=resolved_account,
-                    **self._budget_kwargs(effective_budget_user_id),
-                )
+        with self._account_connection(effective_budget_user_id) as ib:
+            resolved_account = self._resolve_account_id(ib, account_id)
+            items, account_values = _request_portfolio_with_cash(
+                ib,
+                account_id=resolved_account,
+                **self._budget_kwargs(effective_budget_user_id),
+            )
+        return (
+            _portfolio_frame_from_items(items, account_id=resolved_account),
+            _cash_balances_from_account_values(account_values, account_id=resolved_account),
+        )
 
     def get_managed_accounts(self, *, budget_user_id: int | None = None) -> list[str]:
         """Return managed account IDs discovered from Gateway."""
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                return list(ib.managedAccounts() or [])
+        with self._account_connection(effective_budget_user_id) as ib:
+            return list(ib.managedAccounts() or [])
 
     def get_account_summary(
         self,
@@ -240,14 +279,13 @@ class IBKRClient:
         budget_user_id: int | None = None,
         ) -> dict[str, float]:
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                resolved_account = self._resolve_account_id(ib, account_id)
-                return fetch_account_summary(
-                    ib,
-                    account_id=resolved_account,
-                    **self._budget_kwargs(effective_budget_user_id),
-                )
+        with self._account_connection(effective_budget_user_id) as ib:
+            resolved_account = self._resolve_account_id(ib, account_id)
+            return fetch_account_summary(
+                ib,
+                account_id=resolved_account,
+                **self._budget_kwargs(effective_budget_user_id),
+            )
 
     def get_pnl(
         self,
@@ -256,14 +294,13 @@ class IBKRClient:
         budget_user_id: int | None = None,
     ) -> dict[str, Any]:
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                resolved_account = self._resolve_account_id(ib, account_id)
-                return fetch_pnl(
-                    ib,
-                    account_id=resolved_account,
-                    **self._budget_kwargs(effective_budget_user_id),
-                )
+        with self._account_connection(effective_budget_user_id) as ib:
+            resolved_account = self._resolve_account_id(ib, account_id)
+            return fetch_pnl(
+                ib,
+                account_id=resolved_account,
+                **self._budget_kwargs(effective_budget_user_id),
+            )
 
     def get_pnl_single(
         self,
@@ -273,15 +310,14 @@ class IBKRClient:
         budget_user_id: int | None = None,
     ) -> dict[str, Any]:
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                resolved_account = self._resolve_account_id(ib, account_id)
-                return fetch_pnl_single(
-                    ib,
-                    account_id=resolved_account,
-                    con_id=int(con_id),
-                    **self._budget_kwargs(effective_budget_user_id),
-                )
+        with self._account_connection(effective_budget_user_id) as ib:
+            resolved_account = self._resolve_account_id(ib, account_id)
+            return fetch_pnl_single(
+                ib,
+                account_id=resolved_account,
+                con_id=int(con_id),
+                **self._budget_kwargs(effective_budget_user_id),
+            )
 
     def get_contract_details(
         self,
@@ -293,16 +329,15 @@ class IBKRClient:
         budget_user_id: int | None = None,
     ) -> list[dict[str, Any]]:
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                return fetch_contract_details(
-                    ib,
-                    symbol=symbol,
-                    sec_type=sec_type,
-                    exchange=exchange,
-                    currency=currency,
-                    **self._budget_kwargs(effective_budget_user_id),
-                )
+        with self._account_connection(effective_budget_user_id) as ib:
+            return fetch_contract_details(
+                ib,
+                symbol=symbol,
+                sec_type=sec_type,
+                exchange=exchange,
+                currency=currency,
+                **self._budget_kwargs(effective_budget_user_id),
+            )
 
     def get_futures_months(
         self,
@@ -314,13 +349,12 @@ class IBKRClient:
         from .metadata import fetch_futures_months
 
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                return fetch_futures_months(
-                    ib,
-                    symbol,
-                    **self._budget_kwargs(effective_budget_user_id),
-                )
+        with self._account_connection(effective_budget_user_id) as ib:
+            return fetch_futures_months(
+                ib,
+                symbol,
+                **self._budget_kwargs(effective_budget_user_id),
+            )
 
     def get_option_chain(
         self,
@@ -331,15 +365,14 @@ class IBKRClient:
         budget_user_id: int | None = None,
     ) -> dict[str, Any]:
         effective_budget_user_id = self._effective_budget_user_id(budget_user_id)
-        with ibkr_shared_lock:
-            with self._conn_manager.connection(**self._budget_kwargs(effective_budget_user_id)) as ib:
-                return fetch_option_chain(
-                    ib,
-                    symbol=symbol,
-                    sec_type=sec_type,
-                    exchange=exchange,
-                    **self._budget_kwargs(effective_budget_user_id),
-                )
+        with self._account_connection(effective_budget_user_id) as ib:
+            return fetch_option_chain(
+                ib,
+                symbol=symbol,
+                sec_type=sec_type,
+                exchange=exchange,
+                **self._budget_kwargs(effective_budget_user_id),
+            )
 
     def list_capabilities(
         self,
@@ -10,14 +10,13 @@ Agent orientation:
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import lru_cache
 import os
-from pathlib import Path
-from typing import Any, Optional, Union
-
-import pandas as pd
-import yaml
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Union
 
 from .exceptions import (
     IBKRAccountError,
@@ -28,12 +27,23 @@ from .exceptions import (
     IBKRNoDataError,
     IBKRTimeoutError,
 )
+from ._exchange_mappings import futures_exchanges
 from ._logging import logger
 from .config import IBKR_FUTURES_CURVE_TIMEOUT
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 IBKRMarketDataClient = None
 
 
+def _empty_series() -> pd.Series:
+    """Fail-open return value; pandas is imported only when actually needed."""
+    import pandas as pd
+
+    return pd.Series(dtype=float)
+
+
 def _ibkr_fx_daily_enabled():
     return os.getenv("IBKR_FX_DAILY_ENABLED", "0").strip() == "1"
 
@@ -47,17 +57,38 @@ def _ibkr_ts_cache_enabled():
 
 
 @lru_cache(maxsize=1)
-def _load_ibkr_exchange_mappings() -> dict[str, Any]:
-    path = Path(__file__).resolve().with_name("exchange_mappings.yaml")
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+def _default_market_data_client():
+    from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
 
+    return _IBKRMarketDataClient()
+
+
+def _market_data_client():
+    """Return the shared market-data client (or a fresh instance of a patched class)."""
+    if IBKRMarketDataClient is not None:
+        return IBKRMarketDataClient()
+    return _default_market_data_client()
+
+
+def _reset_market_data_client() -> None:
+    """Drop the cached market-data client for test isolation."""
+    _default_market_data_client.cache_clear()
+
+
+# (routing mapping it was derived from, FMP map); rebuilt when the YAML reloads.
+_futures_fmp_map_cache: tuple[Mapping[str, Any] | None, Mapping[str, str]] = (None, MappingProxyType({}))
+
+
+def _futures_fmp_map() -> Mapping[str, str]:
+    global _futures_fmp_map_cache
+
+    ibkr_routing = futures_exchanges()
+    source, cached = _futures_fmp_map_cache
+    if source is ibkr_routing:
+        return cached
 
-def get_ibkr_futures_fmp_map() -> dict[str, str]:
-    """Return IBKR-routable futures-root -> FMP symbol mappings."""
     from brokerage.futures import load_contract_specs
 
-    ibkr_routing = get_ibkr_futures_exchanges()
     all_specs = load_contract_specs()
 
     out: dict[str, str] = {}
@@ -67,48 +98,59 @@ def get_ibkr_futures_fmp_map() -> dict[str, str]:
         mapped = str(spec.data_symbol or "").strip().upper()
         if mapped:
             out[symbol] = mapped
-    return out
+    fmp_map = MappingProxyType(out)
+    _futures_fmp_map_cache = (ibkr_routing, fmp_map)
+    return fmp_map
+
+
+def get_ibkr_futures_fmp_map() -> dict[str, str]:
+    """Return IBKR-routable futures-root -> FMP symbol mappings."""
+    return dict(_futures_fmp_map())
 
 
 def get_ibkr_futures_exchanges() -> dict[str, dict[str, str]]:
     """Load IBKR futures-root exchange metadata."""
-    raw_map = _load_ibkr_exchange_mappings().get("ibkr_futures_exchanges", {})
-    out: dict[str, dict[str, str]] = {}
-    if isinstance(raw_map, dict):
-        for symbol, meta in raw_map.items():
-            if not isinstance(meta, dict):
-                continue
-            key = str(symbol or "").strip().upper()
-            exchange = str(meta.get("exchange") or "").strip().upper()
-            currency = str(meta.get("currency") or "USD").strip().upper()
-            if key and exchange:
-                out[key] = {"exchange": exchange, "currency": currency}
-    return out
+    return {
+        symbol: {"exchange": exchange, "currency": currency}
+        for symbol, (exchange, currency) in futures_exchanges().items()
+    }
 
 
 def get_ibkr_futures_contract_meta() -> dict[str, dict[str, Any]]:
     """Return IBKR-routable futures metadata from the canonical futures catalog."""
     from brokerage.futures import load_contract_specs
 
-    ibkr_routing = get_ibkr_futures_exchanges()
+    ibkr_routing = futures_exchanges()
     all_specs = load_contract_specs()
 
     out: dict[str, dict[str, Any]] = {}
     for symbol, spec in all_specs.items():
-        if symbol not in ibkr_routing:
+        routing = ibkr_routing.get(symbol)
+        if routing is None:
             continue
 
         identity = spec.to_contract_identity()
         # IBKR routing values are authoritative inside IBKR contexts.
-        identity["exchange"] = ibkr_routing[symbol]["exchange"]
-        identity["currency"] = ibkr_routing[symbol]["currency"]
+        identity["exchange"], identity["currency"] = routing
         out[symbol] = identity
     return out
 
 
 def get_futures_contract_meta(symbol: str) -> Optional[dict[str, Any]]:
     """Return full contract metadata for an IBKR futures root symbol."""
-    return get_ibkr_futures_contract_meta().get(str(symbol or "").strip().upper())
+    key = str(symbol or "").strip().upper()
+    routing = futures_exchanges().get(key)
+    if routing is None:
+        return None
+    from brokerage.futures import get_contract_spec
+
+    spec = get_contract_spec(key)
+    if spec is None:
+        return None
+    identity = spec.to_contract_identity()
+    # IBKR routing values are authoritative inside IBKR contexts.
+    identity["exchange"], identity["currency"] = routing
+    return identity
 
 
 def get_futures_currency(symbol: str) -> str:
@@ -116,6 +158,10 @@ def get_futures_currency(symbol: str) -> str:
     key = str(symbol or "").strip().upper()
     if not key:
         return "USD"
+    routing = futures_exchanges().get(key)
+    if routing is not None:
+        # IBKR routing currency is authoritative for IBKR-routable roots.
+        return routing[1]
     from brokerage.futures import get_contract_spec
 
     spec = get_contract_spec(key)
@@ -154,16 +200,11 @@ def fetch_ibkr_monthly_close(
     """
     del currency
     try:
-        client_cls = IBKRMarketDataClient
-        if client_cls is None:
-            from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-            client_cls = _IBKRMarketDataClient
-        client = client_cls()
+        client = _market_data_client()
         return client.fetch_monthly_close_futures(symbol, start_date, end_date)
     except Exception as exc:
         logger.warning("IBKR futures fetch failed for %s: %s", symbol, exc)
-        return pd.Series(dtype=float)
+        return _empty_series()
 
 
 def _raw_daily_futures(
@@ -173,16 +214,11 @@ def _raw_daily_futures(
 ) -> pd.Series:
     """Raw IBKR daily futures fetch (fail-open, existing contract)."""
     try:
-        client_cls = IBKRMarketDataClient
-        if client_cls is None:
-            from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-            client_cls = _IBKRMarketDataClient
-        client = client_cls()
+        client = _market_data_client()
         return client.fetch_daily_close_futures(symbol, start_date, end_date)
     except Exception as exc:
         logger.warning("IBKR daily futures fetch failed for %s: %s", symbol, exc)
-        return pd.Series(dtype=float)
+        return _empty_series()
 
 
 def _raw_daily_futures_for_cache(
@@ -191,12 +227,7 @@ def _raw_daily_futures_for_cache(
     end_date: Union[str, datetime],
 ) -> pd.Series:
     """Raw fetch for cache loader with transient failures propagated."""
-    client_cls = IBKRMarketDataClient
-    if client_cls is None:
-        from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-        client_cls = _IBKRMarketDataClient
-    client = client_cls()
+    client = _market_data_client()
     return client.fetch_daily_close_futures(
         symbol,
         start_date,
@@ -235,16 +266,11 @@ def fetch_ibkr_fx_monthly_close(
 ) -> pd.Series:
     """Fetch month-end FX close series through the IBKR market data client."""
     try:
-        client_cls = IBKRMarketDataClient
-        if client_cls is None:
-            from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-            client_cls = _IBKRMarketDataClient
-        client = client_cls()
+        client = _market_data_client()
         return client.fetch_monthly_close_fx(symbol, start_date, end_date)
     except Exception as exc:
         logger.warning("IBKR FX fetch failed for %s: %s", symbol, exc)
-        return pd.Series(dtype=float)
+        return _empty_series()
 
 
 def _raw_daily_fx(
@@ -254,16 +280,11 @@ def _raw_daily_fx(
 ) -> pd.Series:
     """Raw IBKR daily FX fetch (fail-open, existing contract)."""
     try:
-        client_cls = IBKRMarketDataClient
-        if client_cls is None:
-            from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-            client_cls = _IBKRMarketDataClient
-        client = client_cls()
+        client = _market_data_client()
         return client.fetch_daily_close_fx(symbol, start_date, end_date)
     except Exception as exc:
         logger.warning("IBKR daily FX fetch failed for %s: %s", symbol, exc)
-        return pd.Series(dtype=float)
+        return _empty_series()
 
 
 def _raw_daily_fx_for_cache(
@@ -272,12 +293,7 @@ def _raw_daily_fx_for_cache(
     end_date: Union[str, datetime],
 ) -> pd.Series:
     """Raw IBKR daily FX fetch with transient failures propagated."""
-    client_cls = IBKRMarketDataClient
-    if client_cls is None:
-        from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-        client_cls = _IBKRMarketDataClient
-    client = client_cls()
+    client = _market_data_client()
     return client.fetch_daily_close_fx(
         symbol,
         start_date,
@@ -293,7 +309,7 @@ def fetch_ibkr_daily_close_fx(
 ) -> pd.Series:
     """Fetch daily FX close series through the IBKR market data client."""
     if not _ibkr_fx_daily_enabled():
-        return pd.Series(dtype=float)
+        return _empty_series()
     if _ibkr_ts_cache_enabled():
         try:
             from .timeseries_cache import cached_daily_fetch
@@ -319,12 +335,7 @@ def fetch_ibkr_bond_monthly_close(
 ) -> pd.Series:
     """Fetch month-end bond close series through the IBKR market data client."""
     try:
-        client_cls = IBKRMarketDataClient
-        if client_cls is None:
-            from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-            client_cls = _IBKRMarketDataClient
-        client = client_cls()
+        client = _market_data_client()
         return client.fetch_monthly_close_bond(
             symbol,
             start_date,
@@ -333,7 +344,7 @@ def fetch_ibkr_bond_monthly_close(
         )
     except Exception as exc:
         logger.warning("IBKR bond fetch failed for %s: %s", symbol, exc)
-        return pd.Series(dtype=float)
+        return _empty_series()
 
 
 def _raw_daily_bond(
@@ -344,12 +355,7 @@ def _raw_daily_bond(
 ) -> pd.Series:
     """Raw IBKR daily bond fetch (fail-open, existing contract)."""
     try:
-        client_cls = IBKRMarketDataClient
-        if client_cls is None:
-            from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-            client_cls = _IBKRMarketDataClient
-        client = client_cls()
+        client = _market_data_client()
         return client.fetch_daily_close_bond(
             symbol,
             start_date,
@@ -358,7 +364,7 @@ def _raw_daily_bond(
         )
     except Exception as exc:
         logger.warning("IBKR daily bond fetch failed for %s: %s", symbol, exc)
-        return pd.Series(dtype=float)
+        return _empty_series()
 
 
 def _raw_daily_bond_for_cache(
@@ -368,12 +374,7 @@ def _raw_daily_bond_for_cache(
     contract_identity: dict | None = None,
 ) -> pd.Series:
     """Raw IBKR daily bond fetch with transient failures propagated."""
-    client_cls = IBKRMarketDataClient
-    if client_cls is None:
-        from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-        client_cls = _IBKRMarketDataClient
-    client = client_cls()
+    client = _market_data_client()
     return client.fetch_daily_close_bond(
         symbol,
         start_date,
@@ -391,7 +392,7 @@ def fetch_ibkr_daily_close_bond(
 ) -> pd.Series:
     """Fetch daily bond close series through the IBKR market data client."""
     if not _ibkr_bond_daily_enabled():
-        return pd.Series(dtype=float)
+        return _empty_series()
     if _ibkr_ts_cache_enabled():
         try:
             from .timeseries_cache import cached_daily_fetch
@@ -418,12 +419,7 @@ def fetch_ibkr_option_monthly_mark(
 ) -> pd.Series:
     """Fetch month-end option marks through the IBKR market data client."""
     try:
-        client_cls = IBKRMarketDataClient
-        if client_cls is None:
-            from .market_data import IBKRMarketDataClient as _IBKRMarketDataClient
-
-            client_cls = _IBKRMarketDataClient
-        client = client_cls()
+        client = _market_data_client()
         return client.fetch_monthly_close_option(
             symbol,
             start_date,
@@ -432,7 +428,159 @@ def fetch_ibkr_option_monthly_mark(
         )
     except Exception as exc:
         logger.warning("IBKR option fetch failed for %s: %s", symbol, exc)
-        return pd.Series(dtype=float)
+        return _empty_series()
+
+
+async def afetch_ibkr_monthly_close(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    currency: str = "USD",
+) -> pd.Series:
+    """Async variant of :func:`fetch_ibkr_monthly_close` (runs in a worker thread)."""
+    return await asyncio.to_thread(fetch_ibkr_monthly_close, symbol, start_date, end_date, currency)
+
+
+async def afetch_ibkr_daily_close_futures(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+) -> pd.Series:
+    """Async variant of :func:`fetch_ibkr_daily_close_futures` (runs in a worker thread)."""
+    return await asyncio.to_thread(fetch_ibkr_daily_close_futures, symbol, start_date, end_date)
+
+
+async def afetch_ibkr_fx_monthly_close(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+) -> pd.Series:
+    """Async variant of :func:`fetch_ibkr_fx_monthly_close` (runs in a worker thread)."""
+    return await asyncio.to_thread(fetch_ibkr_fx_monthly_close, symbol, start_date, end_date)
+
+
+async def afetch_ibkr_daily_close_fx(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+) -> pd.Series:
+    """Async variant of :func:`fetch_ibkr_daily_close_fx` (runs in a worker thread)."""
+    return await asyncio.to_thread(fetch_ibkr_daily_close_fx, symbol, start_date, end_date)
+
+
+async def afetch_ibkr_bond_monthly_close(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    contract_identity: dict | None = None,
+) -> pd.Series:
+    """Async variant of :func:`fetch_ibkr_bond_monthly_close` (runs in a worker thread)."""
+    return await asyncio.to_thread(
+        fetch_ibkr_bond_monthly_close, symbol, start_date, end_date, contract_identity
+    )
+
+
+async def afetch_ibkr_daily_close_bond(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    contract_identity: dict | None = None,
+) -> pd.Series:
+    """Async variant of :func:`fetch_ibkr_daily_close_bond` (runs in a worker thread)."""
+    return await asyncio.to_thread(
+        fetch_ibkr_daily_close_bond, symbol, start_date, end_date, contract_identity
+    )
+
+
+async def afetch_ibkr_option_monthly_mark(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    contract_identity: dict | None = None,
+) -> pd.Series:
+    """Async variant of :func:`fetch_ibkr_option_monthly_mark` (runs in a worker thread)."""
+    return await asyncio.to_thread(
+        fetch_ibkr_option_monthly_mark, symbol, start_date, end_date, contract_identity
+    )
+
+
+_BATCH_FETCHERS = {
+    "futures": afetch_ibkr_monthly_close,
+    "futures_daily": afetch_ibkr_daily_close_futures,
+    "fx": afetch_ibkr_fx_monthly_close,
+    "fx_daily": afetch_ibkr_daily_close_fx,
+    "bond": afetch_ibkr_bond_monthly_close,
+    "bond_daily": afetch_ibkr_daily_close_bond,
+    "option": afetch_ibkr_option_monthly_mark,
+}
+_BATCH_CONCURRENCY = 8
+
+
+def _is_batch_request(request: Any) -> bool:
+    return isinstance(request, (tuple, list)) and 4 <= len(request) <= 5
+
+
+async def afetch_ibkr_batch(
+    requests: list[tuple[Any, ...]],
+) -> dict[tuple[str, str], pd.Series]:
+    """Fetch many ``(kind, symbol, start_date, end_date[, contract_identity])`` series concurrently.
+
+    ``kind`` is one of ``futures``, ``futures_daily``, ``fx``, ``fx_daily``,
+    ``bond``, ``bond_daily`` or ``option``; the optional fifth element is
+    passed as ``contract_identity`` (bond and option kinds only).
+    At most 8 fetches run at once. Cache hits overlap freely. Gateway
+    round-trips on the shared market-data client ID are serialized by the
+    market-data request lock; with ``IBKR_MARKET_DATA_POOL_SIZE > 0`` worker
+    threads request bars on their own client IDs in parallel. Failures map to an
+    empty series, matching the single-symbol wrappers; so do malformed
+    request tuples, keyed ``("", repr(request))``. Results are keyed by
+    ``(kind, symbol)`` (later duplicates win).
+    """
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def _one(request: Any) -> pd.Series:
+        # Unpack here so a malformed tuple fails this fetch only.
+        if not _is_batch_request(request):
+            raise ValueError(f"Malformed IBKR batch request {request!r}")
+        kind, symbol, start_date, end_date, *extra = request
+        fetcher = _BATCH_FETCHERS.get(kind)
+        if fetcher is None:
+            raise ValueError(f"Unknown IBKR batch kind '{kind}'")
+        async with semaphore:
+            return await fetcher(symbol, start_date, end_date, *extra)
+
+    results = await asyncio.gather(
+        *(_one(request) for request in requests),
+        return_exceptions=True,
+    )
+    out: dict[tuple[str, str], pd.Series] = {}
+    for request, result in zip(requests, results):
+        if _is_batch_request(request):
+            kind, symbol = request[0], request[1]
+        else:
+            kind, symbol = "", repr(request)
+        if isinstance(result, BaseException):
+            logger.warning("IBKR batch %s fetch failed for %s: %s", kind, symbol, result)
+            result = _empty_series()
+        out[(kind, symbol)] = result
+    return out
+
+
+def fetch_ibkr_batch(
+    requests: list[tuple[Any, ...]],
+) -> dict[tuple[str, str], pd.Series]:
+    """Blocking wrapper for :func:`afetch_ibkr_batch`.
+
+    Safe to call from inside a running event loop: the batch then runs on
+    its own loop in a helper thread (the calling loop blocks until it ends).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(afetch_ibkr_batch(requests))
+    # asyncio.run() raises inside a running loop.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, afetch_ibkr_batch(requests)).result()
 
 
 def fetch_ibkr_flex_trades(
@@ -478,6 +626,15 @@ __all__ = [
     "fetch_ibkr_fx_monthly_close",
     "fetch_ibkr_bond_monthly_close",
     "fetch_ibkr_option_monthly_mark",
+    "afetch_ibkr_monthly_close",
+    "afetch_ibkr_daily_close_futures",
+    "afetch_ibkr_fx_monthly_close",
+    "afetch_ibkr_daily_close_fx",
+    "afetch_ibkr_bond_monthly_close",
+    "afetch_ibkr_daily_close_bond",
+    "afetch_ibkr_option_monthly_mark",
+    "afetch_ibkr_batch",
+    "fetch_ibkr_batch",
     "fetch_ibkr_flex_trades",
     "fetch_ibkr_flex_payload",
     "get_ibkr_futures_fmp_map",
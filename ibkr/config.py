@@ -69,8 +69,24 @@ IBKR_MAX_RECONNECT_ATTEMPTS: int = _int_env("IBKR_MAX_RECONNECT_ATTEMPTS", 3)
 _raw_mode = os.getenv("IBKR_CONNECTION_MODE", "ephemeral").lower()
 IBKR_CONNECTION_MODE: str = _raw_mode if _raw_mode in ("ephemeral", "persistent") else "ephemeral"
 
+# --- Per-thread account connections (persistent mode only) ---
+# 0 disables. N > 0 lets up to N threads each hold their own account connection
+# (client IDs IBKR_ACCOUNT_POOL_BASE_CLIENT_ID .. +N-1) instead of sharing the
+# single lock-serialized client; extra threads fall back to the shared client.
+IBKR_ACCOUNT_POOL_SIZE: int = max(0, _int_env("IBKR_ACCOUNT_POOL_SIZE", 0))
+IBKR_ACCOUNT_POOL_BASE_CLIENT_ID: int = _int_env("IBKR_ACCOUNT_POOL_BASE_CLIENT_ID", IBKR_CLIENT_ID + 10)
+
 # --- Market data ---
 IBKR_MARKET_DATA_RETRY_DELAY: float = _float_env("IBKR_MARKET_DATA_RETRY_DELAY", 2.0)
+# Seconds an idle historical-bars connection stays open for reuse (0 = connect per
+# request). Opt-in: while parked, the connection holds the market data client ID.
+IBKR_MARKET_DATA_IDLE_TIMEOUT: float = max(0.0, _float_env("IBKR_MARKET_DATA_IDLE_TIMEOUT", 0.0))
+# 0 serializes historical-bars requests on the market data client ID. N > 0 lets
+# up to N threads each request bars on their own client ID
+# (IBKR_MARKET_DATA_POOL_BASE_CLIENT_ID .. +N-1); extra threads fall back to the
+# serialized path.
+IBKR_MARKET_DATA_POOL_SIZE: int = max(0, _int_env("IBKR_MARKET_DATA_POOL_SIZE", 0))
+IBKR_MARKET_DATA_POOL_BASE_CLIENT_ID: int = _int_env("IBKR_MARKET_DATA_POOL_BASE_CLIENT_ID", IBKR_CLIENT_ID + 30)
 IBKR_SNAPSHOT_TIMEOUT: float = _float_env("IBKR_SNAPSHOT_TIMEOUT", 5.0)
 IBKR_SNAPSHOT_POLL_INTERVAL: float = _float_env("IBKR_SNAPSHOT_POLL_INTERVAL", 0.5)
 IBKR_FUTURES_CURVE_TIMEOUT: float = _float_env("IBKR_FUTURES_CURVE_TIMEOUT", 8.0)
@@ -10,15 +10,20 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 import logging
+import random
 import threading
 import time
+import weakref
 from typing import Any, List, Optional
 
 from ibkr._shared.budget_exceptions import BudgetExceededError
 
 from ._logging import log_event, logger, TimingContext
 from ._budget import guard_ib_call
+from .account import close_account_subscriptions, close_pnl_subscriptions
 from .config import (
+    IBKR_ACCOUNT_POOL_BASE_CLIENT_ID,
+    IBKR_ACCOUNT_POOL_SIZE,
     IBKR_CLIENT_ID,
     IBKR_CONNECTION_MODE,
     IBKR_CONNECT_MAX_ATTEMPTS,
@@ -31,10 +36,33 @@ from .config import (
     IBKR_TIMEOUT,
 )
 
-from .asyncio_compat import apply_nest_asyncio_if_running_loop
+from .asyncio_compat import apply_nest_asyncio_if_running_loop, disconnect_on_loop, ensure_event_loop
 
 apply_nest_asyncio_if_running_loop()
 
+_RECONNECT_MAX_DELAY = 30.0
+
+
+def _close_account_streams(ib) -> None:
+    """Cancel the account-update and PnL streams ``account`` left open on *ib*."""
+    try:
+        close_account_subscriptions(ib)
+        close_pnl_subscriptions(ib)
+    except Exception:
+        pass
+
+
+class _ThreadConnectionSlot:
+    """Thread-local holder for a pooled client ID and its IB connection."""
+
+    __slots__ = ("client_id", "ib_ref", "__weakref__")
+
+    def __init__(self, client_id: int) -> None:
+        self.client_id = client_id
+        # [IB, event loop servicing it], boxed so the release finalizer can reach
+        # them without referencing the slot.
+        self.ib_ref: list[Any] = [None, None]
+
 
 class IBKRConnectionManager:
     """Manage IB Gateway connection lifecycle for account/metadata operations.
@@ -53,10 +81,17 @@ class IBKRConnectionManager:
             obj = super().__new__(cls)
             obj._initialized = False
             return obj
+        # Lock-free fast path: the published singleton is always fully initialized.
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._instance_lock:
             if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
+                instance = super().__new__(cls)
+                instance._initialized = False
+                # Initialize before publishing so no caller sees a half-built manager.
+                instance.__init__(client_id, **kwargs)
+                cls._instance = instance
             return cls._instance
 
     def __init__(self, client_id: Optional[int] = None, default_max_attempts: Optional[int] = None) -> None:
@@ -73,12 +108,24 @@ class IBKRConnectionManager:
 
         self._ib = None
         self._managed_accounts: List[str] = []
+        # Serializes connect/disconnect work; never needed to read connection state.
         self._connect_lock = threading.RLock()
+        # Held only for pointer swaps of ``_ib``/``_managed_accounts``/``_reconnecting``.
+        self._state_lock = threading.Lock()
         self._reconnect_delay = IBKR_RECONNECT_DELAY
         self._max_reconnect_attempts = IBKR_MAX_RECONNECT_ATTEMPTS
         self._reconnecting = False
+        self._reconnect_thread: threading.Thread | None = None
         self._manual_disconnect = False
 
+        # Per-thread account connections (singleton only); free client IDs.
+        self._tls = threading.local()
+        self._pool_client_ids: List[int] = (
+            list(range(IBKR_ACCOUNT_POOL_BASE_CLIENT_ID, IBKR_ACCOUNT_POOL_BASE_CLIENT_ID + IBKR_ACCOUNT_POOL_SIZE))
+            if client_id is None
+            else []
+        )
+
     @staticmethod
     def _budget_kwargs(budget_user_id: int | None) -> dict[str, int]:
         if budget_user_id is None:
@@ -90,10 +137,9 @@ class IBKRConnectionManager:
         attach_events: bool = True,
         *,
         budget_user_id: int | None = None,
+        client_id: int | None = None,
     ):
         """Create and connect a fresh IB instance without storing to self._ib."""
-        from .asyncio_compat import ensure_event_loop
-
         ensure_event_loop()
         from ib_async import IB
 
@@ -107,7 +153,7 @@ class IBKRConnectionManager:
                 kwargs={
                     "host": self._host,
                     "port": self._port,
-                    "clientId": self._client_id,
+                    "clientId": self._client_id if client_id is None else client_id,
                     "timeout": self._timeout,
                     "readonly": self._readonly,
                 },
@@ -139,9 +185,14 @@ class IBKRConnectionManager:
         backoff between attempts.
         """
         effective_attempts = max_attempts if max_attempts is not None else self._default_max_attempts
+        current = self._ib
+        if current is not None and current.isConnected():
+            return current
         with self._connect_lock:
-            if self._ib is not None and self._ib.isConnected():
-                return self._ib
+            # Another caller may have connected while we waited for the lock.
+            current = self._ib
+            if current is not None and current.isConnected():
+                return current
 
             last_exc: Exception | None = None
             for attempt in range(1, effective_attempts + 1):
@@ -168,8 +219,10 @@ class IBKRConnectionManager:
                             attach_events=True,
                             **self._budget_kwargs(budget_user_id),
                         )
-                    self._ib = ib
-                    self._managed_accounts = list(ib.managedAccounts() or [])
+                    accounts = list(ib.managedAccounts() or [])
+                    with self._state_lock:
+                        self._ib = ib
+                        self._managed_accounts = accounts
                     log_event(
                         logger, logging.INFO, "connect.ok",
                         client_id=self._client_id,
@@ -250,6 +303,7 @@ class IBKRConnectionManager:
         try:
             yield ib
         finally:
+            _close_account_streams(ib)
             try:
                 ib.disconnect()
             except Exception:
@@ -258,29 +312,105 @@ class IBKRConnectionManager:
     def disconnect(self) -> None:
         """Disconnect from IB Gateway and suppress auto-reconnect."""
         with self._connect_lock:
-            if self._ib is None:
-                return
+            with self._state_lock:
+                ib = self._ib
+                if ib is None:
+                    return
+                self._ib = None
+                self._managed_accounts = []
 
             try:
                 self._manual_disconnect = True
                 try:
-                    self._ib.disconnectedEvent -= self._on_disconnect
+                    ib.disconnectedEvent -= self._on_disconnect
                 except Exception:
                     pass
-                self._ib.disconnect()
+                _close_account_streams(ib)
+                ib.disconnect()
             except Exception as e:
                 logger.warning(f"Error during IB disconnect: {e}")
             finally:
-                self._ib = None
-                self._managed_accounts = []
                 self._manual_disconnect = False
 
     def ensure_connected(self, *, budget_user_id: int | None = None):
         """Return connected IB instance, reconnecting as needed."""
-        if self._ib is not None and self._ib.isConnected():
-            return self._ib
+        ib = self._ib
+        if ib is not None and ib.isConnected():
+            return ib
         return self.connect(**self._budget_kwargs(budget_user_id))
 
+    def ensure_connected_tls(self, *, budget_user_id: int | None = None):
+        """Return this thread's own connected IB, or ``None`` to use the shared path.
+
+        Only active in persistent mode with ``IBKR_ACCOUNT_POOL_SIZE > 0``. A
+        thread claims a pool client ID on first use and keeps it (and its
+        connection) until the thread exits. Returns ``None`` when the pool is
+        disabled or exhausted, or when the per-thread connect fails.
+        """
+        if IBKR_CONNECTION_MODE != "persistent":
+            return None
+        slot = getattr(self._tls, "slot", None)
+        if slot is None:
+            with self._state_lock:
+                if not self._pool_client_ids:
+                    return None
+                client_id = self._pool_client_ids.pop(0)
+            slot = _ThreadConnectionSlot(client_id)
+            weakref.finalize(slot, self._release_pool_slot, client_id, slot.ib_ref)
+            self._tls.slot = slot
+
+        ib = slot.ib_ref[0]
+        if ib is not None and ib.isConnected():
+            return ib
+        try:
+            ib = self._do_connect(
+                attach_events=False,
+                client_id=slot.client_id,
+                **self._budget_kwargs(budget_user_id),
+            )
+        except BudgetExceededError:
+            raise
+        except Exception as exc:
+            log_event(
+                logger, logging.WARNING, "connect.thread_failed",
+                client_id=slot.client_id,
+                error=str(exc) or type(exc).__name__,
+            )
+            return None
+        slot.ib_ref[:] = [ib, ensure_event_loop()]
+        log_event(logger, logging.INFO, "connect.thread", client_id=slot.client_id)
+        return ib
+
+    def _release_pool_slot(self, client_id: int, ib_ref: list[Any]) -> None:
+        """Disconnect a dead thread's connection and return its client ID to the pool.
+
+        The dead thread's loop never runs again, so the disconnect drains it on
+        a helper thread (the finalizer may run on a thread with its own running
+        loop); the ID rejoins the pool only once the old socket is closed.
+        """
+        ib, loop = ib_ref
+        ib_ref[:] = [None, None]
+        if ib is None:
+            self._return_pool_client_id(client_id)
+            return
+        threading.Thread(
+            target=self._close_pool_connection,
+            args=(client_id, ib, loop),
+            name=f"ibkr-release-{client_id}",
+            daemon=True,
+        ).start()
+
+    def _close_pool_connection(self, client_id: int, ib: Any, loop: Any) -> None:
+        _close_account_streams(ib)
+        disconnect_on_loop(ib, loop)
+        if loop is not None and not loop.is_running():
+            loop.close()  # Owner thread is gone; free the selector too.
+        self._return_pool_client_id(client_id)
+
+    def _return_pool_client_id(self, client_id: int) -> None:
+        with self._state_lock:
+            self._pool_client_ids.append(client_id)
+
     def get_ib(self, *, budget_user_id: int | None = None):
         """Alias for ensure_connected()."""
         return self.ensure_connected(**self._budget_kwargs(budget_user_id))
@@ -290,9 +420,20 @@ class IBKRConnectionManager:
         """Return managed account IDs discovered from IB Gateway."""
         return list(self._managed_accounts)
 
+    def managed_accounts_for(self, ib) -> List[str]:
+        """Return managed accounts for *ib* without copying when it is the persistent handle.
+
+        The persistent handle's accounts are captured at connect time (the
+        list is swapped, never mutated); other handles are asked directly.
+        """
+        if ib is not None and ib is self._ib:
+            return self._managed_accounts
+        return list(ib.managedAccounts() or [])
+
     @property
     def is_connected(self) -> bool:
-        return self._ib is not None and self._ib.isConnected()
+        ib = self._ib
+        return ib is not None and ib.isConnected()
 
     def get_connection_status(self, *, budget_user_id: int | None = None) -> dict[str, Any]:
         """Return diagnostic dict describing current connection state."""
@@ -334,7 +475,8 @@ class IBKRConnectionManager:
 
     def probe_connection(self, *, budget_user_id: int | None = None) -> dict[str, Any]:
         """Probe whether IB Gateway is reachable via connect + disconnect."""
-        if self._ib is not None and self._ib.isConnected():
+        current = self._ib
+        if current is not None and current.isConnected():
             return {"reachable": True, "managed_accounts": list(self._managed_accounts)}
 
         ib = None
@@ -366,26 +508,44 @@ class IBKRConnectionManager:
             "Connection lost, scheduling reconnect",
             client_id=self._client_id,
         )
-        with self._connect_lock:
-            self._ib = None
-            self._managed_accounts = []
+        with self._state_lock:
+            current = self._ib
+            # Compare-and-clear: a newer, live handle installed by connect() stays.
+            if current is not None and not current.isConnected():
+                self._ib = None
+                self._managed_accounts = []
+            # At most one reconnect worker per manager, however many disconnect events fire.
+            worker = self._reconnect_thread
+            if worker is not None and worker.is_alive():
+                return
+            self._reconnecting = True
+            worker = threading.Thread(
+                target=self._reconnect,
+                name=f"ibkr-reconnect-{self._client_id}",
+                daemon=True,
+            )
+            self._reconnect_thread = worker
+        worker.start()
 
-            if not self._reconnecting:
-                self._reconnecting = True
-                thread = threading.Thread(target=self._reconnect, daemon=True)
-                thread.start()
+    @staticmethod
+    def _reconnect_backoff(attempt: int) -> float:
+        """Delay before reconnect *attempt* (1-based): 0, then exponential + jitter, capped."""
+        if attempt <= 1:
+            return 0.0
+        return min(_RECONNECT_MAX_DELAY, 0.5 * (2 ** (attempt - 2))) + random.uniform(0, 0.25)
 
     def _reconnect(self) -> None:
-        """Background reconnect worker with linear backoff."""
+        """Background reconnect worker: immediate first try, then exponential backoff."""
         try:
             for attempt in range(1, self._max_reconnect_attempts + 1):
-                delay = self._reconnect_delay * attempt
-                log_event(
-                    logger, logging.INFO, "connect.retry",
-                    f"Reconnect in {delay}s",
-                    attempt=attempt, max=self._max_reconnect_attempts,
-                )
-                time.sleep(delay)
+                delay = self._reconnect_backoff(attempt)
+                if delay:
+                    log_event(
+                        logger, logging.INFO, "connect.retry",
+                        f"Reconnect in {delay:.2f}s",
+                        attempt=attempt, max=self._max_reconnect_attempts,
+                    )
+                    time.sleep(delay)
                 try:
                     self.connect(max_attempts=1)
                     log_event(
@@ -402,7 +562,7 @@ class IBKRConnectionManager:
                 attempts=self._max_reconnect_attempts,
             )
         finally:
-            with self._connect_lock:
+            with self._state_lock:
                 self._reconnecting = False
 
 
@@ -2,36 +2,28 @@
 
 from __future__ import annotations
 
-import math
+import copy
 import re
+import sys
 from functools import lru_cache
-from pathlib import Path
 from typing import Any
 
-import yaml
-
-from ._logging import logger
+from ._exchange_mappings import futures_exchanges
 from ._types import InstrumentType, coerce_instrument_type
 
 from .exceptions import IBKRContractError
 
+try:
+    from ib_async import Bond, ContFuture, Forex, Future, Option
+    from ib_async import Contract as _IBContract
+except ImportError:  # pragma: no cover - only non-IBKR paths are usable
+    Bond = ContFuture = Forex = Future = Option = _IBContract = None
+
 Contract = Any
 
-_FX_PAIR_RE = re.compile(r"^[A-Z]{3}[./]?[A-Z]{3}$")
+_NON_ALPHA_RE = re.compile(r"[^A-Z]")
 _CONTRACT_MONTH_RE = re.compile(r"^\d{6}(\d{2})?$")
-
-
-@lru_cache(maxsize=1)
-def _load_ibkr_exchange_mappings() -> dict[str, Any]:
-    path = Path(__file__).resolve().with_name("exchange_mappings.yaml")
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    except FileNotFoundError:
-        logger.warning("IBKR exchange_mappings.yaml not found at %s", path)
-    except Exception as exc:
-        logger.warning("Failed to load IBKR exchange mappings from %s: %s", path, exc)
-    return {}
+_INF = float("inf")
 
 
 def _futures_exchange_meta(symbol: str) -> tuple[str, str]:
@@ -39,89 +31,106 @@ def _futures_exchange_meta(symbol: str) -> tuple[str, str]:
     if not sym:
         raise IBKRContractError("Missing futures symbol")
 
-    mappings = _load_ibkr_exchange_mappings().get("ibkr_futures_exchanges", {})
-    raw = mappings.get(sym)
-    if not isinstance(raw, dict):
-        raise IBKRContractError(f"No IBKR futures exchange mapping configured for '{sym}'")
-
-    exchange = str(raw.get("exchange") or "").strip()
-    currency = str(raw.get("currency") or "USD").strip().upper()
+    exchange, currency = futures_exchanges().get(sym, (None, None))
     if not exchange:
-        raise IBKRContractError(f"Invalid IBKR futures exchange mapping for '{sym}'")
+        raise IBKRContractError(f"No IBKR futures exchange mapping configured for '{sym}'")
     return exchange, currency
 
 
-def resolve_futures_contract(symbol: str, contract_month: str | None = None) -> Contract:
-    """Resolve a futures root symbol into an IBKR continuous futures contract."""
-    try:
-        from ib_async import ContFuture, Future
-    except ImportError:
-        from ib_async import ContFuture
+def _require_ib_async() -> None:
+    if _IBContract is None:
+        raise IBKRContractError("ib_async not installed")
 
-        Future = None
 
-    sym = str(symbol or "").strip().upper()
-    exchange, currency = _futures_exchange_meta(sym)
+@lru_cache(maxsize=4096)
+def _futures_template(sym: str, contract_month: str | None, exchange: str, currency: str) -> Contract:
+    _require_ib_async()
     if contract_month is None:
         return ContFuture(symbol=sym, exchange=exchange, currency=currency)
+    return Future(
+        symbol=sym,
+        lastTradeDateOrContractMonth=contract_month,
+        exchange=exchange,
+        currency=currency,
+    )
 
-    if Future is None:
-        from ib_async import Future
+
+def resolve_futures_contract(symbol: str, contract_month: str | None = None) -> Contract:
+    """Resolve a futures root symbol into an IBKR continuous futures contract."""
+    sym = str(symbol or "").strip().upper()
+    exchange, currency = _futures_exchange_meta(sym)
+    if contract_month is None:
+        return copy.copy(_futures_template(sym, None, exchange, currency))
 
     cm = str(contract_month).strip()
     if not _CONTRACT_MONTH_RE.match(cm):
         raise IBKRContractError(
             f"Invalid futures contract_month '{contract_month}'; expected YYYYMM or YYYYMMDD"
         )
-    return Future(
-        symbol=sym,
-        lastTradeDateOrContractMonth=cm,
-        exchange=exchange,
-        currency=currency,
-    )
+    return copy.copy(_futures_template(sym, cm, exchange, currency))
 
 
+@lru_cache(maxsize=256)
 def _normalize_fx_pair(symbol: str) -> str:
     raw = str(symbol or "").strip().upper()
     if not raw:
         raise IBKRContractError("Missing FX symbol")
 
     # Accept canonical forms like GBP.HKD, GBP/HKD, or GBPHKD.
-    if not _FX_PAIR_RE.match(raw) and len(re.sub(r"[^A-Z]", "", raw)) != 6:
-        raise IBKRContractError(f"Invalid FX symbol '{symbol}'")
-
-    pair = re.sub(r"[^A-Z]", "", raw)
+    pair = _NON_ALPHA_RE.sub("", raw)
     if len(pair) != 6:
         raise IBKRContractError(f"Invalid FX symbol '{symbol}'")
     return pair
 
 
+@lru_cache(maxsize=4096)
+def _fx_template(pair: str) -> Contract:
+    _require_ib_async()
+    return Forex(pair=pair)
+
+
 def resolve_fx_contract(symbol: str) -> Contract:
     """Resolve an FX pair symbol into an IBKR Forex contract."""
-    from ib_async import Forex
-
-    pair = _normalize_fx_pair(symbol)
-    return Forex(pair=pair)
+    return copy.copy(_fx_template(_normalize_fx_pair(symbol)))
 
 
 def _coerce_con_id(contract_identity: dict[str, Any] | None) -> int | None:
     if not isinstance(contract_identity, dict):
         return None
     con_id = contract_identity.get("con_id")
-    if con_id in (None, ""):
+    if type(con_id) is int:
+        return con_id
+    if con_id is None or con_id == "":
         return None
     # Reject non-finite or non-integer float values (e.g., NaN, inf, 123.9)
     if isinstance(con_id, float):
-        if math.isnan(con_id) or math.isinf(con_id):
+        if con_id != con_id or con_id in (_INF, -_INF):
             raise IBKRContractError(f"Invalid con_id '{con_id}' in contract_identity") from None
         if con_id != int(con_id):
             raise IBKRContractError(f"Invalid con_id '{con_id}' in contract_identity (non-integer float)") from None
+        return int(con_id)
     try:
         return int(con_id)
     except (TypeError, ValueError, OverflowError):
         raise IBKRContractError(f"Invalid con_id '{con_id}' in contract_identity") from None
 
 
+@lru_cache(maxsize=4096)
+def _bond_template(con_id: int | None, sec_id_type: str, sec_id: str, currency: str) -> Contract:
+    _require_ib_async()
+    if con_id is not None:
+        try:
+            return Bond(conId=con_id)
+        except Exception:
+            return _IBContract(conId=con_id, secType="BOND")
+
+    bond = Bond()
+    bond.secIdType = sec_id_type
+    bond.secId = sec_id
+    bond.currency = currency
+    return bond
+
+
 def resolve_bond_contract(
     symbol: str,
     contract_identity: dict[str, Any] | None = None,
@@ -134,52 +143,64 @@ def resolve_bond_contract(
         con_id = None  # allow CUSIP fallback when con_id is invalid
 
     if con_id is not None:
-        try:
-            from ib_async import Bond
-
-            return Bond(conId=con_id)
-        except Exception:
-            from ib_async import Contract
-
-            return Contract(conId=con_id, secType="BOND")
+        return copy.copy(_bond_template(con_id, "", "", ""))
 
     identity = contract_identity if isinstance(contract_identity, dict) else {}
-    cusip = identity.get("cusip")
-    if isinstance(cusip, str) and cusip.strip():
-        from ib_async import Bond
-
-        bond = Bond()
-        bond.secIdType = "CUSIP"
-        bond.secId = cusip.strip()
-        bond.currency = str(identity.get("currency") or "USD").upper()
-        return bond
-
-    isin = identity.get("isin")
-    if isinstance(isin, str) and isin.strip():
-        from ib_async import Bond
-
-        bond = Bond()
-        bond.secIdType = "ISIN"
-        bond.secId = isin.strip()
-        bond.currency = str(identity.get("currency") or "USD").upper()
-        return bond
+    for sec_id_type, field in (("CUSIP", "cusip"), ("ISIN", "isin")):
+        sec_id = identity.get(field)
+        if isinstance(sec_id, str) and sec_id.strip():
+            currency = str(identity.get("currency") or "USD").upper()
+            return copy.copy(_bond_template(None, sec_id_type, sec_id.strip(), currency))
 
     raise IBKRContractError(
         "Bond pricing requires contract_identity with con_id, cusip, or isin"
     )
 
 
-_OCC_OPTION_RE = re.compile(r"^([A-Z]{1,6})\s*\d{6,8}[CP]\d+$")
+# OCC option symbol, tolerating whitespace anywhere between its parts.
+_OCC_OPTION_RE = re.compile(r"([A-Z]{1,6})\s*\d{6,8}\s*[CP]\s*\d+")
 
 
+@lru_cache(maxsize=2048)
 def _infer_option_underlying(symbol: str) -> str:
     sym = str(symbol or "").strip().upper()
     if not sym:
         return ""
-    occ_match = _OCC_OPTION_RE.match(re.sub(r"\s+", "", sym))
+    occ_match = _OCC_OPTION_RE.fullmatch(sym)
     if occ_match:
-        return occ_match.group(1)
-    return sym
+        return sys.intern(occ_match.group(1))
+    return sys.intern(sym)
+
+
+@lru_cache(maxsize=4096)
+def _option_template(
+    con_id: int | None,
+    underlying: str = "",
+    expiry: str = "",
+    strike: float = 0.0,
+    right: str = "",
+    exchange: str = "",
+    currency: str = "",
+    multiplier: str | None = None,
+) -> Contract:
+    _require_ib_async()
+    if con_id is not None:
+        try:
+            return Option(conId=con_id)
+        except Exception:
+            return _IBContract(conId=con_id, secType="OPT")
+
+    kwargs: dict[str, Any] = {
+        "symbol": underlying,
+        "lastTradeDateOrContractMonth": expiry,
+        "strike": strike,
+        "right": right,
+        "exchange": exchange,
+        "currency": currency,
+    }
+    if multiplier is not None:
+        kwargs["multiplier"] = multiplier
+    return Option(**kwargs)
 
 
 def resolve_option_contract(symbol: str, contract_identity: dict[str, Any] | None = None) -> Contract:
@@ -187,13 +208,8 @@ def resolve_option_contract(symbol: str, contract_identity: dict[str, Any] | Non
     identity = contract_identity if isinstance(contract_identity, dict) else {}
     con_id = _coerce_con_id(identity)
 
-    from ib_async import Contract, Option
-
     if con_id is not None:
-        try:
-            return Option(conId=con_id)
-        except Exception:
-            return Contract(conId=con_id, secType="OPT")
+        return copy.copy(_option_template(con_id))
 
     expiry = identity.get("expiry")
     strike = identity.get("strike")
@@ -204,27 +220,38 @@ def resolve_option_contract(symbol: str, contract_identity: dict[str, Any] | Non
             "Option pricing requires contract_identity with either con_id or (expiry, strike, right)"
         )
 
-    underlying = str(
-        identity.get("underlying")
-        or identity.get("underlying_symbol")
-        or identity.get("symbol")
-        or _infer_option_underlying(symbol)
-    ).strip().upper()
+    underlying = sys.intern(
+        str(
+            identity.get("underlying")
+            or identity.get("underlying_symbol")
+            or identity.get("symbol")
+            or _infer_option_underlying(symbol)
+        ).strip().upper()
+    )
     if not underlying:
         raise IBKRContractError("Option pricing requires an underlying symbol in contract_identity")
 
-    kwargs: dict[str, Any] = {
-        "symbol": underlying,
-        "lastTradeDateOrContractMonth": str(expiry),
-        "strike": float(strike),
-        "right": right,
-        "exchange": str(identity.get("exchange") or "SMART"),
-        "currency": str(identity.get("currency") or "USD").upper(),
-    }
     multiplier = identity.get("multiplier")
-    if multiplier not in (None, ""):
-        kwargs["multiplier"] = str(multiplier)
-    return Option(**kwargs)
+    return copy.copy(
+        _option_template(
+            None,
+            underlying,
+            str(expiry),
+            float(strike),
+            right,
+            str(identity.get("exchange") or "SMART"),
+            str(identity.get("currency") or "USD").upper(),
+            str(multiplier) if multiplier not in (None, "") else None,
+        )
+    )
+
+
+def _reset_contract_templates_for_tests() -> None:
+    """Drop cached contract templates for test isolation."""
+    _futures_template.cache_clear()
+    _fx_template.cache_clear()
+    _bond_template.cache_clear()
+    _option_template.cache_clear()
 
 
 def resolve_contract(
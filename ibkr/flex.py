@@ -13,18 +13,26 @@ from __future__ import annotations
 import hashlib
 import os
 import importlib
+import logging
 import re
 import time
+import weakref
+import xml.etree.ElementTree as ET
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
 import certifi
-import yaml
 from ibkr._shared.budget_exceptions import BudgetExceededError
 from ib_async import FlexReport
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # optional: stdlib ElementTree is used instead
+    _lxml_etree = None
+
+from ._exchange_mappings import exchange_to_mic as _ibkr_exchange_to_mic
 from ._logging import logger
 from ._budget import guard_ib_call
 from ._types import InstrumentType
@@ -66,6 +74,17 @@ def resolve_ticker_from_exchange(
         _warned_missing_ticker_resolver = True
     return ticker
 
+
+@lru_cache(maxsize=2048)
+def _resolve_ticker_cached(base_symbol: str, currency: str, exchange_mic: str) -> str:
+    """Memoized ``resolve_ticker_from_exchange`` for symbols repeated across a report."""
+    return resolve_ticker_from_exchange(
+        ticker=base_symbol,
+        company_name=None,
+        currency=currency,
+        exchange_mic=exchange_mic,
+    )
+
 # Fix macOS SSL: ib_async's FlexReport uses urllib.request.urlopen which
 # relies on the system SSL context. On macOS, Python's bundled OpenSSL
 # doesn't trust the system certificate store. Setting SSL_CERT_FILE to
@@ -74,19 +93,6 @@ if not os.environ.get("SSL_CERT_FILE"):
     os.environ["SSL_CERT_FILE"] = certifi.where()
 
 
-@lru_cache(maxsize=1)
-def _load_ibkr_exchange_mappings() -> dict[str, Any]:
-    path = Path(__file__).resolve().with_name("exchange_mappings.yaml")
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    except FileNotFoundError:
-        logger.warning("IBKR exchange_mappings.yaml not found at %s", path)
-    except Exception as exc:
-        logger.warning("Failed to load IBKR exchange mappings from %s: %s", path, exc)
-    return {}
-
-
 def _parse_flex_date(date_val: Any) -> Optional[datetime]:
     """Parse Flex date (YYYYMMDD, YYYY-MM-DD, or datetime) to datetime."""
     if not date_val:
@@ -95,39 +101,77 @@ def _parse_flex_date(date_val: Any) -> Optional[datetime]:
         return date_val
     if hasattr(date_val, "year") and hasattr(date_val, "month"):
         return datetime(date_val.year, date_val.month, date_val.day)
-    s = str(date_val).strip().replace("-", "")
+    s = str(date_val).strip()
+    try:
+        if len(s) == 8 and s.isdigit():
+            return datetime(int(s[:4]), int(s[4:6]), int(s[6:8]))
+        if s[4:5] == "-":
+            # ISO date, optionally followed by a time; only the date is kept.
+            return datetime.fromisoformat(s[:10])
+    except ValueError:
+        pass
     try:
-        return datetime.strptime(s[:8], "%Y%m%d")
+        return datetime.strptime(s.replace("-", "")[:8], "%Y%m%d")
     except (ValueError, TypeError):
         return None
 
 
+_MISSING = object()
+
+
 def _get_attr(obj: Any, *names: str, default: Any = None) -> Any:
     """Read first available attribute/key from object or dict."""
+    if isinstance(obj, dict):
+        for name in names:
+            value = obj.get(name, _MISSING)
+            if value is not _MISSING:
+                return value
+        return default
     for name in names:
-        if isinstance(obj, dict) and name in obj:
-            return obj.get(name)
-        if hasattr(obj, name):
-            return getattr(obj, name)
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            return value
     return default
 
 
+def _clean_upper(value: Any) -> str:
+    """``str(value or "").strip().upper()`` that reuses already-clean strings."""
+    if not value:
+        return ""
+    text = (value if type(value) is str else str(value)).strip()
+    return text if text.isupper() else text.upper()
+
+
+_EXPIRY_FORMATS = ("%Y-%m-%d", "%Y%m%d", "%m/%d/%Y", "%m/%d/%y", "%Y/%m/%d")
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
 def _format_expiry(expiry: Any) -> str:
     """Format expiry into YYMMDD when possible."""
     if isinstance(expiry, datetime):
         return expiry.strftime("%y%m%d")
+    return _format_expiry_str(str(expiry or "").strip())
+
 
-    raw = str(expiry or "").strip()
+@lru_cache(maxsize=4096)
+def _format_expiry_str(raw: str) -> str:
     if not raw:
         return ""
 
-    for fmt in ("%Y-%m-%d", "%Y%m%d", "%m/%d/%Y", "%m/%d/%y", "%Y/%m/%d"):
+    if len(raw) == 8 and raw.isdigit():
+        try:
+            datetime(int(raw[:4]), int(raw[4:6]), int(raw[6:]))
+        except ValueError:
+            return raw
+        return raw[2:]
+
+    for fmt in _EXPIRY_FORMATS:
         try:
             return datetime.strptime(raw[:10], fmt).strftime("%y%m%d")
         except ValueError:
             continue
 
-    digits = "".join(ch for ch in raw if ch.isdigit())
+    digits = _NON_DIGIT_RE.sub("", raw)
     if len(digits) >= 8:
         try:
             return datetime.strptime(digits[:8], "%Y%m%d").strftime("%y%m%d")
@@ -145,11 +189,11 @@ def _build_option_symbol(
     expiry: Any,
 ) -> str:
     """Build canonical option symbol: UNDERLYING_{C|P}{strike}_{YYMMDD}."""
-    underlying_str = str(underlying or "").strip().upper()
+    underlying_str = _clean_upper(underlying)
     if not underlying_str:
         return ""
 
-    put_call_str = str(put_call or "").strip().upper()
+    put_call_str = _clean_upper(put_call)
     if put_call_str.startswith("C"):
         option_type = "C"
     elif put_call_str.startswith("P"):
@@ -158,37 +202,53 @@ def _build_option_symbol(
         return underlying_str
 
     try:
-        strike_str = normalize_strike(strike)
-    except Exception:
+        strike_expiry = _option_strike_expiry(strike, expiry)
+    except TypeError:  # unhashable raw values
+        strike_expiry = _option_strike_expiry.__wrapped__(strike, expiry)
+    if strike_expiry is None:
         return underlying_str
 
+    strike_str, expiry_str = strike_expiry
+    return f"{underlying_str}_{option_type}{strike_str}_{expiry_str}"
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _option_strike_expiry(strike: Any, expiry: Any) -> Optional[tuple[str, str]]:
+    """Formatted (strike, YYMMDD expiry) for an option symbol, or None if either is unusable."""
+    try:
+        strike_str = normalize_strike(strike)
+    except Exception:
+        return None
     expiry_str = _format_expiry(expiry)
     if not expiry_str:
-        return underlying_str
+        return None
+    return strike_str, expiry_str
 
-    return f"{underlying_str}_{option_type}{strike_str}_{expiry_str}"
+
+# (side, open/close prefix) -> FIFO trade type; "" = no or unrecognized open/close.
+_TRADE_TYPE_TABLE = {
+    ("BUY", "O"): "BUY",
+    ("SELL", "O"): "SHORT",
+    ("BUY", "C"): "COVER",
+    ("SELL", "C"): "SELL",
+    ("BUY", ""): "BUY",
+    ("SELL", ""): "SELL",
+}
+_EQUITY_CATEGORIES = frozenset({"STK", "ETF", "EQUITY"})
+# Categories whose rows never carry expiry/strike/right (everything else may).
+_NON_DERIVATIVE_CATEGORIES = _EQUITY_CATEGORIES | {"CASH"}
 
 
 def _map_trade_type(buy_sell: Any, open_close: Any) -> Optional[str]:
     """Map IBKR Flex buy/sell + open/close values to FIFO trade types."""
-    side = str(buy_sell or "").strip().upper()
-    oc = str(open_close or "").strip().upper()
-
-    if side not in {"BUY", "SELL"}:
-        return None
-
-    if oc:
-        if oc.startswith("O"):
-            return "BUY" if side == "BUY" else "SHORT"
-        if oc.startswith("C"):
-            return "COVER" if side == "BUY" else "SELL"
-
-    return "BUY" if side == "BUY" else "SELL"
+    side = _clean_upper(buy_sell)
+    oc = str(open_close or "").strip()[:1].upper()
+    return _TRADE_TYPE_TABLE.get((side, oc if oc in ("O", "C") else ""))
 
 
 def _map_instrument_type(asset_category: Any) -> InstrumentType:
     """Map IBKR Flex asset category to internal instrument type."""
-    category = str(asset_category or "").strip().upper()
+    category = _clean_upper(asset_category)
     if category == "OPT":
         return "option"
     if category == "FUT":
@@ -197,12 +257,14 @@ def _map_instrument_type(asset_category: Any) -> InstrumentType:
         return "bond"
     if category == "CASH":
         return "fx_artifact"
-    if category in {"STK", "ETF", "EQUITY"}:
+    if category in _EQUITY_CATEGORIES:
         return "equity"
     return "unknown"
 
 
 def _to_int_or_none(value: Any) -> Optional[int]:
+    if type(value) is int:
+        return value
     try:
         return int(float(value))
     except Exception:
@@ -210,6 +272,10 @@ def _to_int_or_none(value: Any) -> Optional[int]:
 
 
 def _to_float_or_none(value: Any) -> Optional[float]:
+    if type(value) is float:
+        return value if value == value else None
+    if type(value) is int:
+        return float(value)
     if value is None or str(value).strip() == "":
         return None
     out = safe_float(value, float("nan"))
@@ -219,45 +285,72 @@ def _to_float_or_none(value: Any) -> Optional[float]:
 
 
 def _normalize_contract_expiry(expiry: Any) -> Optional[str]:
-    parsed = _parse_flex_date(expiry)
+    if not expiry:
+        return None
+    if hasattr(expiry, "year") and hasattr(expiry, "month"):
+        return _parse_flex_date(expiry).strftime("%Y%m%d")
+    return _normalize_contract_expiry_str(str(expiry).strip())
+
+
+@lru_cache(maxsize=4096)
+def _normalize_contract_expiry_str(raw: str) -> Optional[str]:
+    parsed = _parse_flex_date(raw)
     if parsed is not None:
         return parsed.strftime("%Y%m%d")
-    raw = str(expiry or "").strip()
     if not raw:
         return None
-    digits = "".join(ch for ch in raw if ch.isdigit())
+    digits = _NON_DIGIT_RE.sub("", raw)
     if len(digits) >= 8:
         return digits[:8]
     return None
 
 
-def _build_contract_identity(trade: Any) -> Optional[Dict[str, Any]]:
-    """Build optional contract identity from Flex fields when available."""
+def _build_contract_identity(
+    trade: Any,
+    fields: Optional[Dict[str, Any]] = None,
+    *,
+    derivative: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """Build optional contract identity from Flex fields when available.
+
+    ``fields`` may carry raw values the caller already read (keyed by the
+    primary Flex attribute name); missing keys are read from ``trade``.
+    With ``derivative=False`` (equity/FX rows) expiry, strike and right are
+    not read.
+    """
+    fields = fields or {}
+
+    def _field(name: str, *aliases: str) -> Any:
+        if name in fields:
+            return fields[name]
+        return _get_attr(trade, name, *aliases)
+
     contract_identity: Dict[str, Any] = {}
 
-    con_id = _to_int_or_none(_get_attr(trade, "conid", "conId"))
+    con_id = _to_int_or_none(_field("conid", "conId"))
     if con_id is not None:
         contract_identity["con_id"] = con_id
 
-    expiry = _normalize_contract_expiry(_get_attr(trade, "expiry", "expirationDate"))
-    if expiry:
-        contract_identity["expiry"] = expiry
+    if derivative:
+        expiry = _normalize_contract_expiry(_field("expiry", "expirationDate"))
+        if expiry:
+            contract_identity["expiry"] = expiry
 
-    strike = _to_float_or_none(_get_attr(trade, "strike"))
-    if strike is not None:
-        contract_identity["strike"] = strike
+        strike = _to_float_or_none(_field("strike"))
+        if strike is not None:
+            contract_identity["strike"] = strike
 
-    right_raw = str(_get_attr(trade, "putCall", "right", default="") or "").strip().upper()
-    if right_raw.startswith("C"):
-        contract_identity["right"] = "C"
-    elif right_raw.startswith("P"):
-        contract_identity["right"] = "P"
+        right_raw = _clean_upper(_field("putCall", "right"))
+        if right_raw.startswith("C"):
+            contract_identity["right"] = "C"
+        elif right_raw.startswith("P"):
+            contract_identity["right"] = "P"
 
-    multiplier = _to_float_or_none(_get_attr(trade, "multiplier"))
+    multiplier = _to_float_or_none(_field("multiplier"))
     if multiplier is not None:
         contract_identity["multiplier"] = multiplier
 
-    exchange = str(_get_attr(trade, "exchange", default="") or "").strip().upper()
+    exchange = _clean_upper(_field("exchange"))
     if exchange:
         contract_identity["exchange"] = exchange
 
@@ -273,58 +366,85 @@ def normalize_flex_trades(flex_trades: Iterable[Any]) -> List[Dict[str, Any]]:
     - Unmappable rows are skipped with warning rather than raising.
     """
     normalized: List[Dict[str, Any]] = []
-    exchange_mappings = _load_ibkr_exchange_mappings()
-    ibkr_exchange_to_mic = {
-        str(exchange).strip().upper(): str(mic).strip().upper()
-        for exchange, mic in (exchange_mappings.get("ibkr_exchange_to_mic", {}) or {}).items()
-        if str(exchange).strip() and str(mic).strip()
-    }
+
+    # Loop-invariant lookups bound to locals; this loop runs once per Flex row.
+    get_attr = _get_attr
+    parse_date = _parse_flex_date
+    map_trade_type = _map_trade_type
+    to_float = safe_float
+    warn = logger.warning
+    # Checked once per call; skipped-row diagnostics are not built when off.
+    warn_enabled = logger.isEnabledFor(logging.WARNING)
+    exchange_to_mic = _ibkr_exchange_to_mic().get
 
     for trade in flex_trades:
-        trade_type = _map_trade_type(
-            _get_attr(trade, "buySell", "side", "tradeType"),
-            _get_attr(trade, "openCloseIndicator", "openClose"),
-        )
+        raw_side = get_attr(trade, "buySell", "side", "tradeType")
+        raw_open_close = get_attr(trade, "openCloseIndicator", "openClose")
+        trade_type = map_trade_type(raw_side, raw_open_close)
         if trade_type is None:
-            logger.warning(
-                "Skipping Flex trade with unmappable side/open-close: buySell=%s openClose=%s",
-                _get_attr(trade, "buySell", "side", "tradeType"),
-                _get_attr(trade, "openCloseIndicator", "openClose"),
-            )
+            if warn_enabled:
+                warn(
+                    "Skipping Flex trade with unmappable side/open-close: buySell=%s openClose=%s",
+                    raw_side,
+                    raw_open_close,
+                )
             continue
 
-        trade_date = _parse_flex_date(_get_attr(trade, "tradeDate", "dateTime", "date"))
+        trade_date = parse_date(get_attr(trade, "tradeDate", "dateTime", "date"))
         if trade_date is None:
-            logger.warning("Skipping Flex trade with invalid date: %s", trade)
+            if warn_enabled:
+                warn("Skipping Flex trade with invalid date: %s", trade)
             continue
 
-        asset_category = str(_get_attr(trade, "assetCategory", "assetClass", default="")).upper()
+        asset_category = str(get_attr(trade, "assetCategory", "assetClass", default="")).upper()
         instrument_type = _map_instrument_type(asset_category)
-        contract_identity = _build_contract_identity(trade)
-        multiplier = safe_float(_get_attr(trade, "multiplier", default=1.0), 1.0)
-        if multiplier <= 0:
-            multiplier = 1.0
         is_option = asset_category == "OPT"
         is_futures = asset_category == "FUT"
+        is_derivative = asset_category not in _NON_DERIVATIVE_CATEGORIES
+
+        # Read each contract field once; they feed the symbol, the contract
+        # identity and the STK exchange lookup below.
+        if is_derivative:
+            raw_put_call = get_attr(trade, "putCall", "right")
+            raw_strike = get_attr(trade, "strike")
+            raw_expiry = get_attr(trade, "expiry", "expirationDate")
+        else:
+            raw_put_call = raw_strike = raw_expiry = None
+        raw_multiplier = get_attr(trade, "multiplier")
+        raw_exchange = get_attr(trade, "exchange")
+        raw_underlying = get_attr(trade, "underlyingSymbol", "underlying")
+        currency = str(get_attr(trade, "currency", default="USD") or "USD").upper()
+
+        contract_identity = _build_contract_identity(
+            trade,
+            {
+                "putCall": raw_put_call,
+                "strike": raw_strike,
+                "expiry": raw_expiry,
+                "multiplier": raw_multiplier,
+                "exchange": raw_exchange,
+            },
+            derivative=is_derivative,
+        )
+        multiplier = to_float(raw_multiplier, 1.0)
+        if multiplier <= 0:
+            multiplier = 1.0
 
-        symbol = str(_get_attr(trade, "symbol", default="") or "").strip().upper()
-        underlying = str(
-            _get_attr(trade, "underlyingSymbol", "underlying", default=symbol) or symbol
-        ).strip().upper()
+        symbol = _clean_upper(get_attr(trade, "symbol", default=""))
+        underlying = _clean_upper(raw_underlying or symbol)
 
         if is_option:
             built = _build_option_symbol(
                 underlying=underlying,
-                put_call=_get_attr(trade, "putCall", "right"),
-                strike=_get_attr(trade, "strike"),
-                expiry=_get_attr(trade, "expiry", "expirationDate"),
+                put_call=raw_put_call,
+                strike=raw_strike,
+                expiry=raw_expiry,
             )
             symbol = built or symbol or underlying
         elif is_futures:
             symbol = underlying
-            raw_underlying = _get_attr(trade, "underlyingSymbol", "underlying")
-            if not raw_underlying or str(raw_underlying).strip() == "":
-                logger.warning(
+            if warn_enabled and (not raw_underlying or str(raw_underlying).strip() == ""):
+                warn(
                     "FUT trade missing underlyingSymbol; using raw symbol %s "
                     "(may not match FMP mapping)",
                     symbol,
@@ -332,59 +452,56 @@ def normalize_flex_trades(flex_trades: Iterable[Any]) -> List[Dict[str, Any]]:
         else:
             symbol = symbol or underlying
             if asset_category == "STK":
-                exchange_code = str(_get_attr(trade, "exchange", default="") or "").strip().upper()
-                exchange_mic = ibkr_exchange_to_mic.get(exchange_code)
+                exchange_code = _clean_upper(raw_exchange)
+                exchange_mic = exchange_to_mic(exchange_code)
                 if not exchange_mic:
-                    listing_exchange = str(_get_attr(trade, "listingExchange", default="") or "").strip().upper()
-                    exchange_mic = ibkr_exchange_to_mic.get(listing_exchange)
+                    listing_exchange = _clean_upper(get_attr(trade, "listingExchange", default=""))
+                    exchange_mic = exchange_to_mic(listing_exchange)
                 if exchange_mic:
                     # IBKR can report trailing-dot symbols (e.g., "AT."); strip before suffix resolution.
                     base_symbol = symbol.rstrip(".")
                     if base_symbol:
-                        symbol = resolve_ticker_from_exchange(
-                            ticker=base_symbol,
-                            company_name=None,
-                            currency=str(_get_attr(trade, "currency", default="USD") or "USD").upper(),
-                            exchange_mic=exchange_mic,
+                        symbol = _resolve_ticker_cached(
+                            base_symbol,
+                            currency,
+                            exchange_mic,
                         )
 
-        quantity = abs(safe_float(_get_attr(trade, "quantity", "qty"), 0.0))
+        raw_qty = abs(to_float(get_attr(trade, "quantity", "qty"), 0.0))
+        quantity = raw_qty
         if is_futures and multiplier != 1:
             quantity = quantity * multiplier
         if quantity <= 0:
-            logger.warning("Skipping Flex trade with non-positive quantity: %s", trade)
+            if warn_enabled:
+                warn("Skipping Flex trade with non-positive quantity: %s", trade)
             continue
 
-        trade_price = safe_float(_get_attr(trade, "tradePrice", "price"), 0.0)
+        trade_price = to_float(get_attr(trade, "tradePrice", "price"), 0.0)
         price = trade_price * multiplier if is_option and multiplier > 1 else trade_price
         fee = abs(
-            safe_float(
-                _get_attr(trade, "ibCommission", "commission", "commissionAmount"),
+            to_float(
+                get_attr(trade, "ibCommission", "commission", "commissionAmount"),
                 0.0,
             )
         ) + abs(
-            safe_float(
-                _get_attr(trade, "taxes"),
+            to_float(
+                get_attr(trade, "taxes"),
                 0.0,
             )
         )
         broker_cost_basis = None
         broker_pnl = None
-        open_close = str(
-            _get_attr(trade, "openCloseIndicator", "openClose", default="") or ""
-        ).upper()
+        open_close = str(raw_open_close or "").upper()
         if trade_type in ("SELL", "COVER") and open_close != "O" and not is_futures:
-            raw_cost = safe_float(_get_attr(trade, "cost"), 0.0)
-            raw_qty = abs(safe_float(_get_attr(trade, "quantity", "qty"), 0.0))
+            raw_cost = to_float(get_attr(trade, "cost"), 0.0)
             if abs(raw_cost) > 0 and raw_qty > 0:
                 broker_cost_basis = abs(raw_cost) / raw_qty
-            raw_pnl = safe_float(_get_attr(trade, "fifoPnlRealized"), 0.0)
+            raw_pnl = to_float(get_attr(trade, "fifoPnlRealized"), 0.0)
             if raw_pnl != 0:
                 broker_pnl = float(raw_pnl)
 
-        currency = str(_get_attr(trade, "currency", default="USD") or "USD").upper()
-        account_id = str(_get_attr(trade, "accountId", "accountID", default="") or "")
-        raw_code = str(_get_attr(trade, "code", "notes", default="") or "").strip()
+        account_id = str(get_attr(trade, "accountId", "accountID", default="") or "")
+        raw_code = str(get_attr(trade, "code", "notes", default="") or "").strip()
         code_parts = {p.strip().upper() for p in raw_code.split(";") if p.strip()}
 
         _has_exercise_token = any(
@@ -395,7 +512,7 @@ def normalize_flex_trades(flex_trades: Iterable[Any]) -> List[Dict[str, Any]]:
         is_exercise = _has_exercise_token and not _has_assignment_token
         is_assignment = _has_assignment_token
         is_exercise_or_assignment = is_exercise or is_assignment
-        trade_id = _get_attr(trade, "tradeID", "transactionID", "execID")
+        trade_id = get_attr(trade, "tradeID", "transactionID", "execID")
         if trade_id is None or str(trade_id).strip() == "":
             trade_id = f"row_{len(normalized)}"
 
@@ -452,7 +569,7 @@ def normalize_flex_prior_positions(
     result: List[Dict[str, Any]] = []
 
     for row in rows:
-        row_dict = _row_to_dict(row)
+        row_dict = _row_to_dict(row, copy=False)
         asset_cat = str(row_dict.get("assetCategory", "")).upper()
         if asset_cat != "OPT":
             continue
@@ -513,35 +630,61 @@ def _as_bool(value: Any) -> bool:
 
 
 def _parse_cash_amount(value: Any, *, default: float = 0.0) -> float:
+    if type(value) is float:
+        return value if value == value else default
     parsed = safe_float(value, default)
     if parsed != parsed:  # NaN check
         return default
     return float(parsed)
 
 
-def _report_window(report: Any) -> tuple[datetime | None, datetime | None]:
+_ReportScan = tuple[set[str], Optional[datetime], Optional[datetime]]
+# report -> (root it was scanned from, (tags with attributes, fromDate, toDate))
+_report_scans: weakref.WeakKeyDictionary[Any, tuple[Any, _ReportScan]] = weakref.WeakKeyDictionary()
+
+
+def _scan_report_root(report: Any) -> _ReportScan:
+    """Walk the report XML once, collecting attributed tags and the statement window."""
     root = getattr(report, "root", None)
     if root is None:
-        return None, None
-    for node in root.iter("FlexStatement"):
-        if not getattr(node, "attrib", None):
+        return set(), None, None
+    try:
+        cached = _report_scans.get(report)
+    except TypeError:
+        cached = None
+    if cached is not None and cached[0] is root:
+        return cached[1]
+
+    tags: set[str] = set()
+    start = end = None
+    window_seen = False
+    for node in root.iter():
+        attrib = getattr(node, "attrib", None)
+        if not attrib:
             continue
-        start = _parse_flex_date(node.attrib.get("fromDate"))
-        end = _parse_flex_date(node.attrib.get("toDate"))
-        return start, end
-    return None, None
+        tag = str(node.tag)
+        tags.add(tag)
+        if not window_seen and tag == "FlexStatement":
+            window_seen = True
+            start = _parse_flex_date(attrib.get("fromDate"))
+            end = _parse_flex_date(attrib.get("toDate"))
+
+    result = (tags, start, end)
+    try:
+        _report_scans[report] = (root, result)
+    except TypeError:
+        pass
+    return result
+
+
+def _report_window(report: Any) -> tuple[datetime | None, datetime | None]:
+    _, start, end = _scan_report_root(report)
+    return start, end
 
 
 def _report_topics(report: Any) -> set[str]:
     def _topics_from_root() -> set[str]:
-        root = getattr(report, "root", None)
-        if root is None:
-            return set()
-        return {
-            str(node.tag)
-            for node in root.iter()
-            if getattr(node, "attrib", None)
-        }
+        return set(_scan_report_root(report)[0])
 
     try:
         raw = report.topics()
@@ -556,12 +699,13 @@ def _report_topics(report: Any) -> set[str]:
     return _topics_from_root()
 
 
-def _row_to_dict(row: Any) -> Dict[str, Any]:
+def _row_to_dict(row: Any, *, copy: bool = True) -> Dict[str, Any]:
+    """Return ``row`` as a dict; ``copy=False`` may return the row's own mapping."""
     if isinstance(row, dict):
-        return dict(row)
+        return dict(row) if copy else row
     payload = getattr(row, "__dict__", None)
     if isinstance(payload, dict):
-        return dict(payload)
+        return dict(payload) if copy else payload
     try:
         return dict(row)
     except Exception:
@@ -577,11 +721,13 @@ def _extract_rows(report: Any, topic: str) -> list[dict[str, Any]]:
     except Exception as exc:
         logger.warning("Failed to parse IBKR Flex %s rows: %s", topic, exc)
         return []
-    return [_row_to_dict(row) for row in rows]
+    # extract() builds fresh row objects on every call, so their __dict__ can be
+    # handed out without a copy.
+    return [_row_to_dict(row, copy=False) for row in rows]
 
 
 def _normalize_flex_currency(value: Any) -> str:
-    text = str(value or "").strip().upper()
+    text = _clean_upper(value)
     if len(text) == 3 and text.isalpha():
         return text
     return "USD"
@@ -595,7 +741,7 @@ def _load_futures_root_symbols() -> tuple[str, ...]:
         specs = load_contract_specs()
         roots = sorted(
             (
-                str(symbol or "").strip().upper()
+                _clean_upper(symbol)
                 for symbol in (specs or {}).keys()
                 if str(symbol or "").strip()
             ),
@@ -608,7 +754,7 @@ def _load_futures_root_symbols() -> tuple[str, ...]:
 
 
 def _strip_futures_contract_month(raw_symbol: Any) -> str:
-    symbol = str(raw_symbol or "").strip().upper()
+    symbol = _clean_upper(raw_symbol)
     if not symbol:
         return ""
 
@@ -629,22 +775,29 @@ def _strip_futures_contract_month(raw_symbol: Any) -> str:
     return compact
 
 
+# Map human-readable Flex XML type strings to canonical enum codes.
+_READABLE_TO_ENUM: dict[str, str] = {
+    "DEPOSITS & WITHDRAWALS": "DEPOSITWITHDRAW",
+    "DEPOSITS/WITHDRAWALS": "DEPOSITWITHDRAW",
+    "BROKER INTEREST PAID": "BROKERINTPAID",
+    "BROKER INTEREST RECEIVED": "BROKERINTRCVD",
+    "BOND INTEREST PAID": "BONDINTPAID",
+    "BOND INTEREST RECEIVED": "BONDINTRCVD",
+    "OTHER FEES": "FEES",
+    "COMMISSION ADJUSTMENTS": "COMMADJ",
+    "ADVISOR FEES": "ADVISORFEES",
+    "DIVIDENDS": "DIVIDEND",
+    "PAYMENT IN LIEU OF DIVIDENDS": "PAYMENTINLIEU",
+    "WITHHOLDING TAX": "WHTAX",
+}
+
+
+_FEE_TYPES = frozenset({"FEES", "COMMADJ", "ADVISORFEES"})
+_DIVIDEND_TYPES = frozenset({"DIVIDEND", "PAYMENTINLIEU"})
+_INTEREST_TYPES = frozenset({"BROKERINTRCVD", "BONDINTRCVD", "BROKERINTPAID", "BONDINTPAID"})
+
+
 def _canonical_cash_type(raw_type: str) -> str:
-    # Map human-readable Flex XML type strings to canonical enum codes.
-    _READABLE_TO_ENUM: dict[str, str] = {
-        "DEPOSITS & WITHDRAWALS": "DEPOSITWITHDRAW",
-        "DEPOSITS/WITHDRAWALS": "DEPOSITWITHDRAW",
-        "BROKER INTEREST PAID": "BROKERINTPAID",
-        "BROKER INTEREST RECEIVED": "BROKERINTRCVD",
-        "BOND INTEREST PAID": "BONDINTPAID",
-        "BOND INTEREST RECEIVED": "BONDINTRCVD",
-        "OTHER FEES": "FEES",
-        "COMMISSION ADJUSTMENTS": "COMMADJ",
-        "ADVISOR FEES": "ADVISORFEES",
-        "DIVIDENDS": "DIVIDEND",
-        "PAYMENT IN LIEU OF DIVIDENDS": "PAYMENTINLIEU",
-        "WITHHOLDING TAX": "WHTAX",
-    }
     return _READABLE_TO_ENUM.get(raw_type, raw_type)
 
 
@@ -658,12 +811,7 @@ def _cash_classification(raw_type: str, amount: float) -> tuple[str, bool, float
             return "withdrawal", True, -abs(amount), True
         return "transfer", False, 0.0, False
 
-    fee_types = {
-        "FEES",
-        "COMMADJ",
-        "ADVISORFEES",
-    }
-    if canonical in fee_types:
+    if canonical in _FEE_TYPES:
         return "fee", False, -abs(amount), False
 
     if "TRANSFER" in canonical:
@@ -676,9 +824,9 @@ def _cash_classification(raw_type: str, amount: float) -> tuple[str, bool, float
 
 def _income_trade_type_for_cash_type(raw_type: str) -> str:
     canonical = _canonical_cash_type(raw_type)
-    if canonical in {"DIVIDEND", "PAYMENTINLIEU"}:
+    if canonical in _DIVIDEND_TYPES:
         return "DIVIDEND"
-    if canonical in {"BROKERINTRCVD", "BONDINTRCVD", "BROKERINTPAID", "BONDINTPAID"}:
+    if canonical in _INTEREST_TYPES:
         return "INTEREST"
     return ""
 
@@ -738,7 +886,7 @@ def _should_filter_non_detail(raw_rows: Iterable[dict[str, Any]]) -> bool:
     SUMMARY (abnormal Flex config), keep everything to avoid data loss.
     """
     for row in raw_rows:
-        lod = str(row.get("levelOfDetail") or "").strip().upper()
+        lod = _clean_upper(row.get("levelOfDetail"))
         if lod == "DETAIL":
             return True
     return False
@@ -823,11 +971,11 @@ def normalize_flex_cash_income_trades(
     normalized: list[dict[str, Any]] = []
 
     for row in raw_cash_rows_list:
-        trade_type = _income_trade_type_for_cash_type(str(row.get("type") or "").strip().upper())
+        trade_type = _income_trade_type_for_cash_type(_clean_upper(row.get("type")))
         if not trade_type:
             continue
 
-        lod = str(row.get("levelOfDetail") or "").strip().upper()
+        lod = _clean_upper(row.get("levelOfDetail"))
         if _filter_lod and lod and lod != "DETAIL":
             continue
         account_id = _normalize_identifier(row.get("accountId") or row.get("accountID"))
@@ -848,7 +996,7 @@ def normalize_flex_cash_income_trades(
         if amount == 0.0:
             continue
 
-        symbol = str(row.get("symbol") or "").strip().upper()
+        symbol = _clean_upper(row.get("symbol"))
         if not symbol:
             desc = str(row.get("description") or "").strip()
             if "(" in desc:
@@ -901,29 +1049,20 @@ def normalize_flex_cash_income_trades(
         event_dt = _parse_flex_date(row.get("date"))
         segment_key = (
             event_dt.date().isoformat() if event_dt is not None else "",
-            str(row.get("symbol") or "").strip().upper(),
-            str(row.get("type") or "").strip().upper(),
+            _clean_upper(row.get("symbol")),
+            _clean_upper(row.get("type")),
             round(_parse_cash_amount(row.get("amount"), default=0.0), 8),
             _normalize_flex_currency(row.get("currency")),
         )
         segment_grouped.setdefault(segment_key, []).append(row)
 
-    segment_deduped = [
-        _select_dedup_winner(rows, synthetic_prefixes=("income:",))
-        for rows in segment_grouped.values()
-    ]
-
     # Pass 2: cross-currency dedup — same event in HKD and USD → keep base currency.
+    # The currency key (day, symbol, type) is the segment key's prefix.
     normalized_base_currency = _normalize_flex_currency(base_currency)
     cross_currency_grouped: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
-    for row in segment_deduped:
-        event_dt = _parse_flex_date(row.get("date"))
-        currency_key = (
-            event_dt.date().isoformat() if event_dt is not None else "",
-            str(row.get("symbol") or "").strip().upper(),
-            str(row.get("type") or "").strip().upper(),
-        )
-        cross_currency_grouped.setdefault(currency_key, []).append(row)
+    for segment_key, rows in segment_grouped.items():
+        winner = _select_dedup_winner(rows, synthetic_prefixes=("income:",))
+        cross_currency_grouped.setdefault(segment_key[:3], []).append(winner)
 
     normalized = []
     for grouped_rows in cross_currency_grouped.values():
@@ -931,7 +1070,7 @@ def normalize_flex_cash_income_trades(
 
     normalized.sort(
         key=lambda row: (
-            _parse_flex_date(row.get("date")) or datetime.min,
+            row.get("date") or datetime.min,
             str(row.get("transaction_id") or ""),
             str(row.get("account_id") or ""),
         )
@@ -952,7 +1091,7 @@ def normalize_flex_futures_mtm(
         if not isinstance(row, dict):
             continue
 
-        asset_category = str(row.get("assetCategory") or row.get("assetClass") or "").strip().upper()
+        asset_category = _clean_upper(row.get("assetCategory") or row.get("assetClass"))
         if asset_category != "FUT":
             continue
 
@@ -983,7 +1122,7 @@ def normalize_flex_futures_mtm(
             or row.get("accountName")
         )
         provider_account_ref = _normalize_identifier(row.get("accountAlias"))
-        raw_symbol = str(row.get("symbol") or "").strip().upper()
+        raw_symbol = _clean_upper(row.get("symbol"))
 
         dedup_key = (
             account_id or "",
@@ -1051,7 +1190,7 @@ def normalize_flex_futures_mtm(
 
     normalized.sort(
         key=lambda row: (
-            _parse_flex_date(row.get("date")) or datetime.min,
+            row.get("date") or datetime.min,
             str(row.get("transaction_id") or ""),
             str(row.get("account_id") or ""),
         )
@@ -1070,63 +1209,80 @@ def _transfer_classification(direction: str, amount: float) -> tuple[str, bool,
 
 
 def _build_overlap_key(row: dict[str, Any]) -> tuple[str, str, str, str, str, float, str]:
-    event_dt = _parse_flex_date(row.get("event_datetime") or row.get("date"))
-    event_day = event_dt.date().isoformat() if event_dt is not None else ""
-    amount = abs(_parse_cash_amount(row.get("amount"), default=0.0))
-    account_identity = (
-        _normalize_identifier(row.get("account_id"))
-        or _normalize_identifier(row.get("provider_account_ref"))
-        or _normalize_identifier(row.get("account_name"))
-        or "unknown"
-    )
+    get = row.get
+    event_dt = get("event_datetime") or get("date")
+    if not isinstance(event_dt, datetime):
+        event_dt = _parse_flex_date(event_dt)
+    account_identity = "unknown"
+    for field in ("account_id", "provider_account_ref", "account_name"):
+        text = str(get(field) or "").strip()
+        if text:
+            account_identity = text
+            break
     return (
         "ibkr_flex",
-        str(row.get("institution") or "ibkr").strip().lower() or "ibkr",
+        str(get("institution") or "ibkr").strip().lower() or "ibkr",
         account_identity,
-        event_day,
-        _normalize_flex_currency(row.get("currency")),
-        round(amount, 8),
-        str(row.get("flow_type") or "").strip().lower(),
+        event_dt.date().isoformat() if event_dt is not None else "",
+        _normalize_flex_currency(get("currency")),
+        round(abs(_parse_cash_amount(get("amount"), default=0.0)), 8),
+        str(get("flow_type") or "").strip().lower(),
     )
 
 
+_DATE_KEYS = ("dateTime", "date", "reportDate")
+
+
+def _first_date_value(get: Any) -> Any:
+    """Return the first truthy Flex date field via the row's ``get``."""
+    value = None
+    for key in _DATE_KEYS:
+        value = get(key)
+        if value:
+            break
+    return value
+
+
 def _normalize_cash_transaction_row(
     raw_row: dict[str, Any],
     row_index: int,
     *,
     filter_non_detail: bool = False,
 ) -> dict[str, Any]:
-    amount = _parse_cash_amount(raw_row.get("amount"), default=0.0)
-    raw_type = str(raw_row.get("type") or "").strip().upper()
+    get = raw_row.get
+    normalize_identifier = _normalize_identifier
+    amount = _parse_cash_amount(get("amount"), default=0.0)
+    raw_type = _clean_upper(get("type"))
     flow_type, is_external, signed_amount, transfer_cash_confirmed = _cash_classification(raw_type, amount)
     if not flow_type or signed_amount == 0.0:
         return {}
 
-    event_dt = _parse_flex_date(raw_row.get("dateTime") or raw_row.get("date") or raw_row.get("reportDate"))
+    event_dt = _parse_flex_date(_first_date_value(get))
     if event_dt is None:
         return {}
 
-    account_id = _normalize_identifier(raw_row.get("accountId") or raw_row.get("accountID"))
-    lod = str(raw_row.get("levelOfDetail") or "").strip().upper()
+    account_id = normalize_identifier(get("accountId") or get("accountID"))
+    lod = _clean_upper(get("levelOfDetail"))
     if filter_non_detail and lod and lod != "DETAIL":
         return {}
     if not lod and account_id == "-":
         logger.warning(
             "CashTransaction row with accountId='-' missing levelOfDetail; "
             "keeping row but may be a summary duplicate: date=%s type=%s amount=%s",
-            raw_row.get("dateTime") or raw_row.get("date"),
-            raw_row.get("type"),
-            raw_row.get("amount"),
+            get("dateTime") or get("date"),
+            get("type"),
+            get("amount"),
         )
-    account_name = _normalize_identifier(raw_row.get("accountAlias") or raw_row.get("accountName"))
-    provider_account_ref = _normalize_identifier(raw_row.get("accountAlias"))
-    transaction_id = _normalize_identifier(
-        raw_row.get("transactionID") or raw_row.get("tradeID") or raw_row.get("id")
+    account_name = normalize_identifier(get("accountAlias") or get("accountName"))
+    provider_account_ref = normalize_identifier(get("accountAlias"))
+    transaction_id = normalize_identifier(
+        get("transactionID") or get("tradeID") or get("id")
     )
+    currency = _normalize_flex_currency(get("currency"))
     if transaction_id is None:
         transaction_id = (
             f"cash:{account_id or provider_account_ref or account_name or 'unknown'}:"
-            f"{event_dt.isoformat()}:{_normalize_flex_currency(raw_row.get('currency'))}:"
+            f"{event_dt.isoformat()}:{currency}:"
             f"{abs(signed_amount):.8f}:{flow_type}:{row_index}"
         )
 
@@ -1139,51 +1295,54 @@ def _normalize_cash_transaction_row(
         "transaction_id": str(transaction_id),
         "event_datetime": event_dt,
         "date": event_dt,
-        "currency": _normalize_flex_currency(raw_row.get("currency")),
+        "currency": currency,
         "amount": float(signed_amount),
         "flow_type": flow_type,
         "is_external_flow": bool(is_external),
         "transfer_cash_confirmed": bool(transfer_cash_confirmed),
         "raw_type": raw_type,
-        "raw_subtype": str(raw_row.get("code") or ""),
-        "raw_description": str(raw_row.get("description") or ""),
+        "raw_subtype": str(get("code") or ""),
+        "raw_description": str(get("description") or ""),
         "section": "CashTransaction",
-        "fx_rate_to_base": safe_float(raw_row.get("fxRateToBase"), 0.0),
+        "fx_rate_to_base": safe_float(get("fxRateToBase"), 0.0),
     }
 
 
 def _normalize_transfer_row(raw_row: dict[str, Any], row_index: int) -> dict[str, Any]:
-    if not _as_bool(raw_row.get("cashTransfer")):
+    get = raw_row.get
+    normalize_identifier = _normalize_identifier
+    if not _as_bool(get("cashTransfer")):
         return {}
 
-    amount_value = raw_row.get("positionAmount")
+    amount_value = get("positionAmount")
     if amount_value in (None, ""):
-        amount_value = raw_row.get("amount")
+        amount_value = get("amount")
     if amount_value in (None, ""):
-        amount_value = raw_row.get("quantity")
+        amount_value = get("quantity")
     amount = _parse_cash_amount(amount_value, default=0.0)
     if amount == 0.0:
         return {}
 
-    direction = str(raw_row.get("direction") or "").strip().upper()
+    direction = _clean_upper(get("direction"))
     flow_type, is_external, signed_amount, transfer_cash_confirmed = _transfer_classification(direction, amount)
     if not flow_type or signed_amount == 0.0:
         return {}
 
-    event_dt = _parse_flex_date(raw_row.get("dateTime") or raw_row.get("date") or raw_row.get("reportDate"))
+    event_dt = _parse_flex_date(_first_date_value(get))
     if event_dt is None:
         return {}
 
-    account_id = _normalize_identifier(raw_row.get("accountId") or raw_row.get("accountID"))
-    account_name = _normalize_identifier(raw_row.get("accountAlias") or raw_row.get("accountName"))
-    provider_account_ref = _normalize_identifier(raw_row.get("accountAlias"))
-    transaction_id = _normalize_identifier(
-        raw_row.get("transactionID") or raw_row.get("tradeID") or raw_row.get("id")
+    account_id = normalize_identifier(get("accountId") or get("accountID"))
+    account_name = normalize_identifier(get("accountAlias") or get("accountName"))
+    provider_account_ref = normalize_identifier(get("accountAlias"))
+    transaction_id = normalize_identifier(
+        get("transactionID") or get("tradeID") or get("id")
     )
+    currency = _normalize_flex_currency(get("currency"))
     if transaction_id is None:
         transaction_id = (
             f"transfer:{account_id or provider_account_ref or account_name or 'unknown'}:"
-            f"{event_dt.isoformat()}:{_normalize_flex_currency(raw_row.get('currency'))}:"
+            f"{event_dt.isoformat()}:{currency}:"
             f"{abs(signed_amount):.8f}:{flow_type}:{row_index}"
         )
 
@@ -1196,14 +1355,14 @@ def _normalize_transfer_row(raw_row: dict[str, Any], row_index: int) -> dict[str
         "transaction_id": str(transaction_id),
         "event_datetime": event_dt,
         "date": event_dt,
-        "currency": _normalize_flex_currency(raw_row.get("currency")),
+        "currency": currency,
         "amount": float(signed_amount),
         "flow_type": flow_type,
         "is_external_flow": bool(is_external),
         "transfer_cash_confirmed": bool(transfer_cash_confirmed),
-        "raw_type": str(raw_row.get("type") or "TRANSFER"),
-        "raw_subtype": str(raw_row.get("code") or ""),
-        "raw_description": str(raw_row.get("description") or ""),
+        "raw_type": str(get("type") or "TRANSFER"),
+        "raw_subtype": str(get("code") or ""),
+        "raw_description": str(get("description") or ""),
         "section": "Transfer",
     }
 
@@ -1240,28 +1399,20 @@ def normalize_flex_cash_rows(
         segment_key = (
             event_dt.date().isoformat() if event_dt is not None else "",
             str(row.get("flow_type") or "").strip().lower(),
-            str(row.get("raw_type") or "").strip().upper(),
+            _clean_upper(row.get("raw_type")),
             round(_parse_cash_amount(row.get("amount"), default=0.0), 8),
             _normalize_flex_currency(row.get("currency")),
         )
         segment_grouped.setdefault(segment_key, []).append(row)
 
-    segment_deduped = [
-        _select_dedup_winner(rows, synthetic_prefixes=("cash:", "transfer:"))
-        for rows in segment_grouped.values()
-    ]
-
-    # Pass 2: cross-currency dedup — same event in HKD and USD → keep base currency
+    # Pass 2: cross-currency dedup — same event in HKD and USD → keep base currency.
+    # The currency key (day, flow_type, raw_type) is the segment key's prefix,
+    # so each segment winner is regrouped without re-deriving it.
     normalized_base_currency = _normalize_flex_currency(base_currency)
     cross_currency_grouped: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
-    for row in segment_deduped:
-        event_dt = _parse_flex_date(row.get("event_datetime") or row.get("date"))
-        currency_key = (
-            event_dt.date().isoformat() if event_dt is not None else "",
-            str(row.get("flow_type") or "").strip().lower(),
-            str(row.get("raw_type") or "").strip().upper(),
-        )
-        cross_currency_grouped.setdefault(currency_key, []).append(row)
+    for segment_key, rows in segment_grouped.items():
+        winner = _select_dedup_winner(rows, synthetic_prefixes=("cash:", "transfer:"))
+        cross_currency_grouped.setdefault(segment_key[:3], []).append(winner)
 
     normalized = []
     for grouped_rows in cross_currency_grouped.values():
@@ -1269,7 +1420,7 @@ def normalize_flex_cash_rows(
 
     normalized.sort(
         key=lambda row: (
-            _parse_flex_date(row.get("event_datetime") or row.get("date")) or datetime.min,
+            row.get("event_datetime") or row.get("date") or datetime.min,
             str(row.get("transaction_id") or ""),
             str(row.get("account_id") or ""),
         )
@@ -1286,6 +1437,18 @@ def _redact_credentials(msg: str, token: str, query_id: str) -> str:
     return msg
 
 
+def _parse_flex_xml(data: bytes) -> Any:
+    """Parse Flex XML with lxml's C parser when installed, else ElementTree.
+
+    Both element types support the ``find``/``iter``/``attrib`` API used here
+    and by ``FlexReport.extract``.
+    """
+    if _lxml_etree is not None:
+        parser = _lxml_etree.XMLParser(resolve_entities=False, huge_tree=True)
+        return _lxml_etree.fromstring(data, parser=parser)
+    return ET.fromstring(data)
+
+
 def _check_flex_error_response_xml(root: Any) -> tuple[int | None, str | None]:
     """Check raw XML root element for IBKR error response."""
     if root is None:
@@ -1339,7 +1502,6 @@ def _download_flex_report(
     """
     from urllib.parse import urlencode
     from urllib.request import urlopen
-    import xml.etree.ElementTree as ET
 
     # --- Phase 1: Request statement generation ---
     base_url = os.getenv(
@@ -1358,7 +1520,7 @@ def _download_flex_report(
             budget_user_id=budget_user_id,
         )
         data = resp.read()
-        root = ET.fromstring(data)
+        root = _parse_flex_xml(data)
     except BudgetExceededError:
         raise
     except Exception as exc:
@@ -1402,7 +1564,7 @@ def _download_flex_report(
                 budget_user_id=budget_user_id,
             )
             poll_data = resp.read()
-            poll_root = ET.fromstring(poll_data)
+            poll_root = _parse_flex_xml(poll_data)
         except BudgetExceededError:
             raise
         except Exception as exc:
@@ -1455,9 +1617,9 @@ def _report_xml_text(report: Any, *, path: str | None = None) -> str | None:
     if root is None:
         return None
 
-    import xml.etree.ElementTree as ET
-
     try:
+        if _lxml_etree is not None and isinstance(root, _lxml_etree._Element):
+            return _lxml_etree.tostring(root, encoding="unicode")
         return ET.tostring(root, encoding="unicode")
     except Exception:
         return None
@@ -1488,7 +1650,11 @@ def _load_flex_report(
         if not Path(path).exists():
             return None, f"IBKR Flex XML file not found: {path}"
         try:
-            report = FlexReport(path=path)
+            # Same as FlexReport(path=path), but parsed via _parse_flex_xml.
+            data = Path(path).read_bytes()
+            report = FlexReport()
+            report.data = data
+            report.root = _parse_flex_xml(data)
         except Exception as exc:
             return None, f"Failed to load IBKR Flex XML from {path}: {exc}"
 
@@ -1568,7 +1734,7 @@ def fetch_ibkr_flex_payload(
     payload["stmtfunds_section_present"] = stmtfunds_topic_present
 
     raw_trades = _extract_rows(report, "Trade")
-    payload["trades_raw"] = list(raw_trades)
+    payload["trades_raw"] = raw_trades
     if raw_trades:
         payload["trades"] = normalize_flex_trades(raw_trades)
 
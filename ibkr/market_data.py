@@ -10,14 +10,21 @@ Agent orientation:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import logging
 import os
+import re
 import threading
 import time
+import weakref
 import math
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import UTC, date, datetime
+from typing import Any
 
+import numpy as np
 import pandas as pd
 from ibkr._shared.budget_exceptions import BudgetExceededError
 
@@ -29,6 +36,9 @@ from .config import (
     IBKR_FUTURES_CURVE_TIMEOUT,
     IBKR_GATEWAY_HOST,
     IBKR_GATEWAY_PORT,
+    IBKR_MARKET_DATA_IDLE_TIMEOUT,
+    IBKR_MARKET_DATA_POOL_BASE_CLIENT_ID,
+    IBKR_MARKET_DATA_POOL_SIZE,
     IBKR_MARKET_DATA_RETRY_DELAY,
     IBKR_OPTION_SNAPSHOT_TIMEOUT,
     IBKR_SNAPSHOT_POLL_INTERVAL,
@@ -36,7 +46,7 @@ from .config import (
     IBKR_TIMEOUT,
 )
 
-from .cache import get_cached, put_cache
+from .cache import get_cached_many, put_cache
 from .contract_spec import IBKRContractSpec
 from .contracts import resolve_contract, resolve_futures_contract, resolve_option_contract
 from .exceptions import (
@@ -49,10 +59,12 @@ from .exceptions import (
 from .profiles import InstrumentProfile, get_profile
 from .locks import ibkr_shared_lock
 from .metadata import fetch_futures_months
-from .asyncio_compat import apply_nest_asyncio_if_running_loop
+from .asyncio_compat import apply_nest_asyncio_if_running_loop, disconnect_on_loop, ensure_event_loop
 
-if TYPE_CHECKING:
-    from ib_async import Contract
+try:
+    from ib_async import IB as _IB_CLS, Bond, Contract, Future, Stock
+except ImportError:  # pragma: no cover - surfaced when a connection is attempted
+    _IB_CLS = Bond = Contract = Future = Stock = None
 
 apply_nest_asyncio_if_running_loop()
 
@@ -60,33 +72,280 @@ apply_nest_asyncio_if_running_loop()
 _ibkr_request_lock = threading.Lock()
 
 
+def _disconnect_quietly(ib: Any) -> None:
+    """Disconnect ``ib`` from the thread that owns it, closing the socket now."""
+    disconnect_on_loop(ib, ensure_event_loop())
+
+
+def _is_connected(ib: Any) -> bool:
+    try:
+        return bool(ib.isConnected())
+    except Exception:
+        return False
+
+
+_PoolKey = tuple[str, int, int]
+
+
+class _IBConnectionPool:
+    """Idle historical-bars connections keyed on ``(host, port, client_id)``.
+
+    Every key has a dedicated owner thread (a single-worker executor). All use
+    of that key's connection (requests via ``run``, ``acquire``/``release``,
+    expiry and ``close``) happens on it, so the connection is only touched on
+    the event loop that services its socket, whichever thread made the
+    request. Disconnects drain that loop, so the client ID is free again when
+    ``close`` returns. Idle connections expire ``idle_s`` seconds after their
+    last use: lazily in ``acquire``, or when the daemon timer schedules the
+    close on the owner thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._owners: dict[_PoolKey, ThreadPoolExecutor] = {}
+        # key -> (ib, monotonic last-release time); each entry is only used on its key's owner thread.
+        self._idle: dict[_PoolKey, tuple[Any, float]] = {}
+        self._timers: dict[_PoolKey, threading.Timer] = {}
+        self._tls = threading.local()
+
+    def run(self, key: _PoolKey, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn(*args, **kwargs)`` on ``key``'s owner thread and return its result."""
+        if getattr(self._tls, "key", None) == key:
+            return fn(*args, **kwargs)
+        with self._lock:
+            owner = self._owners.get(key)
+            if owner is None:
+                owner = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"ibkr-bars-{key[2]}")
+                self._owners[key] = owner
+        return owner.submit(self._on_owner, key, fn, args, kwargs).result()
+
+    def _on_owner(self, key: _PoolKey, fn: Any, args: tuple, kwargs: dict) -> Any:
+        self._tls.key = key
+        return fn(*args, **kwargs)
+
+    def acquire(self, key: _PoolKey, connect: Any, *, idle_s: float = IBKR_MARKET_DATA_IDLE_TIMEOUT) -> tuple[Any, bool]:
+        """Return ``(ib, reused)``: the idle connection for ``key`` when still usable, else ``connect()``.
+
+        Call on ``key``'s owner thread (or with pooling off, on the caller's).
+        """
+        with self._lock:
+            entry = self._idle.pop(key, None)
+        if entry is not None:
+            ib, last_used = entry
+            if time.monotonic() - last_used < idle_s and _is_connected(ib):
+                return ib, True
+            _disconnect_quietly(ib)
+        return connect(), False
+
+    def release(
+        self,
+        key: _PoolKey,
+        ib: Any,
+        *,
+        reusable: bool = True,
+        idle_s: float = IBKR_MARKET_DATA_IDLE_TIMEOUT,
+    ) -> None:
+        """Park ``ib`` for reuse, or disconnect it when pooling is off or it is suspect."""
+        if not reusable or idle_s <= 0:
+            _disconnect_quietly(ib)
+            return
+        timer = threading.Timer(idle_s, self._schedule_expire, args=(key, idle_s))
+        timer.daemon = True
+        with self._lock:
+            replaced = self._idle.pop(key, None)
+            self._idle[key] = (ib, time.monotonic())
+            previous = self._timers.pop(key, None)
+            self._timers[key] = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+        if replaced is not None and replaced[0] is not ib:
+            _disconnect_quietly(replaced[0])
+
+    def _schedule_expire(self, key: _PoolKey, idle_s: float) -> None:
+        # Timer thread: never disconnect here, hand the expiry to the owner.
+        with self._lock:
+            owner = self._owners.get(key)
+        if owner is None:
+            return
+        try:
+            owner.submit(self._on_owner, key, self._expire, (key, idle_s), {})
+        except RuntimeError:  # executor shut down
+            pass
+
+    def _expire(self, key: _PoolKey, idle_s: float) -> None:
+        with self._lock:
+            entry = self._idle.get(key)
+            if entry is None or time.monotonic() - entry[1] < idle_s:
+                return
+            del self._idle[key]
+            self._timers.pop(key, None)
+        _disconnect_quietly(entry[0])
+
+    def _close_now(self, key: _PoolKey) -> None:
+        with self._lock:
+            entry = self._idle.pop(key, None)
+            timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        if entry is not None:
+            _disconnect_quietly(entry[0])
+
+    def close(self, key: _PoolKey) -> None:
+        """Disconnect the idle connection for ``key``; its client ID is free on return."""
+        with self._lock:
+            if key not in self._idle:
+                return
+        try:
+            self.run(key, self._close_now, key)
+        except RuntimeError:  # executor shut down (interpreter exit)
+            pass
+
+    def close_client(self, client_id: int) -> None:
+        """Disconnect idle connections using ``client_id`` on any host/port."""
+        with self._lock:
+            keys = [key for key in self._idle if key[2] == client_id]
+        for key in keys:
+            self.close(key)
+
+    def close_all(self) -> None:
+        with self._lock:
+            keys = list(self._idle)
+        for key in keys:
+            self.close(key)
+
+
+_ib_connection_pool = _IBConnectionPool()
+atexit.register(_ib_connection_pool.close_all)
+
+
+def _connection_suspect(ib: Any, exc: IBKRDataError) -> bool:
+    """True when a bars failure may be the connection's fault rather than the request's."""
+    # Unclassified failures surface as a plain IBKRDataError.
+    return type(exc) is IBKRDataError or not _is_connected(ib)
+
+
+def _reset_ib_connection_pool_for_tests() -> None:
+    """Disconnect pooled connections and stop their owner threads for test isolation."""
+    _ib_connection_pool.close_all()
+    with _ib_connection_pool._lock:
+        owners = list(_ib_connection_pool._owners.values())
+        _ib_connection_pool._owners.clear()
+    for owner in owners:
+        owner.shutdown(wait=True)
+
+
+class _ThreadBarsSlot:
+    """Thread-local holder for a historical-bars client ID."""
+
+    __slots__ = ("client_id", "__weakref__")
+
+    def __init__(self, client_id: int) -> None:
+        self.client_id = client_id
+
+
+# Free per-thread bars client IDs (empty when IBKR_MARKET_DATA_POOL_SIZE is 0).
+_bars_client_ids: list[int] = list(
+    range(IBKR_MARKET_DATA_POOL_BASE_CLIENT_ID, IBKR_MARKET_DATA_POOL_BASE_CLIENT_ID + IBKR_MARKET_DATA_POOL_SIZE)
+)
+_bars_client_ids_lock = threading.Lock()
+_bars_tls = threading.local()
+
+
+def _release_bars_client_id(client_id: int) -> None:
+    """Disconnect a dead thread's bars connection and return its client ID.
+
+    ``close_client`` waits for the owner thread to close the socket, so the ID
+    is only handed out again once the Gateway has released it.
+    """
+    _ib_connection_pool.close_client(client_id)
+    with _bars_client_ids_lock:
+        _bars_client_ids.append(client_id)
+
+
+def _thread_bars_client_id() -> int | None:
+    """Return this thread's own bars client ID, or ``None`` to use the serialized path.
+
+    A thread claims an ID on first use and keeps it until it exits. Returns
+    ``None`` when the pool is disabled or exhausted.
+    """
+    slot = getattr(_bars_tls, "slot", None)
+    if slot is None:
+        with _bars_client_ids_lock:
+            if not _bars_client_ids:
+                return None
+            client_id = _bars_client_ids.pop(0)
+        slot = _ThreadBarsSlot(client_id)
+        weakref.finalize(slot, _release_bars_client_id, client_id)
+        _bars_tls.slot = slot
+    return slot.client_id
+
+
+# Historical-data failure classification ("permission" also covers
+# "market data permissions").
+_ENTITLEMENT_ERROR_RE = re.compile(r"entitlement|permission", re.IGNORECASE)
+_CONTRACT_ERROR_RE = re.compile(r"no security definition|unknown contract|includeexpired", re.IGNORECASE)
+
+
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
 def _utcnow() -> datetime:
     return datetime.now(UTC).replace(tzinfo=None)
 
 
 def _compute_duration_str(start_dt: datetime, end_dt: datetime) -> str:
     """Compute IBKR duration string rounded up to full years."""
-    start_date = pd.Timestamp(start_dt).date()
-    end_date = pd.Timestamp(end_dt).date()
+    start_date = start_dt.date() if isinstance(start_dt, datetime) else start_dt
+    end_date = end_dt.date() if isinstance(end_dt, datetime) else end_dt
     if end_date <= start_date:
         return "1 Y"
 
     years = end_date.year - start_date.year
-    anniversary = (pd.Timestamp(start_date) + pd.DateOffset(years=years)).date()
-    if end_date > anniversary:
+    # Any day past the anniversary starts a partial year. Comparing (month, day)
+    # also covers Feb 29 starts, whose anniversary rolls to Feb 28.
+    if (end_date.month, end_date.day) > (start_date.month, start_date.day):
         years += 1
     years = max(1, years)
     return f"{years} Y"
 
 
-def _bar_attr(bar: Any, attr: str) -> Any:
-    if isinstance(bar, dict):
-        return bar.get(attr)
-    return getattr(bar, attr, None)
+def _as_float(value: Any) -> float | None:
+    """``float(value)`` when finite, else ``None``."""
+    if type(value) is float:  # ticker fields are usually plain floats (NaN when unset)
+        return value if math.isfinite(value) else None
+    if value is None:
+        return None
+    try:
+        out = float(value)
+    except (TypeError, ValueError):
+        return None
+    return out if math.isfinite(out) else None
+
+
+def _as_int(value: Any) -> int | None:
+    out = _as_float(value)
+    return None if out is None else int(out)
+
+
+def _slice_window(series: pd.Series, start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> pd.Series:
+    """Inclusive ``[start_ts, end_ts]`` slice of a series with a sorted DatetimeIndex."""
+    index = series.index
+    lo = index.searchsorted(start_ts, side="left")
+    hi = index.searchsorted(end_ts, side="right")
+    return series.iloc[lo:hi]
 
 
 class IBKRMarketDataClient:
-    """Client for IBKR historical market data with per-request connection lifecycle.
+    """Client for IBKR historical market data.
+
+    Historical-bar requests connect per request by default. With
+    ``IBKR_MARKET_DATA_IDLE_TIMEOUT > 0`` each client ID keeps one connection
+    on a dedicated owner thread, and requests from any thread (e.g.
+    ``asyncio.to_thread`` workers) reuse it; requests on one client ID still
+    run one at a time. ``IBKR_MARKET_DATA_POOL_SIZE`` gives up to N calling
+    threads their own client ID (and, when pooling, their own owner thread),
+    so their requests run in parallel. Snapshots connect per request.
 
     Upstream reference:
     - IBKR historical bars: https://interactivebrokers.github.io/tws-api/historical_bars.html
@@ -105,14 +364,18 @@ class IBKRMarketDataClient:
         self.port = int(port or IBKR_GATEWAY_PORT)
         self.client_id = int(client_id if client_id is not None else market_data_client_id)
         self.timeout = int(IBKR_TIMEOUT)
+        # Per-thread bars client IDs only replace the default client ID.
+        self._thread_client_ids = client_id is None
 
-    def _connect_ib(self, *, budget_user_id: int | None = None):
-        from .asyncio_compat import ensure_event_loop
+    def _connection_key(self) -> tuple[str, int, int]:
+        return (self.host, self.port, self.client_id)
 
+    def _connect_ib(self, *, budget_user_id: int | None = None, client_id: int | None = None):
         ensure_event_loop()
-        from ib_async import IB
+        if _IB_CLS is None:
+            raise ImportError("ib_async is required for IBKR market data")
 
-        ib = IB()
+        ib = _IB_CLS()
         try:
             guard_ib_call(
                 operation="connect",
@@ -120,7 +383,7 @@ class IBKRMarketDataClient:
                 kwargs={
                     "host": self.host,
                     "port": self.port,
-                    "clientId": self.client_id,
+                    "clientId": self.client_id if client_id is None else client_id,
                     "timeout": self.timeout,
                     "readonly": True,
                 },
@@ -184,8 +447,6 @@ class IBKRMarketDataClient:
             if exchange == "SMART":
                 return resolve_futures_contract(symbol, contract_month=contract_month)
 
-            from ib_async import Future
-
             kwargs: dict[str, Any] = {
                 "symbol": symbol,
                 "exchange": exchange,
@@ -196,8 +457,6 @@ class IBKRMarketDataClient:
             return Future(**kwargs)
 
         if sec_type == "STK":
-            from ib_async import Stock
-
             return Stock(symbol, exchange, currency)
 
         raise IBKRContractError(f"Unsupported snapshot contract spec secType '{sec_type or 'unknown'}'")
@@ -226,8 +485,6 @@ class IBKRMarketDataClient:
             if exchange == "SMART":
                 return resolve_futures_contract(symbol, contract_month=contract_month)
 
-            from ib_async import Future
-
             kwargs: dict[str, Any] = {
                 "symbol": symbol,
                 "exchange": exchange,
@@ -238,8 +495,6 @@ class IBKRMarketDataClient:
             return Future(**kwargs)
 
         if sec_type == "STK":
-            from ib_async import Stock
-
             return Stock(symbol, exchange, currency)
 
         raise IBKRContractError(f"Unsupported snapshot contract spec secType '{sec_type or 'unknown'}'")
@@ -289,8 +544,6 @@ class IBKRMarketDataClient:
                     budget_user_id=budget_user_id,
                 )
             if resolved_con_id:
-                from ib_async import Bond
-
                 retry_contract = Bond(conId=resolved_con_id)
                 qualified = guard_ib_call(
                     operation="qualifyContracts",
@@ -317,114 +570,183 @@ class IBKRMarketDataClient:
         start_ts: pd.Timestamp,
         end_ts: pd.Timestamp,
     ) -> list[Any]:
-        with _ibkr_request_lock:
-            last_connect_exc: Exception | None = None
-            for attempt in range(1, IBKR_CONNECT_MAX_ATTEMPTS + 1):
-                if attempt > 1:
-                    time.sleep(IBKR_MARKET_DATA_RETRY_DELAY)
-                    log_event(
-                        logger, logging.INFO, "bars.retry",
-                        attempt=attempt, max=IBKR_CONNECT_MAX_ATTEMPTS,
-                    )
-                try:
-                    if budget_user_id is None:
-                        ib = self._connect_ib()
-                    else:
-                        ib = self._connect_ib(budget_user_id=budget_user_id)
-                    last_connect_exc = None
-                    break
-                except IBKRConnectionError as exc:
-                    last_connect_exc = exc
-                    if attempt == IBKR_CONNECT_MAX_ATTEMPTS:
-                        raise
+        thread_client_id = _thread_bars_client_id() if self._thread_client_ids else None
+
+        def _connect():
+            kwargs: dict[str, Any] = {}
+            if budget_user_id is not None:
+                kwargs["budget_user_id"] = budget_user_id
+            if thread_client_id is not None:
+                kwargs["client_id"] = thread_client_id
+            return self._connect_ib(**kwargs)
+
+        if thread_client_id is None:
+            pool_key = self._connection_key()
+            request_lock: Any = _ibkr_request_lock
+        else:
+            # This thread's own client ID and connection: nothing to serialize.
+            pool_key = (self.host, self.port, thread_client_id)
+            request_lock = nullcontext()
+        fetch_kwargs: dict[str, Any] = {
+            "budget_user_id": budget_user_id,
+            "profile": profile,
+            "what_to_show": what_to_show,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+        }
+        with request_lock:
+            if IBKR_MARKET_DATA_IDLE_TIMEOUT > 0:
+                # Pooled connections live on their key's owner thread.
+                return _ib_connection_pool.run(
+                    pool_key, self._request_bars_on, pool_key, _connect, contract, fetch_kwargs
+                )
+            return self._request_bars_on(pool_key, _connect, contract, fetch_kwargs)
+
+    def _request_bars_on(
+        self,
+        pool_key: tuple[str, int, int],
+        connect: Any,
+        contract: Any,
+        fetch_kwargs: dict[str, Any],
+    ) -> list[Any]:
+        last_connect_exc: Exception | None = None
+        for attempt in range(1, IBKR_CONNECT_MAX_ATTEMPTS + 1):
+            if attempt > 1:
+                time.sleep(IBKR_MARKET_DATA_RETRY_DELAY)
+                log_event(
+                    logger, logging.INFO, "bars.retry",
+                    attempt=attempt, max=IBKR_CONNECT_MAX_ATTEMPTS,
+                )
             try:
-                if budget_user_id is None:
-                    qualified_contract = self._qualify_contract(ib, contract)
-                else:
-                    qualified_contract = self._qualify_contract(
-                        ib,
-                        contract,
-                        budget_user_id=budget_user_id,
-                    )
-                if qualified_contract is None:
-                    raise IBKRContractError("Unable to qualify IBKR contract")
-
-                duration_str = self._duration_for_request(profile, start_ts, end_ts)
-                bars = guard_ib_call(
-                    operation="reqHistoricalData",
-                    fn=ib.reqHistoricalData,
-                    args=(qualified_contract,),
-                    kwargs={
-                        "endDateTime": "",
-                        "durationStr": duration_str,
-                        "barSizeSetting": profile.bar_size,
-                        "whatToShow": what_to_show,
-                        "useRTH": profile.use_rth,
-                        "formatDate": 1,
-                    },
+                ib, reused = _ib_connection_pool.acquire(pool_key, connect)
+                last_connect_exc = None
+                break
+            except IBKRConnectionError as exc:
+                last_connect_exc = exc
+                if attempt == IBKR_CONNECT_MAX_ATTEMPTS:
+                    raise
+        reusable = True
+        try:
+            try:
+                return self._fetch_bars(ib, contract, **fetch_kwargs)
+            except IBKRDataError as exc:
+                if not reused or not _connection_suspect(ib, exc):
+                    raise
+            # A pooled socket can die while its loop sits idle (e.g. a
+            # Gateway restart) and still report isConnected(); retry once
+            # on a fresh connection.
+            log_event(logger, logging.INFO, "bars.stale_connection", client_id=pool_key[2])
+            reusable = False
+            _disconnect_quietly(ib)
+            ib = connect()
+            reusable = True
+            return self._fetch_bars(ib, contract, **fetch_kwargs)
+        except IBKRDataError as exc:
+            if _connection_suspect(ib, exc):
+                reusable = False
+            raise
+        finally:
+            _ib_connection_pool.release(pool_key, ib, reusable=reusable)
+
+    def _fetch_bars(
+        self,
+        ib: Any,
+        contract: Any,
+        *,
+        budget_user_id: int | None,
+        profile: InstrumentProfile,
+        what_to_show: str,
+        start_ts: pd.Timestamp,
+        end_ts: pd.Timestamp,
+    ) -> list[Any]:
+        try:
+            if budget_user_id is None:
+                qualified_contract = self._qualify_contract(ib, contract)
+            else:
+                qualified_contract = self._qualify_contract(
+                    ib,
+                    contract,
                     budget_user_id=budget_user_id,
                 )
-                if not bars:
-                    raise IBKRNoDataError("No historical bars returned")
-                return list(bars)
-            except IBKRDataError:
-                raise
-            except BudgetExceededError:
-                raise
-            except Exception as exc:
-                text = str(exc).lower()
-                if "entitlement" in text or "market data permissions" in text or "permission" in text:
-                    raise IBKREntitlementError(str(exc)) from exc
-                if (
-                    "no security definition" in text
-                    or "unknown contract" in text
-                    or "includeexpired" in text
-                ):
-                    raise IBKRContractError(str(exc)) from exc
-                raise IBKRDataError(str(exc)) from exc
-            finally:
-                try:
-                    ib.disconnect()
-                except Exception:
-                    pass
+            if qualified_contract is None:
+                raise IBKRContractError("Unable to qualify IBKR contract")
+
+            duration_str = self._duration_for_request(profile, start_ts, end_ts)
+            bars = guard_ib_call(
+                operation="reqHistoricalData",
+                fn=ib.reqHistoricalData,
+                args=(qualified_contract,),
+                kwargs={
+                    "endDateTime": "",
+                    "durationStr": duration_str,
+                    "barSizeSetting": profile.bar_size,
+                    "whatToShow": what_to_show,
+                    "useRTH": profile.use_rth,
+                    "formatDate": 1,
+                },
+                budget_user_id=budget_user_id,
+            )
+            if not bars:
+                raise IBKRNoDataError("No historical bars returned")
+            return list(bars)
+        except IBKRDataError:
+            raise
+        except BudgetExceededError:
+            raise
+        except Exception as exc:
+            text = str(exc)
+            if _ENTITLEMENT_ERROR_RE.search(text):
+                raise IBKREntitlementError(text) from exc
+            if _CONTRACT_ERROR_RE.search(text):
+                raise IBKRContractError(text) from exc
+            raise IBKRDataError(text) from exc
 
     def _normalize_bars(
         self,
         symbol: str,
         bars: list[Any],
         *,
-        bar_size: str,
+        is_monthly: bool,
         start_ts: pd.Timestamp,
         end_ts: pd.Timestamp,
     ) -> pd.Series:
-        rows: list[tuple[pd.Timestamp, float]] = []
-        for bar in bars:
-            date_val = _bar_attr(bar, "date")
-            close_val = _bar_attr(bar, "close")
-            if date_val is None or close_val is None:
-                continue
-            ts = pd.to_datetime(date_val, errors="coerce")
-            if pd.isna(ts):
-                continue
+        if not bars:
+            return pd.Series(dtype=float)
+
+        if isinstance(bars[0], dict):
+            dates = [bar.get("date") for bar in bars]
+            closes = [bar.get("close") for bar in bars]
+        else:
+            dates = [getattr(bar, "date", None) for bar in bars]
+            closes = [getattr(bar, "close", None) for bar in bars]
+
+        if all(type(value) is date for value in dates):
+            # Daily bars carry plain dates: build the index from day ordinals
+            # rather than parsing objects.
+            days = np.fromiter(map(date.toordinal, dates), dtype=np.int64, count=len(dates))
+            index = pd.DatetimeIndex((days - _UNIX_EPOCH_ORDINAL).astype("datetime64[D]"))
+        else:
             try:
-                rows.append((pd.Timestamp(ts), float(close_val)))
+                index = pd.DatetimeIndex(pd.to_datetime(dates, errors="coerce"))
             except (TypeError, ValueError):
-                continue
+                # Mixed timezones/types: fall back to per-value parsing.
+                index = pd.Index([pd.to_datetime(value, errors="coerce") for value in dates])
+        try:
+            values = np.array(closes, dtype=float)  # None -> NaN
+        except (TypeError, ValueError):
+            values = pd.to_numeric(pd.Series(closes, dtype=object), errors="coerce").to_numpy(dtype=float)
 
-        if not rows:
+        keep = index.notna() & ~pd.isna(values)
+        if not keep.any():
             return pd.Series(dtype=float)
+        series = pd.Series(values[keep], index=index[keep], name=symbol)
+        series = series[~series.index.duplicated(keep="last")].sort_index()
 
-        frame = pd.DataFrame(rows, columns=["date", "value"]).set_index("date").sort_index()
-        series = frame["value"].astype(float)
-        series = series[~series.index.duplicated(keep="last")]
-
-        if "month" in bar_size.lower():
+        if is_monthly:
             series = series.resample("ME").last()
 
-        series = series[(series.index >= start_ts) & (series.index <= end_ts)]
-        series = series.dropna()
-        series.name = symbol
-        return series
+        series = _slice_window(series, start_ts, end_ts)
+        return series.dropna()
 
     def fetch_series(
         self,
@@ -472,7 +794,7 @@ class IBKRMarketDataClient:
             logger.warning("No IBKR profile for %s (%s): %s", sym, instrument_type, exc)
             return pd.Series(dtype=float)
 
-        chain = [what_to_show.strip().upper()] if what_to_show else list(resolved_profile.what_to_show_chain)
+        chain = (what_to_show.strip().upper(),) if what_to_show else resolved_profile.what_to_show_chain
         if not chain:
             return pd.Series(dtype=float)
 
@@ -486,53 +808,43 @@ class IBKRMarketDataClient:
             logger.warning("IBKR contract resolution failed for %s: %s", sym, exc)
             return pd.Series(dtype=float)
 
-        for candidate in chain:
-            cached = get_cached(
-                symbol=sym,
-                instrument_type=resolved_profile.instrument_type,
-                what_to_show=candidate,
-                bar_size=resolved_profile.bar_size,
-                use_rth=resolved_profile.use_rth,
-                start_date=start_ts,
-                end_date=end_ts,
-                contract_identity=contract_identity,
-            )
+        # Cache key fields shared by every what_to_show candidate.
+        cache_key = {
+            "symbol": sym,
+            "instrument_type": resolved_profile.instrument_type,
+            "bar_size": resolved_profile.bar_size,
+            "use_rth": resolved_profile.use_rth,
+            "start_date": start_ts,
+            "end_date": end_ts,
+            "contract_identity": contract_identity,
+        }
+        for cached in get_cached_many([{**cache_key, "what_to_show": candidate} for candidate in chain]):
             if cached is not None and not cached.empty:
                 cached.name = sym
                 return cached
 
+        request_kwargs: dict[str, Any] = {
+            "profile": resolved_profile,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+        }
+        if budget_user_id is not None:
+            request_kwargs["budget_user_id"] = budget_user_id
+
         _last_transient: Exception | None = None
         for candidate in chain:
             try:
-                request_kwargs = {
-                    "profile": resolved_profile,
-                    "what_to_show": candidate,
-                    "start_ts": start_ts,
-                    "end_ts": end_ts,
-                }
-                if budget_user_id is not None:
-                    request_kwargs["budget_user_id"] = budget_user_id
-                bars = self._request_bars(contract, **request_kwargs)
+                bars = self._request_bars(contract, what_to_show=candidate, **request_kwargs)
                 series = self._normalize_bars(
                     sym,
                     bars,
-                    bar_size=resolved_profile.bar_size,
+                    is_monthly=resolved_profile.is_monthly,
                     start_ts=start_ts,
                     end_ts=end_ts,
                 )
                 if series.empty:
                     continue
-                put_cache(
-                    series,
-                    symbol=sym,
-                    instrument_type=resolved_profile.instrument_type,
-                    what_to_show=candidate,
-                    bar_size=resolved_profile.bar_size,
-                    use_rth=resolved_profile.use_rth,
-                    start_date=start_ts,
-                    end_date=end_ts,
-                    contract_identity=contract_identity,
-                )
+                put_cache(series, what_to_show=candidate, **cache_key)
                 return series
             except IBKRNoDataError:
                 continue
@@ -586,6 +898,7 @@ class IBKRMarketDataClient:
             symbol=symbol,
             start_date=start_date,
             end_date=end_date,
+            is_monthly=profile.is_monthly,
         )
 
     def fetch_daily_close_futures(
@@ -745,36 +1058,23 @@ class IBKRMarketDataClient:
         symbol: str,
         start_date: Any,
         end_date: Any,
+        is_monthly: bool = False,
     ) -> pd.Series:
-        start_ts = pd.Timestamp(start_date)
-        end_ts = pd.Timestamp(end_date)
-        monthly = series.resample("ME").last()
-        monthly = monthly[(monthly.index >= start_ts) & (monthly.index <= end_ts)].dropna()
-        monthly.name = str(symbol or "").strip().upper()
-        return monthly
+        if is_monthly:
+            # fetch_series already resampled monthly bars to month-end and
+            # applied the same window and dropna.
+            series.name = str(symbol or "").strip().upper()
+            return series
+        monthly = series.resample("ME").last().dropna()
+        return _slice_window(monthly, pd.Timestamp(start_date), pd.Timestamp(end_date)).rename(
+            str(symbol or "").strip().upper()
+        )
+
+    _as_float = staticmethod(_as_float)
+    _as_int = staticmethod(_as_int)
 
     @staticmethod
-    def _as_float(value: Any) -> float | None:
-        if value is None:
-            return None
-        try:
-            out = float(value)
-        except (TypeError, ValueError):
-            return None
-        if math.isnan(out) or math.isinf(out):
-            return None
-        return out
-
-    @classmethod
-    def _as_int(cls, value: Any) -> int | None:
-        out = cls._as_float(value)
-        if out is None:
-            return None
-        return int(out)
-
-    @classmethod
     def _value_for_option_side(
-        cls,
         ticker: Any,
         *,
         right: str,
@@ -784,10 +1084,87 @@ class IBKRMarketDataClient:
         prefer_put = right == "P"
         primary = put_attr if prefer_put else call_attr
         secondary = call_attr if prefer_put else put_attr
-        primary_value = cls._as_int(getattr(ticker, primary, None))
+        primary_value = _as_int(getattr(ticker, primary, None))
         if primary_value is not None:
             return primary_value
-        return cls._as_int(getattr(ticker, secondary, None))
+        return _as_int(getattr(ticker, secondary, None))
+
+    def _qualify_snapshot_contracts(
+        self,
+        ib,
+        contracts: list[IBKRContractSpec | Any],
+        *,
+        qualified_by_index: dict[int, Any],
+        pre_errors: dict[int, str],
+        budget_user_id: int | None = None,
+    ) -> None:
+        """Qualify snapshot contracts, concurrently when the IB handle supports it.
+
+        Fills *qualified_by_index* / *pre_errors* positionally. All
+        qualification requests are submitted before any reply is awaited, so
+        the batch costs about one gateway round-trip instead of one per
+        contract.
+        """
+
+        def _record(idx: int, qualified: Any) -> None:
+            qualified_contract = next((row for row in (qualified or []) if row is not None), None)
+            if qualified_contract is None:
+                pre_errors[idx] = "unable to qualify contract"
+            else:
+                qualified_by_index[idx] = qualified_contract
+
+        qualify_async = getattr(ib, "qualifyContractsAsync", None)
+        run = getattr(ib, "run", None)
+        if qualify_async is None or run is None:
+            for idx, contract in enumerate(contracts):
+                try:
+                    _record(
+                        idx,
+                        guard_ib_call(
+                            operation="qualifyContracts",
+                            fn=ib.qualifyContracts,
+                            args=(self._coerce_snapshot_contract(contract),),
+                            budget_user_id=budget_user_id,
+                        ),
+                    )
+                except BudgetExceededError:
+                    raise
+                except Exception as exc:
+                    pre_errors[idx] = str(exc) or "qualification failed"
+            return
+
+        pending: list[tuple[int, Any]] = []
+        try:
+            for idx, contract in enumerate(contracts):
+                try:
+                    coro = guard_ib_call(
+                        operation="qualifyContracts",
+                        fn=qualify_async,
+                        args=(self._coerce_snapshot_contract(contract),),
+                        budget_user_id=budget_user_id,
+                    )
+                except BudgetExceededError:
+                    raise
+                except Exception as exc:
+                    pre_errors[idx] = str(exc) or "qualification failed"
+                    continue
+                pending.append((idx, coro))
+        except BudgetExceededError:
+            for _, coro in pending:
+                coro.close()
+            raise
+
+        if not pending:
+            return
+        async def _gather() -> list[Any]:
+            return await asyncio.gather(*(coro for _, coro in pending), return_exceptions=True)
+
+        results = run(_gather())
+        for (idx, _), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                pre_errors[idx] = str(result) or "qualification failed"
+            else:
+                _record(idx, result)
 
     def fetch_snapshot(
         self,
@@ -835,31 +1212,20 @@ class IBKRMarketDataClient:
         with ibkr_shared_lock:
             ib = None
             try:
+                # Same client ID as the pooled bars connection; free it first.
+                _ib_connection_pool.close(self._connection_key())
                 if budget_user_id is None:
                     ib = self._connect_ib()
                 else:
                     ib = self._connect_ib(budget_user_id=budget_user_id)
 
-                for idx, contract in enumerate(contracts):
-                    try:
-                        qualified = guard_ib_call(
-                            operation="qualifyContracts",
-                            fn=ib.qualifyContracts,
-                            args=(self._coerce_snapshot_contract(contract),),
-                            budget_user_id=budget_user_id,
-                        )
-                        if not qualified:
-                            pre_errors[idx] = "unable to qualify contract"
-                            continue
-                        qualified_contract = next((row for row in qualified if row is not None), None)
-                        if qualified_contract is None:
-                            pre_errors[idx] = "unable to qualify contract"
-                            continue
-                        qualified_by_index[idx] = qualified_contract
-                    except BudgetExceededError:
-                        raise
-                    except Exception as exc:
-                        pre_errors[idx] = str(exc) or "qualification failed"
+                self._qualify_snapshot_contracts(
+                    ib,
+                    contracts,
+                    qualified_by_index=qualified_by_index,
+                    pre_errors=pre_errors,
+                    budget_user_id=budget_user_id,
+                )
 
                 # Detect if any qualified contract is an option — use longer
                 # timeout so IBKR has time to compute model Greeks.
@@ -907,6 +1273,11 @@ class IBKRMarketDataClient:
                 if use_streaming and tickers_by_index:
                     # Poll until all tickers have price data + Greeks or timeout.
                     poll_interval = IBKR_SNAPSHOT_POLL_INTERVAL
+                    option_indices = {
+                        idx
+                        for idx, contract in qualified_by_index.items()
+                        if str(getattr(contract, "secType", "") or "").upper() == "OPT"
+                    }
                     elapsed = 0.0
                     while elapsed < effective_timeout:
                         ib.sleep(poll_interval)
@@ -931,16 +1302,14 @@ class IBKRMarketDataClient:
 
                         all_ready = True
                         for idx, ticker in tickers_by_index.items():
-                            bid = self._as_float(getattr(ticker, "bid", None))
-                            ask = self._as_float(getattr(ticker, "ask", None))
-                            last = self._as_float(getattr(ticker, "last", None))
+                            bid = _as_float(getattr(ticker, "bid", None))
+                            ask = _as_float(getattr(ticker, "ask", None))
+                            last = _as_float(getattr(ticker, "last", None))
                             if bid is None and ask is None and last is None:
                                 all_ready = False
                                 break
                             # For options, also wait for modelGreeks.
-                            contract = qualified_by_index.get(idx)
-                            sec_type = str(getattr(contract, "secType", "") or "").upper()
-                            if sec_type == "OPT" and getattr(ticker, "modelGreeks", None) is None:
+                            if idx in option_indices and getattr(ticker, "modelGreeks", None) is None:
                                 all_ready = False
                                 break
                         if all_ready:
@@ -995,6 +1364,7 @@ class IBKRMarketDataClient:
                     except Exception:
                         pass
 
+        as_float = _as_float
         output: list[dict[str, Any]] = []
         for idx, contract in enumerate(contracts):
             if idx in pre_errors:
@@ -1006,9 +1376,9 @@ class IBKRMarketDataClient:
                 output.append({"error": "timeout"})
                 continue
 
-            bid = self._as_float(getattr(ticker, "bid", None))
-            ask = self._as_float(getattr(ticker, "ask", None))
-            last = self._as_float(getattr(ticker, "last", None))
+            bid = as_float(getattr(ticker, "bid", None))
+            ask = as_float(getattr(ticker, "ask", None))
+            last = as_float(getattr(ticker, "last", None))
             mid = (bid + ask) / 2.0 if bid is not None and ask is not None else None
 
             contract_for_fields = qualified_by_index.get(idx, contract)
@@ -1029,19 +1399,22 @@ class IBKRMarketDataClient:
                     put_attr="putOpenInterest",
                 )
             else:
-                volume = self._as_int(getattr(ticker, "volume", None))
+                volume = _as_int(getattr(ticker, "volume", None))
                 open_interest = None
 
             model_greeks = getattr(ticker, "modelGreeks", None)
-            implied_vol = self._as_float(getattr(model_greeks, "impliedVol", None))
+            if model_greeks is None:
+                implied_vol = delta = gamma = theta = vega = None
+            else:
+                implied_vol = as_float(getattr(model_greeks, "impliedVol", None))
+                delta = as_float(getattr(model_greeks, "delta", None))
+                gamma = as_float(getattr(model_greeks, "gamma", None))
+                theta = as_float(getattr(model_greeks, "theta", None))
+                vega = as_float(getattr(model_greeks, "vega", None))
             if implied_vol is None:
-                implied_vol = self._as_float(getattr(ticker, "impliedVolatility", None))
-            delta = self._as_float(getattr(model_greeks, "delta", None))
-            gamma = self._as_float(getattr(model_greeks, "gamma", None))
-            theta = self._as_float(getattr(model_greeks, "theta", None))
-            vega = self._as_float(getattr(model_greeks, "vega", None))
+                implied_vol = as_float(getattr(ticker, "impliedVolatility", None))
 
-            close = self._as_float(getattr(ticker, "close", None))
+            close = as_float(getattr(ticker, "close", None))
 
             has_data = any(
                 value is not None
@@ -1084,8 +1457,6 @@ class IBKRMarketDataClient:
         con_id, last_trade_date, last, bid, ask, volume, open_interest
         sorted by last_trade_date ascending.
         """
-        from ib_async import Contract
-
         sym = str(symbol or "").strip().upper()
         if not sym:
             raise IBKRContractError("Symbol is required")
@@ -1093,6 +1464,8 @@ class IBKRMarketDataClient:
         with ibkr_shared_lock:
             ib = None
             try:
+                # Same client ID as the pooled bars connection; free it first.
+                _ib_connection_pool.close(self._connection_key())
                 if budget_user_id is None:
                     ib = self._connect_ib()
                 else:
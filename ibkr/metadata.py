@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import datetime
+from operator import attrgetter
 from typing import Any
 
 from ._budget import guard_ib_call
 from .contracts import _futures_exchange_meta, resolve_futures_contract
 from .exceptions import IBKRContractError
 
+try:
+    from ib_async import Contract, Future, Stock
+except ImportError:  # pragma: no cover - only non-IBKR paths are usable
+    Contract = Future = Stock = None
+
 
 def _safe_float(value: Any) -> float | None:
     try:
@@ -20,8 +26,6 @@ def _safe_float(value: Any) -> float | None:
 
 
 def _build_contract(symbol: str, sec_type: str, exchange: str, currency: str):
-    from ib_async import Contract, Future, Stock
-
     sym = str(symbol or "").strip().upper()
     if not sym:
         raise IBKRContractError("Symbol is required")
@@ -43,35 +47,92 @@ def _build_contract(symbol: str, sec_type: str, exchange: str, currency: str):
     return Contract(symbol=sym, secType=sec, exchange=exch, currency=curr)
 
 
+# Attribute order matches the unpacking in _normalize_contract_detail.
+_CONTRACT_ATTRS = (
+    "conId",
+    "symbol",
+    "secType",
+    "exchange",
+    "primaryExchange",
+    "currency",
+    "multiplier",
+    "tradingClass",
+    "lastTradeDateOrContractMonth",
+)
+_DETAIL_ATTRS = (
+    "minTick",
+    "validExchanges",
+    "longName",
+    "industry",
+    "category",
+    "subcategory",
+    "tradingHours",
+    "liquidHours",
+)
+_get_contract_attrs = attrgetter(*_CONTRACT_ATTRS)
+_get_detail_attrs = attrgetter(*_DETAIL_ATTRS)
+
+
+def _attr_values(obj: Any, getter: attrgetter, names: tuple[str, ...]) -> tuple[Any, ...]:
+    """All ``names`` from ``obj`` in one call; ``None`` for any that are missing."""
+    try:
+        return getter(obj)
+    except AttributeError:
+        return tuple(getattr(obj, name, None) for name in names)
+
+
 def _normalize_contract_detail(contract_detail) -> dict[str, Any]:
     contract = getattr(contract_detail, "contract", None)
-    valid_exchanges_raw = getattr(contract_detail, "validExchanges", None)
+    if contract:
+        (
+            con_id,
+            symbol,
+            sec_type,
+            exchange,
+            primary_exchange,
+            currency,
+            multiplier,
+            trading_class,
+            last_trade_date,
+        ) = _attr_values(contract, _get_contract_attrs, _CONTRACT_ATTRS)
+    else:
+        con_id = symbol = sec_type = exchange = primary_exchange = None
+        currency = multiplier = trading_class = last_trade_date = None
+    (
+        min_tick,
+        valid_exchanges_raw,
+        long_name,
+        industry,
+        category,
+        subcategory,
+        trading_hours,
+        liquid_hours,
+    ) = _attr_values(contract_detail, _get_detail_attrs, _DETAIL_ATTRS)
+
     valid_exchanges: list[str] = []
     if isinstance(valid_exchanges_raw, str):
-        valid_exchanges = [e.strip() for e in valid_exchanges_raw.split(",") if e.strip()]
+        valid_exchanges = [e for e in map(str.strip, valid_exchanges_raw.split(",")) if e]
     elif isinstance(valid_exchanges_raw, (list, tuple, set)):
         valid_exchanges = [str(e) for e in valid_exchanges_raw if str(e).strip()]
 
     return {
-        "con_id": getattr(contract, "conId", None) if contract else None,
-        "symbol": getattr(contract, "symbol", None) if contract else None,
-        "sec_type": getattr(contract, "secType", None) if contract else None,
-        "exchange": getattr(contract, "exchange", None) if contract else None,
-        "primary_exchange": getattr(contract, "primaryExchange", None) if contract else None,
-        "currency": getattr(contract, "currency", None) if contract else None,
-        "multiplier": getattr(contract, "multiplier", None) if contract else None,
-        "min_tick": _safe_float(getattr(contract_detail, "minTick", None)),
-        "trading_class": getattr(contract, "tradingClass", None) if contract else None,
+        "con_id": con_id,
+        "symbol": symbol,
+        "sec_type": sec_type,
+        "exchange": exchange,
+        "primary_exchange": primary_exchange,
+        "currency": currency,
+        "multiplier": multiplier,
+        "min_tick": _safe_float(min_tick),
+        "trading_class": trading_class,
         "valid_exchanges": valid_exchanges,
-        "long_name": getattr(contract_detail, "longName", None),
-        "industry": getattr(contract_detail, "industry", None),
-        "category": getattr(contract_detail, "category", None),
-        "subcategory": getattr(contract_detail, "subcategory", None),
-        "trading_hours": getattr(contract_detail, "tradingHours", None),
-        "liquid_hours": getattr(contract_detail, "liquidHours", None),
-        "last_trade_date": (
-            getattr(contract, "lastTradeDateOrContractMonth", None) if contract else None
-        ),
+        "long_name": long_name,
+        "industry": industry,
+        "category": category,
+        "subcategory": subcategory,
+        "trading_hours": trading_hours,
+        "liquid_hours": liquid_hours,
+        "last_trade_date": last_trade_date,
     }
 
 
@@ -114,8 +175,6 @@ def fetch_futures_months(
     con_id, symbol, exchange, currency, last_trade_date, multiplier, trading_class
     Expired contracts (last_trade_date < today) are filtered out.
     """
-    from ib_async import Future
-
     sym = str(symbol or "").strip().upper()
     if not sym:
         raise IBKRContractError("Symbol is required")
@@ -183,8 +242,6 @@ def fetch_option_chain(
     budget_user_id: int | None = None,
 ) -> dict[str, Any]:
     """Fetch option chain metadata for STK/FUT underlyings."""
-    from ib_async import Stock
-
     sec = str(sec_type or "STK").strip().upper()
     sym = str(symbol or "").strip().upper()
     if not sym:
@@ -259,8 +316,6 @@ def resolve_bond_by_cusip(
 
     Returns conId if found, None otherwise.
     """
-    from ib_async import Contract
-
     cusip = cusip.strip().upper()
     if not cusip:
         return None
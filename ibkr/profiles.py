@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
 
-from ._types import InstrumentType, coerce_instrument_type
+from ._types import InstrumentType
 
 
 @dataclass(frozen=True)
@@ -12,44 +14,49 @@ class InstrumentProfile:
     """Declarative fetch profile per instrument type."""
 
     instrument_type: str
-    what_to_show_chain: list[str]
+    what_to_show_chain: tuple[str, ...]
     bar_size: str
     use_rth: bool
     duration: str
+    # Derived from bar_size so callers can branch without re-parsing it.
+    is_monthly: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_monthly", "month" in self.bar_size.lower())
 
 
 _PROFILES: dict[str, InstrumentProfile] = {
     "futures": InstrumentProfile(
         instrument_type="futures",
-        what_to_show_chain=["TRADES"],
+        what_to_show_chain=("TRADES",),
         bar_size="1 month",
         use_rth=True,
         duration="2 Y",
     ),
     "futures_daily": InstrumentProfile(
         instrument_type="futures",
-        what_to_show_chain=["TRADES"],
+        what_to_show_chain=("TRADES",),
         bar_size="1 day",
         use_rth=True,
         duration="2 Y",
     ),
     "fx": InstrumentProfile(
         instrument_type="fx",
-        what_to_show_chain=["MIDPOINT", "BID", "ASK"],
+        what_to_show_chain=("MIDPOINT", "BID", "ASK"),
         bar_size="1 day",
         use_rth=False,
         duration="2 Y",
     ),
     "bond": InstrumentProfile(
         instrument_type="bond",
-        what_to_show_chain=["MIDPOINT", "BID", "ASK"],
+        what_to_show_chain=("MIDPOINT", "BID", "ASK"),
         bar_size="1 day",
         use_rth=True,
         duration="2 Y",
     ),
     "option": InstrumentProfile(
         instrument_type="option",
-        what_to_show_chain=["MIDPOINT", "BID", "ASK"],
+        what_to_show_chain=("MIDPOINT", "BID", "ASK"),
         bar_size="1 day",
         use_rth=True,
         duration="2 Y",
@@ -57,23 +64,36 @@ _PROFILES: dict[str, InstrumentProfile] = {
 }
 
 
+_PROFILES_VIEW: Mapping[str, InstrumentProfile] = MappingProxyType(_PROFILES)
+
+
+def _build_profile_aliases() -> dict[str, InstrumentProfile]:
+    aliases: dict[str, InstrumentProfile] = {}
+    for name, profile in _PROFILES.items():
+        aliases[name] = profile
+        aliases[name.upper()] = profile
+    for alias in ("forex", "fx_artifact"):
+        aliases[alias] = _PROFILES["fx"]
+        aliases[alias.upper()] = _PROFILES["fx"]
+    return aliases
+
+
+# Every accepted spelling -> profile; most callers hit with their raw value.
+_PROFILE_ALIASES = _build_profile_aliases()
+
+
 def get_profile(instrument_type: str | InstrumentType) -> InstrumentProfile:
     """Return the configured profile for an instrument type."""
-    raw_instrument_type = str(instrument_type or "").strip().lower()
-    if raw_instrument_type in _PROFILES:
-        return _PROFILES[raw_instrument_type]
-    if raw_instrument_type in {"fx", "forex"}:
-        return _PROFILES["fx"]
-
-    normalized = coerce_instrument_type(instrument_type, default="unknown")
-    if normalized == "fx_artifact":
-        normalized = "fx"
-    profile = _PROFILES.get(normalized)
+    try:
+        return _PROFILE_ALIASES[instrument_type]
+    except (KeyError, TypeError):
+        pass
+    profile = _PROFILE_ALIASES.get(str(instrument_type or "").strip().lower())
     if profile is None:
         raise KeyError(f"No IBKR profile configured for instrument type '{instrument_type}'")
     return profile
 
 
-def get_profiles() -> dict[str, InstrumentProfile]:
-    """Return all configured profiles."""
-    return dict(_PROFILES)
+def get_profiles() -> Mapping[str, InstrumentProfile]:
+    """Return a read-only view of all configured profiles."""
+    return _PROFILES_VIEW
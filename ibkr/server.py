@@ -10,11 +10,17 @@ import sys
 _real_stdout = sys.stdout
 sys.stdout = sys.stderr
 
+import asyncio
+import functools
+import inspect
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Literal, Optional
 
+import numpy as np
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
@@ -28,6 +34,11 @@ try:
 except Exception:
     pass
 
+from ib_async import Contract, Option, Stock
+
+from ._logging import logger
+from .client import IBKRClient
+
 # Restore stdout for MCP transport.
 sys.stdout = _real_stdout
 
@@ -37,13 +48,80 @@ mcp = FastMCP(
 )
 
 
-def _with_stderr_stdout(fn, *args, **kwargs):
-    saved = sys.stdout
-    sys.stdout = sys.stderr
+_client: IBKRClient | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> IBKRClient:
+    """Return the process-wide ``IBKRClient``, built on first use.
+
+    The client holds no connection itself (the connection manager and market
+    data pool own those), so one instance can serve every tool call.
+    """
+    global _client
+
+    client = _client
+    if client is not None:
+        return client
+    with _client_lock:
+        if _client is None:
+            _client = IBKRClient()
+        return _client
+
+
+# Tool calls overlap (async tools await worker threads), so the stdout swap is
+# reference-counted: the first active call redirects, the last one restores.
+_stdout_redirect_lock = threading.Lock()
+_stdout_redirect_depth = 0
+_stdout_saved: Any = None
+
+
+@contextmanager
+def _stdout_to_stderr():
+    global _stdout_redirect_depth, _stdout_saved
+
+    with _stdout_redirect_lock:
+        if _stdout_redirect_depth == 0:
+            _stdout_saved = sys.stdout
+            sys.stdout = sys.stderr
+        _stdout_redirect_depth += 1
     try:
-        return fn(*args, **kwargs)
+        yield
     finally:
-        sys.stdout = saved
+        with _stdout_redirect_lock:
+            _stdout_redirect_depth -= 1
+            if _stdout_redirect_depth == 0:
+                sys.stdout = _stdout_saved
+                _stdout_saved = None
+
+
+def _ibkr_tool(fn):
+    """Wrap a tool body: stdout -> stderr while it runs, exceptions -> error payload.
+
+    MCP uses stdout for JSON-RPC, so stray prints from IBKR libraries must not
+    reach it. Works for sync and async tools.
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            with _stdout_to_stderr():
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as exc:
+                    return {"status": "error", "error": _error_str(exc)}
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _stdout_to_stderr():
+            try:
+                return fn(*args, **kwargs)
+            except Exception as exc:
+                return {"status": "error", "error": _error_str(exc)}
+
+    return wrapper
 
 
 def _error_str(exc: Exception) -> str:
@@ -52,6 +130,19 @@ def _error_str(exc: Exception) -> str:
     return msg if msg else type(exc).__name__
 
 
+def _frame_records(frame: Any) -> list[dict[str, Any]]:
+    """``frame.to_dict(orient="records")`` built column-wise.
+
+    ``Series.tolist()`` converts each column to Python scalars in one pass;
+    rows are then zipped together instead of boxing cell by cell.
+    """
+    if frame.empty:
+        return []
+    columns = list(frame.columns)
+    values = [frame[column].tolist() for column in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
 def parse_list(value: Any, *, coerce=str) -> list | None:
     """Parse MCP list params that may arrive as JSON or comma-separated strings."""
     if value is None:
@@ -93,7 +184,8 @@ def parse_json_list(value: Any) -> list | None:
 
 
 @mcp.tool()
-def get_ibkr_market_data(
+@_ibkr_tool
+async def get_ibkr_market_data(
     symbols: str,
     instrument_type: Literal["futures", "fx", "bond", "option"],
     start_date: Optional[str] = None,
@@ -103,95 +195,89 @@ def get_ibkr_market_data(
 ) -> dict:
     """Fetch historical price series from IBKR Gateway.
 
-    symbols accepts a JSON array string or comma-separated symbols.
+    symbols accepts a JSON array string or comma-separated symbols. Symbols are
+    fetched concurrently; a failing symbol gets an ``error`` entry instead of
+    failing the whole call.
     """
+    parsed_symbols = parse_list(symbols) or []
+    if not parsed_symbols:
+        raise ValueError("symbols is required")
+
+    client = _get_client()
+    today = datetime.now().date()
+    end_dt = end_date or today.isoformat()
+    start_dt = start_date or (today - timedelta(days=730)).isoformat()
+
+    def _fetch(sym: str) -> dict[str, Any]:
+        series = client.fetch_series(
+            symbol=sym,
+            instrument_type=instrument_type,
+            start_date=start_dt,
+            end_date=end_dt,
+            what_to_show=what_to_show,
+            contract_identity=contract_identity,
+        )
+        if series.empty:
+            return {"bars": 0, "data": {}}
+        # fetch_series returns a date-sorted series, so the ends are first/last.
+        dates = series.index.strftime("%Y-%m-%d").tolist()
+        values = np.round(series.to_numpy(dtype=np.float64), 6).tolist()
+        return {
+            "bars": len(series),
+            "start": dates[0],
+            "end": dates[-1],
+            "data": dict(zip(dates, values)),
+        }
 
-    def _impl() -> dict:
-        from .client import IBKRClient
-
-        parsed_symbols = parse_list(symbols) or []
-        if not parsed_symbols:
-            raise ValueError("symbols is required")
-
-        client = IBKRClient()
-        end_dt = end_date or datetime.now().strftime("%Y-%m-%d")
-        start_dt = start_date or (datetime.now() - timedelta(days=730)).strftime("%Y-%m-%d")
-
-        results: dict[str, Any] = {}
-        for sym in parsed_symbols:
-            series = client.fetch_series(
-                symbol=sym.upper(),
-                instrument_type=instrument_type,
-                start_date=start_dt,
-                end_date=end_dt,
-                what_to_show=what_to_show,
-                contract_identity=contract_identity,
-            )
-            if series.empty:
-                results[sym.upper()] = {"bars": 0, "data": {}}
-            else:
-                results[sym.upper()] = {
-                    "bars": len(series),
-                    "start": str(series.index.min().date()),
-                    "end": str(series.index.max().date()),
-                    "data": {str(k.date()): round(v, 6) for k, v in series.items()},
-                }
-
-        return {"status": "success", "instrument_type": instrument_type, "results": results}
+    unique_symbols = list(dict.fromkeys(sym.upper() for sym in parsed_symbols))
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(_fetch, sym) for sym in unique_symbols),
+        return_exceptions=True,
+    )
+
+    results: dict[str, Any] = {}
+    for sym, outcome in zip(unique_symbols, outcomes):
+        if isinstance(outcome, Exception):
+            results[sym] = {"error": _error_str(outcome)}
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[sym] = outcome
 
-    try:
-        return _with_stderr_stdout(_impl)
-    except Exception as exc:
-        return {"status": "error", "error": _error_str(exc)}
+    return {"status": "success", "instrument_type": instrument_type, "results": results}
 
 
 @mcp.tool()
+@_ibkr_tool
 def get_ibkr_positions(
     include_pnl: bool = False,
     account_id: Optional[str] = None,
 ) -> dict:
     """Fetch current IBKR positions and optionally account-level PnL."""
+    client = _get_client()
+    positions_df = client.get_positions(account_id=account_id)
+    positions = _frame_records(positions_df)
 
-    def _impl() -> dict:
-        from .client import IBKRClient
-
-        client = IBKRClient()
-        positions_df = client.get_positions(account_id=account_id)
-        positions = positions_df.to_dict(orient="records") if not positions_df.empty else []
-
-        result: dict[str, Any] = {
-            "status": "success",
-            "count": len(positions),
-            "positions": positions,
-        }
-        if include_pnl:
-            result["pnl"] = client.get_pnl(account_id=account_id)
-        return result
-
-    try:
-        return _with_stderr_stdout(_impl)
-    except Exception as exc:
-        return {"status": "error", "error": _error_str(exc)}
+    result: dict[str, Any] = {
+        "status": "success",
+        "count": len(positions),
+        "positions": positions,
+    }
+    if include_pnl:
+        result["pnl"] = client.get_pnl(account_id=account_id)
+    return result
 
 
 @mcp.tool()
+@_ibkr_tool
 def get_ibkr_account(account_id: Optional[str] = None) -> dict:
     """Fetch IBKR account summary metrics."""
-
-    def _impl() -> dict:
-        from .client import IBKRClient
-
-        client = IBKRClient()
-        summary = client.get_account_summary(account_id=account_id)
-        return {"status": "success", "account_summary": summary}
-
-    try:
-        return _with_stderr_stdout(_impl)
-    except Exception as exc:
-        return {"status": "error", "error": _error_str(exc)}
+    summary = _get_client().get_account_summary(account_id=account_id)
+    return {"status": "success", "account_summary": summary}
 
 
 @mcp.tool()
+@_ibkr_tool
 def get_ibkr_contract(
     symbol: str,
     sec_type: str = "STK",
@@ -200,30 +286,22 @@ def get_ibkr_contract(
     currency: str = "USD",
 ) -> dict:
     """Fetch contract details or option chain metadata from IBKR."""
+    client = _get_client()
+    if info_type == "option_chain":
+        chain = client.get_option_chain(symbol=symbol.upper(), sec_type=sec_type, exchange=exchange)
+        return {"status": "success", "info_type": "option_chain", "chain": chain}
 
-    def _impl() -> dict:
-        from .client import IBKRClient
-
-        client = IBKRClient()
-        if info_type == "option_chain":
-            chain = client.get_option_chain(symbol=symbol.upper(), sec_type=sec_type, exchange=exchange)
-            return {"status": "success", "info_type": "option_chain", "chain": chain}
-
-        details = client.get_contract_details(
-            symbol=symbol.upper(),
-            sec_type=sec_type,
-            exchange=exchange,
-            currency=currency,
-        )
-        return {"status": "success", "info_type": "details", "contracts": details}
-
-    try:
-        return _with_stderr_stdout(_impl)
-    except Exception as exc:
-        return {"status": "error", "error": _error_str(exc)}
+    details = client.get_contract_details(
+        symbol=symbol.upper(),
+        sec_type=sec_type,
+        exchange=exchange,
+        currency=currency,
+    )
+    return {"status": "success", "info_type": "details", "contracts": details}
 
 
 @mcp.tool()
+@_ibkr_tool
 def get_ibkr_option_prices(
     symbol: str,
     expiry: str,
@@ -234,48 +312,39 @@ def get_ibkr_option_prices(
 
     strikes accepts a JSON array string or comma-separated values.
     """
-
-    def _impl() -> dict:
-        from ib_async import Option
-
-        from .client import IBKRClient
-
-        normalized_symbol = str(symbol or "").strip().upper()
-        normalized_right = str(right or "").strip().upper()
-        if normalized_right not in {"P", "C"}:
-            raise ValueError("right must be 'P' or 'C'")
-
-        parsed_strikes = parse_list(strikes, coerce=float) or []
-        if not parsed_strikes:
-            raise ValueError("strikes is required")
-
-        client = IBKRClient()
-        contracts = [
-            Option(normalized_symbol, expiry, float(strike), normalized_right, "SMART")
-            for strike in parsed_strikes
-        ]
-        snapshots = client.fetch_snapshot(contracts=contracts)
-
-        prices: dict[float, dict[str, Any]] = {}
-        for idx, strike in enumerate(parsed_strikes):
-            strike_key = float(strike)
-            prices[strike_key] = snapshots[idx] if idx < len(snapshots) else {"error": "timeout"}
-
-        return {
-            "status": "success",
-            "symbol": normalized_symbol,
-            "expiry": expiry,
-            "right": normalized_right,
-            "prices": prices,
-        }
-
-    try:
-        return _with_stderr_stdout(_impl)
-    except Exception as exc:
-        return {"status": "error", "error": _error_str(exc)}
+    normalized_symbol = str(symbol or "").strip().upper()
+    normalized_right = str(right or "").strip().upper()
+    if normalized_right not in {"P", "C"}:
+        raise ValueError("right must be 'P' or 'C'")
+
+    parsed_strikes = parse_list(strikes, coerce=float) or []
+    if not parsed_strikes:
+        raise ValueError("strikes is required")
+
+    client = _get_client()
+    contracts = [
+        Option(normalized_symbol, expiry, float(strike), normalized_right, "SMART")
+        for strike in parsed_strikes
+    ]
+    snapshots = client.fetch_snapshot(contracts=contracts)
+
+    # fetch_snapshot returns one entry per contract, in order; pad if short.
+    missing = len(parsed_strikes) - len(snapshots)
+    if missing > 0:
+        snapshots = [*snapshots, *({"error": "timeout"} for _ in range(missing))]
+    prices: dict[float, dict[str, Any]] = dict(zip(map(float, parsed_strikes), snapshots))
+
+    return {
+        "status": "success",
+        "symbol": normalized_symbol,
+        "expiry": expiry,
+        "right": normalized_right,
+        "prices": prices,
+    }
 
 
 @mcp.tool()
+@_ibkr_tool
 def get_ibkr_snapshot(
     symbol: str,
     sec_type: str = "STK",
@@ -283,89 +352,122 @@ def get_ibkr_snapshot(
     currency: str = "USD",
 ) -> dict:
     """Snapshot latest price for any security."""
+    normalized_symbol = str(symbol or "").strip().upper()
+    normalized_sec_type = str(sec_type or "").strip().upper()
 
-    def _impl() -> dict:
-        from ib_async import Contract, Stock
-
-        from .client import IBKRClient
-
-        normalized_symbol = str(symbol or "").strip().upper()
-        normalized_sec_type = str(sec_type or "").strip().upper()
-
-        if normalized_sec_type == "STK":
-            contract = Stock(normalized_symbol, exchange, currency)
-        else:
-            contract = Contract(
-                symbol=normalized_symbol,
-                secType=normalized_sec_type,
-                exchange=exchange,
-                currency=currency,
-            )
-
-        client = IBKRClient()
-        snapshots = client.fetch_snapshot(contracts=[contract])
-        snapshot = snapshots[0] if snapshots else {"error": "timeout"}
-        if "error" in snapshot:
-            return {"status": "error", "error": snapshot["error"]}
-        return {
-            "status": "success",
-            "symbol": normalized_symbol,
-            "sec_type": normalized_sec_type,
-            "snapshot": snapshot,
-        }
+    if normalized_sec_type == "STK":
+        contract = Stock(normalized_symbol, exchange, currency)
+    else:
+        contract = Contract(
+            symbol=normalized_symbol,
+            secType=normalized_sec_type,
+            exchange=exchange,
+            currency=currency,
+        )
 
-    try:
-        return _with_stderr_stdout(_impl)
-    except Exception as exc:
-        return {"status": "error", "error": _error_str(exc)}
+    snapshots = _get_client().fetch_snapshot(contracts=[contract])
+    snapshot = snapshots[0] if snapshots else {"error": "timeout"}
+    if "error" in snapshot:
+        return {"status": "error", "error": snapshot["error"]}
+    return {
+        "status": "success",
+        "symbol": normalized_symbol,
+        "sec_type": normalized_sec_type,
+        "snapshot": snapshot,
+    }
 
 
 @mcp.tool()
+@_ibkr_tool
 def get_ibkr_status() -> dict:
     """Return IBKR Gateway connection status for diagnostics."""
+    return {"status": "success", **_get_client().get_connection_status()}
 
-    def _impl() -> dict:
-        from .client import IBKRClient
 
-        client = IBKRClient()
-        return {"status": "success", **client.get_connection_status()}
+# Held open (and flock-ed) for the life of the process; the OS drops the lock on exit.
+_pid_file_fd: int | None = None
 
-    try:
-        return _with_stderr_stdout(_impl)
-    except Exception as exc:
-        return {"status": "error", "error": _error_str(exc)}
+
+def _remove_stale_pid_files(server_dir: Path, current: Path) -> None:
+    """Delete pid files whose parent session is gone."""
+    import os
+
+    for stale in server_dir.glob(".ibkr_mcp_server_*.pid"):
+        if stale == current:
+            continue
+        try:
+            session_pid = int(stale.stem.split("_")[-1])
+            os.kill(session_pid, 0)
+        except (ValueError, ProcessLookupError):
+            stale.unlink(missing_ok=True)
+        except (PermissionError, OSError):
+            pass
 
 
 def _kill_previous_instance() -> None:
-    """Kill previous ibkr-mcp instance spawned by the same parent session."""
+    """Kill previous ibkr-mcp instance spawned by the same parent session.
+
+    On POSIX the per-session pid file is ``flock``-ed by the running server, so
+    a free lock means there is no live previous instance to kill. Stale files
+    from other sessions are swept on a background thread so startup does not
+    wait on the directory scan.
+    """
     import os
     import signal
     import tempfile
+    import time
+
+    global _pid_file_fd
 
     server_dir = Path(tempfile.gettempdir()) / "ibkr-mcp"
     server_dir.mkdir(exist_ok=True)
     ppid = os.getppid()
     pid_file = server_dir / f".ibkr_mcp_server_{ppid}.pid"
-    if pid_file.exists():
-        try:
-            old_pid = int(pid_file.read_text().strip())
-            if old_pid != os.getpid():
-                os.kill(old_pid, signal.SIGTERM)
-        except (ValueError, ProcessLookupError, PermissionError):
-            pass
 
-    pid_file.write_text(str(os.getpid()))
-
-    for stale in server_dir.glob(".ibkr_mcp_server_*.pid"):
-        if stale == pid_file:
-            continue
-        try:
-            session_pid = int(stale.stem.split("_")[-1])
-            os.kill(session_pid, 0)
-        except (ValueError, ProcessLookupError):
-            stale.unlink(missing_ok=True)
-        except PermissionError:
-            pass
+    try:
+        import fcntl
+    except ImportError:  # Windows: no flock; fall back to pid-file probing.
+        fcntl = None
+
+    if fcntl is None:
+        if pid_file.exists():
+            try:
+                old_pid = int(pid_file.read_text().strip())
+                if old_pid != os.getpid():
+                    os.kill(old_pid, signal.SIGTERM)
+            except (ValueError, ProcessLookupError, PermissionError):
+                pass
+        pid_file.write_text(str(os.getpid()))
+    else:
+        fd = os.open(pid_file, os.O_CREAT | os.O_RDWR, 0o644)
+        locked = False
+        for attempt in range(20):
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locked = True
+                break
+            except BlockingIOError:
+                pass
+            if attempt == 0:
+                try:
+                    old_pid = int(os.pread(fd, 32, 0).decode().strip())
+                    if old_pid != os.getpid():
+                        os.kill(old_pid, signal.SIGTERM)
+                except (ValueError, ProcessLookupError, PermissionError):
+                    pass
+            time.sleep(0.1)
+        if not locked:
+            logger.warning("Previous ibkr-mcp instance still holds %s; continuing", pid_file)
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, str(os.getpid()).encode(), 0)
+        _pid_file_fd = fd
+
+    threading.Thread(
+        target=_remove_stale_pid_files,
+        args=(server_dir, pid_file),
+        name="ibkr-mcp-pidfile-sweep",
+        daemon=True,
+    ).start()
 
 
 def main() -> None:
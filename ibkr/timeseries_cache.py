@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import os
 import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
@@ -22,29 +23,34 @@ class IBKRTransientError(Exception):
     """Raised when IBKR fetch fails transiently (Gateway down, entitlement)."""
 
 
-def _resolve_cache_dir() -> Path:
-    """Resolve the IBKR timeseries cache directory."""
-    ts_env = os.getenv("IBKR_TIMESERIES_CACHE_DIR")
+@lru_cache(maxsize=8)
+def _timeseries_cache_root(ts_env: str | None, ibkr_env: str | None) -> Path:
+    """Resolve and create the timeseries cache directory for given env overrides."""
     if ts_env:
         resolved = Path(ts_env).expanduser().resolve()
-        resolved.mkdir(parents=True, exist_ok=True)
-        return resolved
-
-    ibkr_env = os.getenv("IBKR_CACHE_DIR")
-    if ibkr_env:
+    elif ibkr_env:
         resolved = Path(ibkr_env).expanduser().resolve().parent / "ibkr_timeseries"
-        resolved.mkdir(parents=True, exist_ok=True)
-        return resolved
-
-    root = Path(__file__).parent.parent
-    if (root / "settings.py").is_file():
-        resolved = root / "cache" / "ibkr_timeseries"
     else:
-        resolved = Path.home() / ".cache" / "ibkr-mcp" / "ibkr_timeseries"
+        root = Path(__file__).parent.parent
+        if (root / "settings.py").is_file():
+            resolved = root / "cache" / "ibkr_timeseries"
+        else:
+            resolved = Path.home() / ".cache" / "ibkr-mcp" / "ibkr_timeseries"
     resolved.mkdir(parents=True, exist_ok=True)
     return resolved
 
 
+def _resolve_cache_dir() -> Path:
+    """Resolve the IBKR timeseries cache directory.
+
+    Resolution (including ``Path.home()``) is memoized per env-var combination.
+    """
+    return _timeseries_cache_root(
+        os.getenv("IBKR_TIMESERIES_CACHE_DIR"),
+        os.getenv("IBKR_CACHE_DIR"),
+    )
+
+
 def get_ibkr_timeseries_store(cache_dir: str | Path | None = None) -> TimeSeriesStore:
     """Get or create per-dir TimeSeriesStore singleton."""
     resolved = Path(cache_dir or _resolve_cache_dir()).expanduser().resolve()
@@ -63,6 +69,7 @@ def _reset_stores_for_tests() -> None:
     """Drop all store singletons for test isolation."""
     with _store_guard:
         _stores.clear()
+    _timeseries_cache_root.cache_clear()
 
 
 def _cache_ticker(